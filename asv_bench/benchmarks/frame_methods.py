@@ -4,7 +4,7 @@ import warnings
 import numpy as np
 import pandas.util.testing as tm
 from pandas import (DataFrame, Series, MultiIndex, date_range, period_range,
-                    isnull, NaT)
+                    isnull, NaT, set_option, reset_option)
 
 from .pandas_vb_common import setup  # noqa
 
@@ -512,3 +512,27 @@ class NSort(object):
 
     def time_nsmallest(self, keep):
         self.df.nsmallest(100, 'A', keep=keep)
+
+
+class CopyOnWrite(object):
+
+    goal_time = 0.2
+    params = [True, False]
+    param_names = ['copy_on_write']
+
+    def setup(self, copy_on_write):
+        set_option('mode.copy_on_write', copy_on_write)
+        self.df = DataFrame(np.random.randn(100000, 50))
+
+    def teardown(self, copy_on_write):
+        reset_option('mode.copy_on_write')
+
+    def time_copy(self, copy_on_write):
+        self.df.copy()
+
+    def time_copy_setitem_column(self, copy_on_write):
+        df = self.df.copy()
+        df[0] = 1.0
+
+    def time_copy_chain(self, copy_on_write):
+        self.df.copy().rename(columns=str).copy()
@@ -5,7 +5,7 @@ from functools import partial
 
 import numpy as np
 from pandas import (DataFrame, Series, MultiIndex, date_range, period_range,
-                    TimeGrouper, Categorical)
+                    TimeGrouper, Categorical, option_context)
 import pandas.util.testing as tm
 
 from .pandas_vb_common import setup  # noqa
@@ -57,6 +57,27 @@ class Apply(object):
         df.groupby('key').apply(self.df_copy_function)
 
 
+class ApplyParallel(object):
+
+    goal_time = 0.2
+    params = [[1, 2, 4], ['thread', 'process']]
+    param_names = ['n_jobs', 'backend']
+
+    def setup(self, n_jobs, backend):
+        N = 10**5
+        self.df = DataFrame({'key': np.random.randint(0, 100, size=N),
+                             'value': np.random.randn(N)})
+
+    @staticmethod
+    def rank_function(g):
+        return g.value.rank().describe()
+
+    def time_apply(self, n_jobs, backend):
+        self.df.groupby('key').apply(
+            self.rank_function,
+            engine_kwargs={'n_jobs': n_jobs, 'backend': backend})
+
+
 class Groups(object):
 
     goal_time = 0.2
@@ -138,6 +159,39 @@ class GroupManyLabels(object):
         self.df.groupby(self.labels).sum()
 
 
+class UnsortedMultiKey(object):
+
+    goal_time = 0.2
+    params = [True, False]
+    param_names = ['sort']
+
+    def setup(self, sort):
+        N = 10**6
+        self.df = DataFrame({'a': np.random.randint(0, 10**4, size=N),
+                             'b': np.random.randint(0, 10**4, size=N),
+                             'c': np.random.randint(0, 100, size=N),
+                             'values': np.random.randn(N)})
+
+    def time_sum(self, sort):
+        self.df.groupby(['a', 'b', 'c'], sort=sort).sum()
+
+
+class ThreadedAgg(object):
+
+    goal_time = 0.2
+    params = [['sum', 'mean', 'var', 'max'], [1, 2, 4]]
+    param_names = ['method', 'num_threads']
+
+    def setup(self, method, num_threads):
+        N = 10**7
+        self.df = DataFrame({'key': np.random.randint(0, 1000, size=N),
+                             'values': np.random.randn(N)})
+
+    def time_agg(self, method, num_threads):
+        with option_context('compute.groupby_threads', num_threads):
+            getattr(self.df.groupby('key'), method)()
+
+
 class Nth(object):
 
     goal_time = 0.2
@@ -224,6 +224,9 @@ class ReadCSVCategorical(BaseIO):
     def time_convert_direct(self):
         read_csv(self.fname, dtype='category')
 
+    def time_convert_intern(self):
+        read_csv(self.fname, intern_strings=True)
+
 
 class ReadCSVParseDates(object):
 
@@ -247,3 +250,23 @@ class ReadCSVParseDates(object):
     def time_baseline(self):
         read_csv(self.s_data, sep=',', header=None, parse_dates=[1],
                  names=list(string.digits[:9]))
+
+
+class ReadCSVThreads(BaseIO):
+
+    goal_time = 0.2
+    fname = '__test__.csv'
+    params = [1, 2, 4]
+    param_names = ['num_threads']
+
+    def setup(self, num_threads):
+        N = 500000
+        df = DataFrame({'float1': np.random.randn(N),
+                        'float2': np.random.randn(N),
+                        'int1': np.random.randint(0, N, size=N),
+                        'string1': np.random.choice(['foo', 'bar'], N),
+                        'bool1': np.random.randn(N) > 0})
+        df.to_csv(self.fname, index=False)
+
+    def time_read_csv(self, num_threads):
+        read_csv(self.fname, num_threads=num_threads)
@@ -1,7 +1,8 @@
 import warnings
 
 import numpy as np
-from pandas import DataFrame, Panel, date_range, HDFStore, read_hdf
+from pandas import (DataFrame, Panel, date_range, HDFStore, read_hdf,
+                    set_option, reset_option)
 import pandas.util.testing as tm
 
 from ..pandas_vb_common import BaseIO, setup  # noqa
@@ -101,6 +102,81 @@ class HDFStoreDataFrame(BaseIO):
         self.store.info()
 
 
+class HDFStoreReadThreads(BaseIO):
+
+    goal_time = 0.2
+    params = [1, 4]
+    param_names = ['read_threads']
+
+    def setup(self, read_threads):
+        N = 100000
+        self.fname = '__test__.h5'
+        df = DataFrame(np.random.randn(N, 25),
+                       columns=['float%02d' % i for i in range(25)])
+        for i in range(25):
+            df['string%02d' % i] = tm.makeStringIndex(N)
+        self.store = HDFStore(self.fname)
+        self.store.append('df', df, data_columns=True)
+        set_option('io.hdf.read_threads', read_threads)
+
+    def teardown(self, read_threads):
+        reset_option('io.hdf.read_threads')
+        self.store.close()
+        self.remove(self.fname)
+
+    def time_select(self, read_threads):
+        self.store.select('df')
+
+
+class HDFStoreAppendIndex(BaseIO):
+
+    goal_time = 0.2
+    params = [True, 'deferred']
+    param_names = ['index']
+
+    def setup(self, index):
+        N = 1000000
+        self.fname = '__test__.h5'
+        df = DataFrame({'int': np.arange(N), 'float': np.random.randn(N)})
+        self.store = HDFStore(self.fname)
+        self.store.append('df', df, data_columns=['int'])
+        self.tick = df.iloc[:60]
+
+    def teardown(self, index):
+        self.store.close()
+        self.remove(self.fname)
+
+    def time_append_small(self, index):
+        for i in range(10):
+            self.store.append('df', self.tick, index=index)
+
+
+class HDFStoreCachedQuery(BaseIO):
+
+    goal_time = 0.2
+    params = [0, 16]
+    param_names = ['coordinate_cache_size']
+
+    def setup(self, coordinate_cache_size):
+        N = 1000000
+        self.fname = '__test__.h5'
+        df = DataFrame({'int': np.arange(N), 'float': np.random.randn(N)})
+        self.store = HDFStore(self.fname)
+        self.store.append('df', df, data_columns=['int'])
+        self.value = N - 100
+        set_option('io.hdf.coordinate_cache_size', coordinate_cache_size)
+
+    def teardown(self, coordinate_cache_size):
+        reset_option('io.hdf.coordinate_cache_size')
+        self.store.close()
+        self.remove(self.fname)
+
+    def time_select_repeated(self, coordinate_cache_size):
+        value = self.value  # noqa
+        for i in range(10):
+            self.store.select('df', 'int > value', columns=['float'])
+
+
 class HDFStorePanel(BaseIO):
 
     goal_time = 0.2
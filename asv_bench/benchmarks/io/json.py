@@ -1,6 +1,7 @@
 import numpy as np
 import pandas.util.testing as tm
 from pandas import DataFrame, date_range, timedelta_range, concat, read_json
+from pandas.io.json import json_normalize
 
 from ..pandas_vb_common import setup, BaseIO  # noqa
 
@@ -125,3 +126,43 @@ class ToJSON(BaseIO):
 
     def time_float_int_str_lines(self, orient):
         self.df_int_float_str.to_json(self.fname, orient='records', lines=True)
+
+
+class ToJSONLinesChunked(BaseIO):
+
+    goal_time = 0.2
+    fname = "__test_lines__.json"
+    params = ([None, 10000], [None, 4])
+    param_names = ['chunksize', 'num_threads']
+
+    def setup(self, chunksize, num_threads):
+        N = 10**5
+        self.df = DataFrame({'int': np.random.randint(100000000, size=N),
+                             'float': np.random.randn(N),
+                             'str': tm.makeStringIndex(N),
+                             'ts': date_range(start=1, periods=N, freq='s')})
+
+    def time_to_json_lines(self, chunksize, num_threads):
+        self.df.to_json(self.fname, orient='records', lines=True,
+                        chunksize=chunksize, num_threads=num_threads)
+
+    def peakmem_to_json_lines(self, chunksize, num_threads):
+        self.df.to_json(self.fname, orient='records', lines=True,
+                        chunksize=chunksize, num_threads=num_threads)
+
+
+class JSONNormalize(object):
+
+    goal_time = 0.2
+
+    def setup(self):
+        N = 100000
+        self.data = [{'id': i,
+                      'user': {'name': 'name_{}'.format(i % 100),
+                               'address': {'city': 'city_{}'.format(i % 10),
+                                           'zip': i % 1000}},
+                      'value': float(i)}
+                     for i in range(N)]
+
+    def time_json_normalize(self):
+        json_normalize(self.data)
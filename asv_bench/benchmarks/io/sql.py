@@ -5,7 +5,7 @@ import pandas.util.testing as tm
 from pandas import DataFrame, date_range, read_sql_query, read_sql_table
 from sqlalchemy import create_engine
 
-from ..pandas_vb_common import setup  # noqa
+from ..pandas_vb_common import BaseIO, setup  # noqa
 
 
 class SQL(object):
@@ -41,6 +41,35 @@ class SQL(object):
         read_sql_query(self.query_all, self.con)
 
 
+class WriteSQLMethod(BaseIO):
+
+    goal_time = 0.2
+    params = (['sqlalchemy', 'sqlite'], [None, 'multi'])
+    param_names = ['connection', 'method']
+
+    def setup(self, connection, method):
+        N = 100000
+        self.fname = '__test__.db'
+        con = {'sqlalchemy': lambda: create_engine('sqlite:///' + self.fname),
+               'sqlite': lambda: sqlite3.connect(self.fname)}
+        self.con = con[connection]()
+        self.df = DataFrame({'float': np.random.randn(N),
+                             'int': np.random.randint(0, N, size=N),
+                             'string': ['foo'] * N})
+
+    def teardown(self, connection, method):
+        if hasattr(self.con, 'close'):
+            self.con.close()
+        else:
+            self.con.dispose()
+        self.remove(self.fname)
+
+    def time_to_sql_method(self, connection, method):
+        # keep the multi-row statements below the sqlite parameter limit
+        self.df.to_sql('test_method', self.con, if_exists='replace',
+                       index=False, chunksize=300, method=method)
+
+
 class WriteSQLDtypes(object):
 
     goal_time = 0.2
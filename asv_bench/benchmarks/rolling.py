@@ -23,6 +23,101 @@ class Methods(object):
         getattr(self.roll, method)()
 
 
+class WideMethods(object):
+
+    sample_time = 0.2
+    params = ([10, '1h'],
+              ['mean', 'std', 'sum'])
+    param_names = ['window', 'method']
+
+    def setup(self, window, method):
+        N = 10**4
+        index = pd.date_range('2000', periods=N, freq='T')
+        self.df = pd.DataFrame(np.random.random((N, 500)), index=index)
+        self.roll = self.df.rolling(window)
+
+    def time_rolling(self, window, method):
+        getattr(self.roll, method)()
+
+
+class WideAgg(object):
+
+    sample_time = 0.2
+    params = [10, '1h']
+    param_names = ['window']
+
+    def setup(self, window):
+        N = 10**4
+        index = pd.date_range('2000', periods=N, freq='T')
+        self.df = pd.DataFrame(np.random.random((N, 500)), index=index)
+        self.roll = self.df.rolling(window)
+
+    def time_rolling_agg(self, window):
+        self.roll.agg(['sum', 'mean', 'std'])
+
+
+class ThreadedMethods(object):
+
+    sample_time = 0.2
+    params = ([1, 4],
+              ['median', 'max', 'skew'])
+    param_names = ['window_threads', 'method']
+
+    def setup(self, window_threads, method):
+        N = 10**4
+        self.roll = pd.DataFrame(np.random.random((N, 100))).rolling(100)
+        pd.set_option('compute.window_threads', window_threads)
+
+    def time_rolling(self, window_threads, method):
+        getattr(self.roll, method)()
+
+    def teardown(self, window_threads, method):
+        pd.reset_option('compute.window_threads')
+
+
+class GroupbyMethods(object):
+
+    sample_time = 0.2
+    params = ([10, 10**4],
+              ['mean', 'max', 'median'])
+    param_names = ['ngroups', 'method']
+
+    def setup(self, ngroups, method):
+        N = 10**5
+        df = pd.DataFrame({'key': np.random.randint(0, ngroups, N),
+                           'A': np.random.random(N)})
+        self.roll = df.groupby('key').rolling(10)
+
+    def time_rolling(self, ngroups, method):
+        getattr(self.roll, method)()
+
+
+def _mean(x):
+    return np.sum(x) / len(x)
+
+
+class Apply(object):
+
+    sample_time = 0.2
+    params = (['DataFrame', 'Series'],
+              [10, 1000],
+              ['cython', 'numba'])
+    param_names = ['constructor', 'window', 'engine']
+
+    def setup(self, constructor, window, engine):
+        if engine == 'numba':
+            try:
+                import numba  # noqa
+            except ImportError:
+                raise NotImplementedError
+        N = 10**4
+        arr = np.random.random(N)
+        self.roll = getattr(pd, constructor)(arr).rolling(window)
+
+    def time_apply(self, constructor, window, engine):
+        self.roll.apply(_mean, engine=engine)
+
+
 class Pairwise(object):
 
     sample_time = 0.2
@@ -60,3 +155,36 @@ class Quantile(object):
 
     def time_quantile(self, constructor, window, dtype, percentile):
         self.roll.quantile(percentile)
+
+
+class Quantiles(object):
+
+    sample_time = 0.2
+    params = (['DataFrame', 'Series'],
+              [10, 1000])
+    param_names = ['constructor', 'window']
+
+    def setup(self, constructor, window):
+        N = 10**5
+        arr = np.random.random(N)
+        self.roll = getattr(pd, constructor)(arr).rolling(window)
+
+    def time_quantiles(self, constructor, window):
+        self.roll.quantile([0.05, 0.25, 0.5, 0.75, 0.95])
+
+
+class Rank(object):
+
+    sample_time = 0.2
+    params = (['DataFrame', 'Series'],
+              [10, 1000],
+              ['average', 'min', 'max'])
+    param_names = ['constructor', 'window', 'method']
+
+    def setup(self, constructor, window, method):
+        N = 10**5
+        arr = np.random.random(N)
+        self.roll = getattr(pd, constructor)(arr).rolling(window)
+
+    def time_rank(self, constructor, window, method):
+        self.roll.rank(method=method)
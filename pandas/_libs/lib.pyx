@@ -240,6 +240,71 @@ def dicts_to_array(list dicts, list columns):
     return result
 
 
+cdef _nested_key_paths(object d, tuple prefix, dict seen, list paths):
+    cdef:
+        tuple path
+
+    for key, val in d.items():
+        path = prefix + (key,)
+        if isinstance(val, dict):
+            _nested_key_paths(val, path, seen, paths)
+        elif path not in seen:
+            seen[path] = None
+            paths.append(path)
+
+
+def nested_key_paths(list dicts):
+    """
+    Return the key paths (as tuples) to the non-dict values of a list of
+    nested dicts, in the order they are first seen
+    """
+    cdef:
+        Py_ssize_t i, n
+        dict seen = {}
+        list paths = []
+
+    n = len(dicts)
+    for i in range(n):
+        _nested_key_paths(dicts[i], (), seen, paths)
+
+    return paths
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def nested_dicts_to_array(list dicts, list paths):
+    """
+    Extract the value at each key path of a list of nested dicts into a 2-D
+    object array; a path that is missing or leads to a dict is NaN
+    """
+    cdef:
+        Py_ssize_t i, j, m, k, n, depth
+        ndarray[object, ndim=2] result
+        tuple path
+        object val, onan = np.nan
+
+    k = len(paths)
+    n = len(dicts)
+
+    result = np.empty((n, k), dtype='O')
+
+    for i in range(n):
+        for j in range(k):
+            path = paths[j]
+            depth = len(path)
+            val = dicts[i]
+            for m in range(depth):
+                if not isinstance(val, dict) or path[m] not in val:
+                    val = onan
+                    break
+                val = val[path[m]]
+            if isinstance(val, dict):
+                val = onan
+            result[i, j] = val
+
+    return result
+
+
 def fast_zip(list ndarrays):
     """
     For zipping multiple ndarrays into an ndarray of tuples
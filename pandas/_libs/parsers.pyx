@@ -65,6 +65,10 @@ CParserError = ParserError
 
 cdef bint PY3 = (sys.version_info[0] >= 3)
 
+# one object per distinct string for intern_strings, shared by all readers;
+# a dict rather than the intern builtin, which only takes bytes on PY2
+_intern_table = {}
+
 cdef double INF = <double> np.inf
 cdef double NEGINF = -INF
 
@@ -245,6 +249,7 @@ cdef extern from "parser/tokenizer.h":
 
 cdef extern from "parser/io.h":
     void *new_mmap(char *fname)
+    void *new_mmap_fd(int fd, size_t position)
     int del_mmap(void *src)
     void* buffer_mmap_bytes(void *source, size_t nbytes,
                             size_t *bytes_read, int *status)
@@ -279,6 +284,7 @@ cdef class TextReader:
         object true_values, false_values
         object handle
         bint na_filter, keep_default_na, verbose, has_usecols, has_mi_columns
+        bint intern_strings
         int64_t parser_start
         list clocks
         char *c_encoding
@@ -354,7 +360,8 @@ cdef class TextReader:
                   mangle_dupe_cols=True,
                   tupleize_cols=False,
                   float_precision=None,
-                  skip_blank_lines=True):
+                  skip_blank_lines=True,
+                  intern_strings=False):
 
         # set encoding for native Python and C library
         if encoding is not None:
@@ -475,6 +482,7 @@ cdef class TextReader:
 
         self.verbose = verbose
         self.low_memory = low_memory
+        self.intern_strings = intern_strings
         self.parser.double_converter_nogil = xstrtod
         self.parser.double_converter_withgil = NULL
         if float_precision == 'high':
@@ -702,6 +710,23 @@ cdef class TextReader:
         elif hasattr(source, 'read'):
             # e.g., StringIO
 
+            ptr = NULL
+            mode = getattr(source, 'mode', None)
+            if (self.memory_map and not self.compression and
+                    isinstance(mode, basestring) and 'b' in mode):
+                # regular files opened in binary mode are mapped from their
+                # current position, bypassing the Python-level read calls
+                try:
+                    ptr = new_mmap_fd(source.fileno(), source.tell())
+                except (AttributeError, IOError, OSError, ValueError):
+                    ptr = NULL
+
+            if ptr != NULL:
+                self.parser.source = ptr
+                self.parser.cb_io = &buffer_mmap_bytes
+                self.parser.cb_cleanup = &del_mmap
+                return
+
             ptr = new_rd_source(source)
             if ptr == NULL:
                 raise IOError('Initializing parser from file-like '
@@ -1255,13 +1280,15 @@ cdef class TextReader:
 
         if path == UTF8:
             return _string_box_utf8(self.parser, i, start, end, na_filter,
-                                    na_hashset)
+                                    na_hashset, self.intern_strings)
         elif path == ENCODED:
             return _string_box_decode(self.parser, i, start, end,
-                                      na_filter, na_hashset, self.c_encoding)
+                                      na_filter, na_hashset, self.c_encoding,
+                                      self.intern_strings)
         elif path == CSTRING:
             return _string_box_factorize(self.parser, i, start, end,
-                                         na_filter, na_hashset)
+                                         na_filter, na_hashset,
+                                         self.intern_strings)
 
     def _get_converter(self, i, name):
         if self.converters is None:
@@ -1398,7 +1425,8 @@ cdef inline StringPath _string_path(char *encoding):
 
 cdef _string_box_factorize(parser_t *parser, int64_t col,
                            int64_t line_start, int64_t line_end,
-                           bint na_filter, kh_str_t *na_hashset):
+                           bint na_filter, kh_str_t *na_hashset,
+                           bint intern_strings=False):
     cdef:
         int error, na_count = 0
         Py_ssize_t i, lines
@@ -1439,6 +1467,10 @@ cdef _string_box_factorize(parser_t *parser, int64_t col,
         else:
             # box it. new ref?
             pyval = PyBytes_FromString(word)
+            if intern_strings:
+                # share one object per distinct string across chunks
+                # and columns
+                pyval = _intern_table.setdefault(pyval, pyval)
 
             k = kh_put_strbox(table, word, &ret)
             table.vals[k] = <PyObject*> pyval
@@ -1452,7 +1484,8 @@ cdef _string_box_factorize(parser_t *parser, int64_t col,
 
 cdef _string_box_utf8(parser_t *parser, int64_t col,
                       int64_t line_start, int64_t line_end,
-                      bint na_filter, kh_str_t *na_hashset):
+                      bint na_filter, kh_str_t *na_hashset,
+                      bint intern_strings=False):
     cdef:
         int error, na_count = 0
         Py_ssize_t i, lines
@@ -1493,6 +1526,10 @@ cdef _string_box_utf8(parser_t *parser, int64_t col,
         else:
             # box it. new ref?
             pyval = PyUnicode_FromString(word)
+            if intern_strings:
+                # share one object per distinct string across chunks
+                # and columns
+                pyval = _intern_table.setdefault(pyval, pyval)
 
             k = kh_put_strbox(table, word, &ret)
             table.vals[k] = <PyObject *> pyval
@@ -1507,7 +1544,7 @@ cdef _string_box_utf8(parser_t *parser, int64_t col,
 cdef _string_box_decode(parser_t *parser, int64_t col,
                         int64_t line_start, int64_t line_end,
                         bint na_filter, kh_str_t *na_hashset,
-                        char *encoding):
+                        char *encoding, bint intern_strings=False):
     cdef:
         int error, na_count = 0
         Py_ssize_t i, size, lines
@@ -1551,6 +1588,10 @@ cdef _string_box_decode(parser_t *parser, int64_t col,
             # box it. new ref?
             size = strlen(word)
             pyval = PyUnicode_Decode(word, size, encoding, errors)
+            if intern_strings:
+                # share one object per distinct string across chunks
+                # and columns
+                pyval = _intern_table.setdefault(pyval, pyval)
 
             k = kh_put_strbox(table, word, &ret)
             table.vals[k] = <PyObject *> pyval
@@ -25,6 +25,7 @@ cdef extern from "src/skiplist.h":
     skiplist_t* skiplist_init(int) nogil
     void skiplist_destroy(skiplist_t*) nogil
     double skiplist_get(skiplist_t*, int, int*) nogil
+    int skiplist_rank(skiplist_t*, double, int) nogil
     int skiplist_insert(skiplist_t*, double) nogil
     int skiplist_remove(skiplist_t*, double) nogil
 
@@ -176,45 +176,95 @@ void *buffer_rd_bytes(void *source, size_t nbytes, size_t *bytes_read,
 #ifdef HAVE_MMAP
 
 #include <sys/mman.h>
+#include <unistd.h>
 
-void *new_mmap(char *fname) {
+static void *mmap_from_fd(int fd, size_t position, int verbose) {
     memory_map *mm;
     struct stat stat;
     size_t filesize;
 
+    if (fstat(fd, &stat) == -1) {
+        if (verbose) {
+            fprintf(stderr, "new_file_buffer: fstat() failed. errno =%d\n",
+              errno);
+        }
+        return NULL;
+    }
+
+    if (!S_ISREG(stat.st_mode)) {
+        return NULL;
+    }
+    filesize = stat.st_size; /* XXX This might be 32 bits. */
+
     mm = (memory_map *)malloc(sizeof(memory_map));
     if (mm == NULL) {
         fprintf(stderr, "new_file_buffer: malloc() failed.\n");
-        return (NULL);
+        return NULL;
     }
-    mm->fd = open(fname, O_RDONLY | O_BINARY);
-    if (mm->fd == -1) {
+
+    if (filesize == 0) {
+        /* mmap() refuses empty mappings */
+        mm->memmap = NULL;
+    } else {
+        mm->memmap = mmap(NULL, filesize, PROT_READ, MAP_SHARED, fd, 0);
+        if (mm->memmap == MAP_FAILED) {
+            /* XXX Eventually remove this print statement. */
+            if (verbose) {
+                fprintf(stderr, "new_file_buffer: mmap() failed.\n");
+            }
+            free(mm);
+            return NULL;
+        }
+#ifdef MADV_SEQUENTIAL
+        /* the tokenizer walks the mapping once, front to back */
+        madvise(mm->memmap, filesize, MADV_SEQUENTIAL);
+#endif
+    }
+
+    if (position > filesize) {
+        position = filesize;
+    }
+
+    mm->fd = fd;
+    mm->size = filesize;
+    mm->position = position;
+    mm->released = 0;
+
+    return mm;
+}
+
+void *new_mmap(char *fname) {
+    memory_map *mm;
+    int fd;
+
+    fd = open(fname, O_RDONLY | O_BINARY);
+    if (fd == -1) {
         fprintf(stderr, "new_file_buffer: open(%s) failed. errno =%d\n",
           fname, errno);
-        free(mm);
         return NULL;
     }
 
-    if (fstat(mm->fd, &stat) == -1) {
-        fprintf(stderr, "new_file_buffer: fstat() failed. errno =%d\n",
-          errno);
-        close(mm->fd);
-        free(mm);
-        return NULL;
+    mm = mmap_from_fd(fd, 0, 1);
+    if (mm == NULL) {
+        close(fd);
     }
-    filesize = stat.st_size; /* XXX This might be 32 bits. */
 
-    mm->memmap = mmap(NULL, filesize, PROT_READ, MAP_SHARED, mm->fd, 0);
-    if (mm->memmap == MAP_FAILED) {
-        /* XXX Eventually remove this print statement. */
-        fprintf(stderr, "new_file_buffer: mmap() failed.\n");
-        close(mm->fd);
-        free(mm);
+    return mm;
+}
+
+void *new_mmap_fd(int fd, size_t position) {
+    memory_map *mm;
+
+    /* duplicate the descriptor, the caller keeps ownership of its own */
+    fd = dup(fd);
+    if (fd == -1) {
         return NULL;
     }
 
-    mm->size = (off_t)filesize;
-    mm->position = 0;
+    mm = mmap_from_fd(fd, position, 0);
+    if (mm == NULL) {
+        close(fd);
+    }
 
     return mm;
 }
@@ -224,7 +274,9 @@ int del_mmap(void *ptr) {
 
     if (mm == NULL) return 0;
 
-    munmap(mm->memmap, mm->size);
+    if (mm->memmap != NULL) {
+        munmap(mm->memmap, mm->size);
+    }
     close(mm->fd);
     free(mm);
 
@@ -236,6 +288,22 @@ void *buffer_mmap_bytes(void *source, size_t nbytes, size_t *bytes_read,
     void *retval;
     memory_map *src = source;
     size_t remaining = src->size - src->position;
+    size_t page_size, release_end;
+
+    /* The tokenizer only asks for more bytes once it has consumed all of
+       the previous buffer, so everything before the current position has
+       been copied into its word stream. Drop those pages, which keeps the
+       resident size proportional to the parsed output instead of the
+       file. */
+#ifdef MADV_DONTNEED
+    page_size = (size_t)sysconf(_SC_PAGESIZE);
+    release_end = src->position - src->position % page_size;
+    if (release_end > src->released) {
+        madvise(src->memmap + src->released, release_end - src->released,
+                MADV_DONTNEED);
+        src->released = release_end;
+    }
+#endif
 
     if (remaining == 0) {
         *bytes_read = 0;
@@ -264,6 +332,8 @@ void *buffer_mmap_bytes(void *source, size_t nbytes, size_t *bytes_read,
 
 void *new_mmap(char *fname) { return NULL; }
 
+void *new_mmap_fd(int fd, size_t position) { return NULL; }
+
 int del_mmap(void *src) { return 0; }
 
 /* don't use this! */
@@ -35,12 +35,17 @@ typedef struct _memory_map {
     size_t size;
 
     size_t position;
+
+    /* Bytes at the start of the mapping handed back to the kernel. */
+    size_t released;
 } memory_map;
 
 #define MM(src) ((memory_map *)src)
 
 void *new_mmap(char *fname);
 
+void *new_mmap_fd(int fd, size_t position);
+
 int del_mmap(void *src);
 
 void *buffer_mmap_bytes(void *source, size_t nbytes, size_t *bytes_read,
@@ -191,6 +191,24 @@ PANDAS_INLINE double skiplist_get(skiplist_t *skp, int i, int *ret) {
     return node->value;
 }
 
+// number of values less than value, or less than or equal to it if inclusive
+PANDAS_INLINE int skiplist_rank(skiplist_t *skp, double value, int inclusive) {
+    node_t *node, *next_at_level;
+    int level, rank = 0, min_cmp = inclusive ? 0 : 1;
+
+    node = skp->head;
+    for (level = skp->maxlevels - 1; level >= 0; --level) {
+        next_at_level = node->next[level];
+        while (_node_cmp(next_at_level, value) >= min_cmp) {
+            rank += node->width[level];
+            node = next_at_level;
+            next_at_level = node->next[level];
+        }
+    }
+
+    return rank;
+}
+
 PANDAS_INLINE int skiplist_insert(skiplist_t *skp, double value) {
     node_t *node, *prevnode, *newnode, *next_at_level;
     int *steps_at_level;
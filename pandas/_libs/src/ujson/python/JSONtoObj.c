@@ -592,6 +592,252 @@ PyObject *JSONToObj(PyObject *self, PyObject *args, PyObject *kwargs) {
     return ret;
 }
 
+// decoding of JSON objects, one per line, straight into the lists of the
+// values of their keys: the object of a line is never built, its keys and
+// values are added to the columns as they are decoded
+typedef struct __LinesContext {
+    PyObject *index;   // dict of the keys to their positions, also used as
+                       // the placeholder of the object of a line
+    PyObject *keys;    // list of the keys, in the order first seen
+    PyObject *values;  // list of the lists of the values of the keys
+    PyObject *nan;     // the value of a key missing from a line
+    Py_ssize_t nrows;  // the number of lines decoded
+    int depth;         // the depth of the objects and arrays decoded
+} LinesContext;
+
+static int Lines_padColumn(LinesContext *ctx, PyObject *column,
+                           Py_ssize_t nrows) {
+    while (PyList_GET_SIZE(column) < nrows) {
+        if (PyList_Append(column, ctx->nan)) {
+            return 0;
+        }
+    }
+    return 1;
+}
+
+static int Lines_isBlank(const char *buffer, Py_ssize_t len) {
+    Py_ssize_t i;
+    for (i = 0; i < len; i++) {
+        switch (buffer[i]) {
+            case ' ':
+            case '\t':
+            case '\r':
+            case '\n':
+                break;
+            default:
+                return 0;
+        }
+    }
+    return 1;
+}
+
+JSOBJ Object_linesNewObject(void *prv, void *decoder) {
+    LinesContext *ctx = (LinesContext *)prv;
+    if (ctx->depth++ == 0) {
+        return ctx->index;
+    }
+    return PyDict_New();
+}
+
+JSOBJ Object_linesEndObject(void *prv, JSOBJ obj) {
+    LinesContext *ctx = (LinesContext *)prv;
+    ctx->depth--;
+    if (obj == ctx->index) {
+        ctx->nrows++;
+    }
+    return obj;
+}
+
+JSOBJ Object_linesNewArray(void *prv, void *decoder) {
+    ((LinesContext *)prv)->depth++;
+    return PyList_New(0);
+}
+
+JSOBJ Object_linesEndArray(void *prv, JSOBJ obj) {
+    ((LinesContext *)prv)->depth--;
+    return obj;
+}
+
+int Object_linesObjectAddKey(void *prv, JSOBJ obj, JSOBJ name, JSOBJ value) {
+    LinesContext *ctx = (LinesContext *)prv;
+    PyObject *position, *column;
+    Py_ssize_t i;
+    int ret = 0;
+
+    if (obj != ctx->index) {
+        return Object_objectAddKey(prv, obj, name, value);
+    }
+
+    position = PyDict_GetItem(ctx->index, (PyObject *)name);
+    if (position == NULL) {
+        // a new key, missing from all the lines before
+        i = PyList_GET_SIZE(ctx->keys);
+        column = PyList_New(0);
+        if (column == NULL) {
+            goto done;
+        }
+        if (!Lines_padColumn(ctx, column, ctx->nrows) ||
+            PyList_Append(ctx->values, column)) {
+            Py_DECREF(column);
+            goto done;
+        }
+        Py_DECREF(column);
+
+        position = PyInt_FromSsize_t(i);
+        if (position == NULL) {
+            goto done;
+        }
+        if (PyList_Append(ctx->keys, (PyObject *)name) ||
+            PyDict_SetItem(ctx->index, (PyObject *)name, position)) {
+            Py_DECREF(position);
+            goto done;
+        }
+        Py_DECREF(position);
+    } else {
+        i = PyInt_AS_LONG(position);
+    }
+
+    column = PyList_GET_ITEM(ctx->values, i);
+    if (PyList_GET_SIZE(column) > ctx->nrows) {
+        // the key is repeated in the object, the last value wins
+        Py_INCREF((PyObject *)value);
+        ret = PyList_SetItem(column, ctx->nrows, (PyObject *)value) == 0;
+    } else {
+        ret = Lines_padColumn(ctx, column, ctx->nrows) &&
+              PyList_Append(column, (PyObject *)value) == 0;
+    }
+
+done:
+    Py_DECREF((PyObject *)name);
+    Py_DECREF((PyObject *)value);
+    return ret;
+}
+
+static void Object_linesReleaseObject(void *prv, JSOBJ obj, void *decoder) {
+    if (obj != ((LinesContext *)prv)->index) {
+        Py_XDECREF(((PyObject *)obj));
+    }
+}
+
+static char *g_lines_kwlist[] = {"lines", "precise_float", NULL};
+
+PyObject *JSONLinesToColumns(PyObject *self, PyObject *args,
+                             PyObject *kwargs) {
+    PyObject *ret = NULL;
+    PyObject *lines;
+    PyObject *line;
+    PyObject *sarg;
+    PyObject *iter = NULL;
+    PyObject *opreciseFloat = NULL;
+    LinesContext ctx;
+    JSOBJ row;
+    Py_ssize_t i;
+
+    JSONObjectDecoder dec = {
+        Object_newString,       Object_linesObjectAddKey,
+        Object_arrayAddItem,    Object_newTrue,
+        Object_newFalse,        Object_newNull,
+        Object_linesNewObject,  Object_linesEndObject,
+        Object_linesNewArray,   Object_linesEndArray,
+        Object_newInteger,      Object_newLong,
+        Object_newDouble,       Object_linesReleaseObject,
+        PyObject_Malloc,        PyObject_Free,
+        PyObject_Realloc};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|O", g_lines_kwlist,
+                                     &lines, &opreciseFloat)) {
+        return NULL;
+    }
+
+    dec.preciseFloat = 0;
+    if (opreciseFloat && PyObject_IsTrue(opreciseFloat)) {
+        dec.preciseFloat = 1;
+    }
+    dec.prv = &ctx;
+
+    ctx.index = PyDict_New();
+    ctx.keys = PyList_New(0);
+    ctx.values = PyList_New(0);
+    ctx.nan = PyFloat_FromDouble(Py_NAN);
+    ctx.nrows = 0;
+    if (!ctx.index || !ctx.keys || !ctx.values || !ctx.nan) {
+        goto done;
+    }
+
+    iter = PyObject_GetIter(lines);
+    if (iter == NULL) {
+        goto done;
+    }
+
+    while ((line = PyIter_Next(iter)) != NULL) {
+        if (PyUnicode_Check(line)) {
+            sarg = PyUnicode_AsUTF8String(line);
+            Py_DECREF(line);
+            if (sarg == NULL) {
+                goto done;
+            }
+        } else if (PyString_Check(line)) {
+            sarg = line;
+        } else {
+            Py_DECREF(line);
+            PyErr_Format(PyExc_TypeError, "Expected String or Unicode");
+            goto done;
+        }
+
+        if (Lines_isBlank(PyString_AS_STRING(sarg),
+                          PyString_GET_SIZE(sarg))) {
+            Py_DECREF(sarg);
+            continue;
+        }
+
+        ctx.depth = 0;
+        dec.errorStr = NULL;
+        dec.errorOffset = NULL;
+
+        row = JSON_DecodeObject(&dec, PyString_AS_STRING(sarg),
+                                PyString_GET_SIZE(sarg));
+        Py_DECREF(sarg);
+
+        if (PyErr_Occurred() || dec.errorStr) {
+            if (row) {
+                Object_linesReleaseObject(&ctx, row, &dec);
+            }
+            if (!PyErr_Occurred()) {
+                PyErr_Format(PyExc_ValueError, "%s", dec.errorStr);
+            }
+            goto done;
+        }
+
+        if (row != ctx.index) {
+            Py_XDECREF((PyObject *)row);
+            PyErr_Format(PyExc_TypeError, "Expected an object per line");
+            goto done;
+        }
+    }
+
+    if (PyErr_Occurred()) {
+        goto done;
+    }
+
+    // fill the keys missing from the last lines
+    for (i = 0; i < PyList_GET_SIZE(ctx.values); i++) {
+        if (!Lines_padColumn(&ctx, PyList_GET_ITEM(ctx.values, i),
+                             ctx.nrows)) {
+            goto done;
+        }
+    }
+
+    ret = Py_BuildValue("OOn", ctx.keys, ctx.values, ctx.nrows);
+
+done:
+    Py_XDECREF(iter);
+    Py_XDECREF(ctx.index);
+    Py_XDECREF(ctx.keys);
+    Py_XDECREF(ctx.values);
+    Py_XDECREF(ctx.nan);
+    return ret;
+}
+
 PyObject *JSONFileToObj(PyObject *self, PyObject *args, PyObject *kwargs) {
     PyObject *read;
     PyObject *string;
@@ -45,6 +45,10 @@ void initObjToJSON(void);
 /* JSONToObj */
 PyObject *JSONToObj(PyObject *self, PyObject *args, PyObject *kwargs);
 
+/* JSONLinesToColumns */
+PyObject *JSONLinesToColumns(PyObject *self, PyObject *args,
+                             PyObject *kwargs);
+
 /* objToJSONFile */
 PyObject *objToJSONFile(PyObject *self, PyObject *args, PyObject *kwargs);
 
@@ -67,6 +71,11 @@ static PyMethodDef ujsonMethods[] = {
     {"loads", (PyCFunction)JSONToObj, METH_VARARGS | METH_KEYWORDS,
      "Converts JSON as string to dict object structure. Use precise_float=True "
      "to use high precision float decoder."},
+    {"loads_lines", (PyCFunction)JSONLinesToColumns,
+     METH_VARARGS | METH_KEYWORDS,
+     "Converts JSON objects, one per string, into the list of their keys, the "
+     "list of the lists of the values of each key and the number of objects. "
+     "Use precise_float=True to use high precision float decoder."},
     {"dump", (PyCFunction)objToJSONFile, METH_VARARGS | METH_KEYWORDS,
      "Converts arbitrary object recursively into JSON "
      "file. " ENCODER_HELP_TEXT},
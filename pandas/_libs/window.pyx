@@ -19,10 +19,10 @@ cdef extern from "../src/headers/math.h":
 cimport util
 from util cimport numeric
 
-from skiplist cimport (IndexableSkiplist,
-                       node_t, skiplist_t,
+from skiplist cimport (node_t, skiplist_t,
                        skiplist_init, skiplist_destroy,
-                       skiplist_get, skiplist_insert, skiplist_remove)
+                       skiplist_get, skiplist_rank,
+                       skiplist_insert, skiplist_remove)
 
 cdef cnp.float32_t MINfloat32 = np.NINF
 cdef cnp.float64_t MINfloat64 = np.NINF
@@ -292,6 +292,96 @@ cdef class VariableWindowIndexer(WindowIndexer):
                     end[i] -= 1
 
 
+cdef class GroupedWindowIndexer(WindowIndexer):
+    """
+    create a window indexer for rows sorted by group, whose
+    windows do not reach across the bounds of their group;
+    passed as the index of the rolling functions, it rolls
+    all of the groups in a single pass
+
+    Parameters
+    ----------
+    ids: ndarray
+        sorted group ids of the rows
+    win: int64_t
+        window size, in rows if index is None
+    minp: int64_t
+        min number of obs in a window to consider non-NaN
+    index: ndarray, optional
+        index of the rows, monotonic within each group, for
+        windows spanning an offset
+    closed: string, default None
+        {'right', 'left', 'both', 'neither'}
+        window endpoint closedness, as in get_window_indexer
+    """
+    def __init__(self, ndarray[int64_t] ids, int64_t win, int64_t minp,
+                 object index=None, object closed=None):
+
+        cdef:
+            ndarray[int64_t] start, end
+            Py_ssize_t i, first = 0
+            bint left_closed, right_closed
+
+        if closed is None:
+            closed = 'right' if index is not None else 'both'
+        left_closed = closed in ['left', 'both']
+        right_closed = closed in ['right', 'both']
+
+        self.is_variable = 1
+        self.N = len(ids)
+        self.minp = _check_minp(win, minp, self.N, floor=0)
+
+        self.start = np.empty(self.N, dtype='int64')
+        self.end = np.empty(self.N, dtype='int64')
+
+        if index is None:
+
+            start = self.start
+            end = self.end
+            with nogil:
+                for i in range(self.N):
+                    if i and ids[i] != ids[i - 1]:
+                        first = i
+                    start[i] = max(i - win + 1, first)
+                    end[i] = i + 1
+
+        else:
+            self.build(ids, index, win, left_closed, right_closed)
+
+        # max window size
+        self.win = max((self.end - self.start).max(), 1) if self.N else 1
+
+    def build(self, ndarray[int64_t] ids, ndarray[int64_t] index,
+              int64_t win, bint left_closed, bint right_closed):
+
+        cdef:
+            ndarray[int64_t] start, end
+            int64_t start_bound
+            Py_ssize_t i, j
+
+        start = self.start
+        end = self.end
+
+        with nogil:
+
+            for i in range(self.N):
+                start[i] = i
+
+                # the first row of a group starts its window, otherwise
+                # advance the start bound until we are within the
+                # constraint
+                if i and ids[i] == ids[i - 1]:
+                    start_bound = index[i] - win
+                    if left_closed:
+                        start_bound -= 1
+                    for j in range(start[i - 1], i):
+                        if index[j] > start_bound:
+                            start[i] = j
+                            break
+
+                end[i] = i + 1 if right_closed else i
+
+
 def get_window_indexer(input, win, minp, index, closed,
                        floor=None, use_mock=True):
     """
@@ -327,6 +417,13 @@ def get_window_indexer(input, win, minp, index, closed,
         bint left_closed = False
         bint right_closed = False
 
+    if isinstance(index, WindowIndexer):
+        # bounds computed beforehand, such as those of a
+        # GroupedWindowIndexer; it holds the minimum periods
+        start, end, N, win, minp, is_variable = index.get_data()
+        return (start, end, N, win, max(minp, 1 if floor is None else floor),
+                is_variable)
+
     assert closed is None or closed in ['right', 'left', 'both', 'neither']
 
     # if windows is variable, default is 'right', otherwise default is 'both'
@@ -781,6 +878,290 @@ def roll_var(ndarray[double_t] input, int64_t win, int64_t minp,
     return output
 
 
+# ----------------------------------------------------------------------
+# Rolling sum, mean and variance of all columns of a 2-D array
+
+
+cdef inline void add_moments(double val, int64_t *nobs, double *sum_x,
+                             int64_t *neg_ct, bint want_sum,
+                             bint want_mean) nogil:
+    """ add a value to the shared running sum of the sum and mean calc """
+
+    if want_sum or want_mean:
+        add_sum(val, nobs, sum_x)
+        if want_mean and val == val and signbit(val):
+            neg_ct[0] = neg_ct[0] + 1
+
+
+cdef inline void remove_moments(double val, int64_t *nobs, double *sum_x,
+                                int64_t *neg_ct, bint want_sum,
+                                bint want_mean) nogil:
+    """ remove a value from the shared running sum of the sum and mean
+    calc """
+
+    if want_sum or want_mean:
+        remove_sum(val, nobs, sum_x)
+        if want_mean and val == val and signbit(val):
+            neg_ct[0] = neg_ct[0] - 1
+
+
+cdef class MomentsState:
+    """
+    The running sums of the rolling sum, mean and variance of the columns of
+    a 2-D array over the rows seen so far, which roll_moments_online updates
+    with new rows
+    """
+
+    cdef public:
+        ndarray nobs, neg_ct, sum_x, var_nobs, mean_x, ssqdm_x
+        int64_t nrows
+
+    def __init__(self, Py_ssize_t ncols):
+        self.nobs = np.zeros(ncols, dtype=np.int64)
+        self.neg_ct = np.zeros(ncols, dtype=np.int64)
+        self.sum_x = np.zeros(ncols, dtype=np.float64)
+        self.var_nobs = np.zeros(ncols, dtype=np.float64)
+        self.mean_x = np.zeros(ncols, dtype=np.float64)
+        self.ssqdm_x = np.zeros(ncols, dtype=np.float64)
+        self.nrows = 0
+
+
+cdef _roll_moments_fixed(ndarray[double_t, ndim=2] input,
+                         ndarray[double_t, ndim=2] removed, Py_ssize_t lag,
+                         MomentsState state, int64_t win, int64_t minp_sum,
+                         int64_t minp_mean, bint want_sum, bint want_mean,
+                         bint want_var, int ddof,
+                         ndarray[double_t, ndim=2] out_sum,
+                         ndarray[double_t, ndim=2] out_mean,
+                         ndarray[double_t, ndim=2] out_var):
+    """
+    Roll a fixed window over the rows of ``input``, following the rows of
+    ``state``. Once the window is full, row i of ``input`` removes row
+    i - lag of ``removed`` from it.
+    """
+    cdef:
+        double val, prev, delta, mean_x_old, dnobs
+        int64_t offset
+        Py_ssize_t i, k, N, K
+        ndarray[int64_t] nobs, neg_ct
+        ndarray[double_t] sum_x, var_nobs, mean_x, ssqdm_x
+
+    N = input.shape[0]
+    K = input.shape[1]
+    nobs = state.nobs
+    neg_ct = state.neg_ct
+    sum_x = state.sum_x
+    var_nobs = state.var_nobs
+    mean_x = state.mean_x
+    ssqdm_x = state.ssqdm_x
+
+    # the position of row i of input in all of the rows
+    offset = state.nrows
+
+    with nogil:
+
+        for i in range(N):
+            for k in range(K):
+                val = input[i, k]
+                add_moments(val, &nobs[k], &sum_x[k], &neg_ct[k],
+                            want_sum, want_mean)
+
+                if i + offset > win - 1:
+                    prev = removed[i - lag, k]
+                    remove_moments(prev, &nobs[k], &sum_x[k], &neg_ct[k],
+                                   want_sum, want_mean)
+
+                if want_var:
+                    # Over the first window, observations can only be
+                    # added, after it they can both be added and removed
+                    if i + offset < win:
+                        add_var(val, &var_nobs[k], &mean_x[k], &ssqdm_x[k])
+                    elif val == val:
+                        if prev == prev:
+
+                            # Adding one observation and removing another one
+                            delta = val - prev
+                            mean_x_old = mean_x[k]
+                            dnobs = var_nobs[k]
+
+                            mean_x[k] += delta / dnobs
+                            ssqdm_x[k] += ((dnobs - 1) * val
+                                           + (dnobs + 1) * prev
+                                           - 2 * dnobs * mean_x_old
+                                           ) * delta / dnobs
+
+                        else:
+                            add_var(val, &var_nobs[k], &mean_x[k],
+                                    &ssqdm_x[k])
+                    elif prev == prev:
+                        remove_var(prev, &var_nobs[k], &mean_x[k],
+                                   &ssqdm_x[k])
+
+                if want_sum:
+                    out_sum[i, k] = calc_sum(minp_sum, nobs[k], sum_x[k])
+                if want_mean:
+                    out_mean[i, k] = calc_mean(minp_mean, nobs[k],
+                                               neg_ct[k], sum_x[k])
+                if want_var:
+                    out_var[i, k] = calc_var(minp_mean, ddof, var_nobs[k],
+                                             ssqdm_x[k])
+
+    state.nrows += N
+
+
+def roll_moments_2d(ndarray[double_t, ndim=2] input, int64_t win,
+                    int64_t minp, object index, object closed,
+                    bint want_sum, bint want_mean, bint want_var,
+                    int ddof=1):
+    """
+    Rolling sum, mean and variance of each column of ``input``, computed in
+    a single pass over the rows. The window bounds are computed once for
+    all columns, and the sum and mean share their running sums; the results
+    are the same as those of roll_sum, roll_mean and roll_var on each
+    column.
+
+    Returns
+    -------
+    tuple of the 2-D sum, mean and variance, None for those not wanted
+    """
+    cdef:
+        double val
+        int64_t s, e, minp_sum, minp_mean
+        bint is_variable, fresh
+        Py_ssize_t i, j, k, N, K
+        MomentsState state
+        ndarray[int64_t] start, end, nobs, neg_ct
+        ndarray[double_t] sum_x, var_nobs, mean_x, ssqdm_x
+        ndarray[double_t, ndim=2] out_sum, out_mean, out_var
+
+    start, end, N, win, minp_sum, is_variable = get_window_indexer(
+        input, win, minp, index, closed, floor=0)
+    minp_mean = max(minp_sum, 1)
+    K = input.shape[1]
+
+    state = MomentsState(K)
+
+    # unwanted outputs are never written to
+    out_sum = np.empty((N if want_sum else 0, K), dtype=np.float64)
+    out_mean = np.empty((N if want_mean else 0, K), dtype=np.float64)
+    out_var = np.empty((N if want_var else 0, K), dtype=np.float64)
+
+    if is_variable:
+
+        nobs = state.nobs
+        neg_ct = state.neg_ct
+        sum_x = state.sum_x
+        var_nobs = state.var_nobs
+        mean_x = state.mean_x
+        ssqdm_x = state.ssqdm_x
+
+        with nogil:
+
+            for i in range(0, N):
+                s = start[i]
+                e = end[i]
+
+                # a window that does not overlap the previous one, such as
+                # the first window of a group, starts from empty sums
+                fresh = i == 0 or s >= end[i - 1]
+                if fresh:
+
+                    for k in range(K):
+                        nobs[k] = 0
+                        neg_ct[k] = 0
+                        sum_x[k] = 0
+                        var_nobs[k] = 0
+                        mean_x[k] = 0
+                        ssqdm_x[k] = 0
+
+                else:
+
+                    # calculate deletes
+                    for j in range(start[i - 1], s):
+                        for k in range(K):
+                            remove_moments(input[j, k], &nobs[k], &sum_x[k],
+                                           &neg_ct[k], want_sum, want_mean)
+
+                    s = end[i - 1]
+
+                # calculate adds
+                for j in range(s, e):
+                    for k in range(K):
+                        val = input[j, k]
+                        add_moments(val, &nobs[k], &sum_x[k], &neg_ct[k],
+                                    want_sum, want_mean)
+                        if want_var:
+                            add_var(val, &var_nobs[k], &mean_x[k],
+                                    &ssqdm_x[k])
+
+                # the variance adds before it deletes
+                if want_var and not fresh:
+                    for j in range(start[i - 1], start[i]):
+                        for k in range(K):
+                            remove_var(input[j, k], &var_nobs[k], &mean_x[k],
+                                       &ssqdm_x[k])
+
+                for k in range(K):
+                    if want_sum:
+                        out_sum[i, k] = calc_sum(minp_sum, nobs[k], sum_x[k])
+                    if want_mean:
+                        out_mean[i, k] = calc_mean(minp_mean, nobs[k],
+                                                   neg_ct[k], sum_x[k])
+                    if want_var:
+                        out_var[i, k] = calc_var(minp_mean, ddof,
+                                                 var_nobs[k], ssqdm_x[k])
+
+    else:
+        _roll_moments_fixed(input, input, win, state, win, minp_sum,
+                            minp_mean, want_sum, want_mean, want_var, ddof,
+                            out_sum, out_mean, out_var)
+
+    return (out_sum if want_sum else None,
+            out_mean if want_mean else None,
+            out_var if want_var else None)
+
+
+def roll_moments_online(ndarray[double_t, ndim=2] input,
+                        ndarray[double_t, ndim=2] removed,
+                        MomentsState state, int64_t win, int64_t minp,
+                        bint want_sum, bint want_mean, bint want_var,
+                        int ddof=1):
+    """
+    Update ``state`` with the new rows ``input`` over a fixed window. Row i
+    of ``removed`` is the row that row i of ``input`` removes from the
+    window, only read once the window is full. The results for the new
+    rows are the same as those of roll_moments_2d on all of the rows.
+
+    Returns
+    -------
+    tuple of the 2-D sum, mean and variance of the new rows, None for those
+    not wanted
+    """
+    cdef:
+        Py_ssize_t N, K
+        ndarray[double_t, ndim=2] out_sum, out_mean, out_var
+
+    N = input.shape[0]
+    K = input.shape[1]
+
+    if len(removed) != N or removed.shape[1] != K:
+        raise ValueError("the removed rows must have the shape of the new "
+                         "rows")
+
+    # unwanted outputs are never written to
+    out_sum = np.empty((N if want_sum else 0, K), dtype=np.float64)
+    out_mean = np.empty((N if want_mean else 0, K), dtype=np.float64)
+    out_var = np.empty((N if want_var else 0, K), dtype=np.float64)
+
+    _roll_moments_fixed(input, removed, 0, state, win, max(minp, 0),
+                        max(minp, 1), want_sum, want_mean, want_var, ddof,
+                        out_sum, out_mean, out_var)
+
+    return (out_sum if want_sum else None,
+            out_mean if want_mean else None,
+            out_var if want_var else None)
+
+
 # ----------------------------------------------------------------------
 # Rolling skewness
 
@@ -868,9 +1249,12 @@ def roll_skew(ndarray[double_t] input, int64_t win, int64_t minp,
                 e = end[i]
 
                 # Over the first window, observations can only be added
-                # never removed
-                if i == 0:
+                # never removed; so over a window that does not overlap the
+                # previous one, such as the first window of a group
+                if i == 0 or s >= end[i - 1]:
 
+                    nobs = 0
+                    x = xx = xxx = 0
                     for j in range(s, e):
                         val = input[j]
                         add_skew(val, &nobs, &x, &xx, &xxx)
@@ -1005,9 +1389,12 @@ def roll_kurt(ndarray[double_t] input, int64_t win, int64_t minp,
                 e = end[i]
 
                 # Over the first window, observations can only be added
-                # never removed
-                if i == 0:
+                # never removed; so over a window that does not overlap the
+                # previous one, such as the first window of a group
+                if i == 0 or s >= end[i - 1]:
 
+                    nobs = 0
+                    x = xx = xxx = xxxx = 0
                     for j in range(s, e):
                         add_kurt(input[j], &nobs, &x, &xx, &xxx, &xxxx)
 
@@ -1125,6 +1512,101 @@ def roll_median_c(ndarray[float64_t] input, int64_t win, int64_t minp,
         raise MemoryError("skiplist_insert failed")
     return output
 
+
+cdef class MedianState:
+    """
+    The skiplist of the rolling median over the rows seen so far, which
+    roll_median_online updates with new rows
+    """
+
+    cdef:
+        skiplist_t *sl
+
+    cdef public:
+        int64_t nobs, nrows
+
+    def __cinit__(self, int expected_size):
+        self.sl = skiplist_init(expected_size)
+        if self.sl == NULL:
+            raise MemoryError("skiplist_init failed")
+        self.nobs = 0
+        self.nrows = 0
+
+    def __dealloc__(self):
+        if self.sl != NULL:
+            skiplist_destroy(self.sl)
+
+
+def roll_median_online(ndarray[float64_t] input, ndarray[float64_t] removed,
+                       MedianState state, int64_t win, int64_t minp):
+    """
+    Update ``state`` with the new values ``input`` over a fixed window,
+    returning their rolling median. Value i of ``removed`` is the value
+    that value i of ``input`` removes from the window, only read once the
+    window is full. The medians are the same as those of roll_median_c on
+    all of the values.
+    """
+    cdef:
+        double val, res
+        bint err = 0
+        int ret = 0
+        skiplist_t *sl
+        Py_ssize_t i
+        int64_t nobs, offset, N
+        int midpoint
+        ndarray[double_t] output
+
+    N = len(input)
+
+    if len(removed) != N:
+        raise ValueError("the removed values must have the length of the "
+                         "new values")
+    output = np.empty(N, dtype=float)
+
+    minp = max(minp, 1)
+    sl = state.sl
+    nobs = state.nobs
+
+    # the position of value i of input in all of the values
+    offset = state.nrows
+
+    with nogil:
+
+        for i in range(N):
+
+            # calculate deletes
+            if i + offset > win - 1:
+                val = removed[i]
+                if val == val:
+                    skiplist_remove(sl, val)
+                    nobs -= 1
+
+            # calculate adds
+            val = input[i]
+            if val == val:
+                nobs += 1
+                err = skiplist_insert(sl, val) != 1
+                if err:
+                    break
+
+            if nobs >= minp:
+                midpoint = <int>(nobs / 2)
+                if nobs % 2:
+                    res = skiplist_get(sl, midpoint, &ret)
+                else:
+                    res = (skiplist_get(sl, midpoint, &ret) +
+                           skiplist_get(sl, (midpoint - 1), &ret)) / 2
+            else:
+                res = NaN
+
+            output[i] = res
+
+    state.nobs = nobs
+    state.nrows += N
+    if err:
+        raise MemoryError("skiplist_insert failed")
+    return output
+
 # ----------------------------------------------------------------------
 
 # Moving maximum / minimum code taken from Bottleneck under the terms
@@ -1222,10 +1704,10 @@ cdef _roll_min_max(ndarray[numeric] input, int64_t win, int64_t minp,
     cdef:
         numeric ai
         bint is_variable, should_replace
-        int64_t s, e, N, i, j, removed
+        int64_t s, e, N, i, k, removed, head, tail
         Py_ssize_t nobs = 0
-        ndarray[int64_t] starti, endi
-        ndarray[numeric, ndim=1] output
+        ndarray[int64_t] starti, endi, deque
+        ndarray[numeric, ndim=1] output, values
     cdef:
         int64_t* death
         numeric* ring
@@ -1233,9 +1715,6 @@ cdef _roll_min_max(ndarray[numeric] input, int64_t win, int64_t minp,
         numeric* end
         numeric* last
 
-    cdef:
-        cdef numeric r
-
     starti, endi, N, win, minp, is_variable = get_window_indexer(
         input, win,
         minp, index, closed)
@@ -1244,27 +1723,55 @@ cdef _roll_min_max(ndarray[numeric] input, int64_t win, int64_t minp,
 
     if is_variable:
 
+        # the window bounds only move forward, so the candidates for the
+        # extremum are kept in a deque of offsets whose values decrease
+        # (increase for the min), from which each offset is popped once
+        deque = np.empty(N, dtype=np.int64)
+        values = np.empty(N, dtype=input.dtype)
+        head = tail = 0
+        k = 0
+        removed = 0
+
         with nogil:
 
             for i in range(N):
                 s = starti[i]
                 e = endi[i]
 
-                r = input[s]
-                nobs = 0
-                for j in range(s, e):
-
-                    # adds, death at the i offset
-                    ai = init_mm(input[j], &nobs, is_max)
-
-                    if is_max:
-                        if ai > r:
-                            r = ai
-                    else:
-                        if ai < r:
-                            r = ai
-
-                output[i] = calc_mm(minp, nobs, r)
+                # values before the start of the window leave it; those
+                # skipped over were never added
+                while removed < s:
+                    if removed < k:
+                        remove_mm(input[removed], &nobs)
+                    removed += 1
+                if k < s:
+                    k = s
+
+                # adds, dropping the candidates the new value supersedes
+                while k < e:
+                    ai = init_mm(input[k], &nobs, is_max)
+                    while tail > head:
+                        if is_max:
+                            should_replace = values[tail - 1] <= ai
+                        else:
+                            should_replace = values[tail - 1] >= ai
+                        if not should_replace:
+                            break
+                        tail -= 1
+                    deque[tail] = k
+                    values[tail] = ai
+                    tail += 1
+                    k += 1
+
+                while tail > head and deque[head] < s:
+                    head += 1
+
+                if tail > head:
+                    output[i] = calc_mm(minp, nobs, values[head])
+                elif numeric in cython.floating:
+                    output[i] = NaN
+                else:
+                    output[i] = 0
 
     else:
 
@@ -1345,18 +1852,144 @@ def roll_quantile(ndarray[float64_t, cast=True] input, int64_t win,
     """
     O(N log(window)) implementation using skip list
     """
+    if quantile <= 0.0 or quantile >= 1.0:
+        raise ValueError("quantile value {0} not in [0, 1]".format(quantile))
+
+    return roll_quantiles(input, win, minp, index, closed,
+                          np.array([quantile]))[:, 0]
+
+
+def roll_quantiles(ndarray[float64_t, cast=True] input, int64_t win,
+                   int64_t minp, object index, object closed,
+                   ndarray[double_t] quantiles):
+    """
+    O(N (log(window) + len(quantiles) log(window))) implementation, all of
+    the quantiles being read from one skip list
+
+    Returns
+    -------
+    2-D ndarray of the rolling quantiles, one column per quantile
+    """
+    cdef:
+        double val, res, vlow, vhigh, quantile
+        bint err = 0, is_variable
+        int ret = 0, idx
+        skiplist_t *sl
+        int64_t nobs = 0, i, j, k, s, e, N, K
+        ndarray[int64_t] start, end
+        ndarray[double_t, ndim=2] output
+
+    K = len(quantiles)
+    for k in range(K):
+        if not 0.0 <= quantiles[k] <= 1.0:
+            raise ValueError("quantile value {0} not in [0, 1]"
+                             "".format(quantiles[k]))
+
+    # we use the Fixed/Variable Indexer here as the
+    # actual skiplist ops outweigh any window computation costs
+    start, end, N, win, minp, is_variable = get_window_indexer(
+        input, win,
+        minp, index, closed,
+        use_mock=False)
+    output = np.empty((N, K), dtype=float)
+
+    sl = skiplist_init(<int>win)
+    if sl == NULL:
+        raise MemoryError("skiplist_init failed")
+
+    with nogil:
+
+        for i in range(0, N):
+            s = start[i]
+            e = end[i]
+
+            if i == 0:
+
+                # setup
+                val = input[i]
+                if val == val:
+                    nobs += 1
+                    err = skiplist_insert(sl, val) != 1
+                    if err:
+                        break
+
+            else:
+
+                # calculate deletes
+                for j in range(start[i - 1], s):
+                    val = input[j]
+                    if val == val:
+                        skiplist_remove(sl, val)
+                        nobs -= 1
+
+                # calculate adds
+                for j in range(end[i - 1], e):
+                    val = input[j]
+                    if val == val:
+                        nobs += 1
+                        err = skiplist_insert(sl, val) != 1
+                        if err:
+                            break
+
+            for k in range(K):
+                quantile = quantiles[k]
+                if nobs >= minp:
+                    idx = <int>(quantile * <double>(nobs - 1))
+
+                    # Single value in skip list, or the maximum
+                    if nobs == 1 or idx == nobs - 1:
+                        res = skiplist_get(sl, idx, &ret)
+
+                    # the minimum
+                    elif quantile == 0.0:
+                        res = skiplist_get(sl, 0, &ret)
+
+                    # Interpolated quantile
+                    else:
+                        vlow = skiplist_get(sl, idx, &ret)
+                        vhigh = skiplist_get(sl, idx + 1, &ret)
+                        res = ((vlow + (vhigh - vlow) *
+                                (quantile * (nobs - 1) - idx)))
+                else:
+                    res = NaN
+
+                output[i, k] = res
+
+    skiplist_destroy(sl)
+    if err:
+        raise MemoryError("skiplist_insert failed")
+    return output
+
+
+def roll_rank(ndarray[float64_t, cast=True] input, int64_t win, int64_t minp,
+              object index, object closed, object method, bint ascending,
+              bint percentile):
+    """
+    O(N log(window)) rank of each value among the values of its window,
+    using skip list
+
+    Parameters
+    ----------
+    method : {'average', 'min', 'max'}
+        the rank of tied values
+    ascending : boolean
+    percentile : boolean
+        divide the ranks by the number of observations in the window
+    """
     cdef:
-        double val, prev, midpoint
-        IndexableSkiplist skiplist
+        double val, res
+        bint err = 0, is_variable
+        int rank_min, rank_max, tiebreak
+        skiplist_t *sl
         int64_t nobs = 0, i, j, s, e, N
-        Py_ssize_t idx
-        bint is_variable
         ndarray[int64_t] start, end
         ndarray[double_t] output
-        double vlow, vhigh
 
-    if quantile <= 0.0 or quantile >= 1.0:
-        raise ValueError("quantile value {0} not in [0, 1]".format(quantile))
+    tiebreaks = {'average': 0, 'min': 1, 'max': 2}
+    if method not in tiebreaks:
+        raise ValueError("method must be one of {0}"
+                         "".format(sorted(tiebreaks)))
+    tiebreak = tiebreaks[method]
 
     # we use the Fixed/Variable Indexer here as the
     # actual skiplist ops outweigh any window computation costs
@@ -1365,52 +1998,72 @@ def roll_quantile(ndarray[float64_t, cast=True] input, int64_t win,
         minp, index, closed,
         use_mock=False)
     output = np.empty(N, dtype=float)
-    skiplist = IndexableSkiplist(win)
 
-    for i in range(0, N):
-        s = start[i]
-        e = end[i]
-
-        if i == 0:
+    sl = skiplist_init(<int>win)
+    if sl == NULL:
+        raise MemoryError("skiplist_init failed")
 
-            # setup
-            val = input[i]
-            if val == val:
-                nobs += 1
-                skiplist.insert(val)
+    with nogil:
 
-        else:
+        for i in range(0, N):
+            s = start[i]
+            e = end[i]
 
-            # calculate deletes
-            for j in range(start[i - 1], s):
-                val = input[j]
-                if val == val:
-                    skiplist.remove(val)
-                    nobs -= 1
+            if i == 0:
 
-            # calculate adds
-            for j in range(end[i - 1], e):
-                val = input[j]
+                # setup
+                val = input[i]
                 if val == val:
                     nobs += 1
-                    skiplist.insert(val)
+                    err = skiplist_insert(sl, val) != 1
+                    if err:
+                        break
 
-        if nobs >= minp:
-            idx = int(quantile * <double>(nobs - 1))
+            else:
+
+                # calculate deletes
+                for j in range(start[i - 1], s):
+                    val = input[j]
+                    if val == val:
+                        skiplist_remove(sl, val)
+                        nobs -= 1
 
-            # Single value in skip list
-            if nobs == 1:
-                output[i] = skiplist.get(0)
+                # calculate adds
+                for j in range(end[i - 1], e):
+                    val = input[j]
+                    if val == val:
+                        nobs += 1
+                        err = skiplist_insert(sl, val) != 1
+                        if err:
+                            break
+
+            val = input[i]
+            if nobs >= minp and val == val:
+                # the ranks of the first and the last of the tied values
+                if ascending:
+                    rank_min = skiplist_rank(sl, val, 0) + 1
+                    rank_max = skiplist_rank(sl, val, 1)
+                else:
+                    rank_min = nobs - skiplist_rank(sl, val, 1) + 1
+                    rank_max = nobs - skiplist_rank(sl, val, 0)
 
-            # Interpolated quantile
+                if tiebreak == 1:
+                    res = rank_min
+                elif tiebreak == 2:
+                    res = rank_max
+                else:
+                    res = (rank_min + rank_max) / 2.
+
+                if percentile:
+                    res /= nobs
             else:
-                vlow = skiplist.get(idx)
-                vhigh = skiplist.get(idx + 1)
-                output[i] = ((vlow + (vhigh - vlow) *
-                             (quantile * (nobs - 1) - idx)))
-        else:
-            output[i] = NaN
+                res = NaN
 
+            output[i] = res
+
+    skiplist_destroy(sl)
+    if err:
+        raise MemoryError("skiplist_insert failed")
     return output
 
 
@@ -1578,6 +2231,33 @@ def ewma(ndarray[double_t] input, double_t com, int adjust, int ignore_na,
     -------
     y : ndarray
     """
+    return ewma_online(input, EWMAState(), com, adjust, ignore_na, minp)
+
+
+cdef class EWMAState:
+    """
+    The weighted average of ewma over the values seen so far, which
+    ewma_online updates with new values
+    """
+
+    cdef public:
+        double weighted_avg, old_wt
+        Py_ssize_t nobs, nrows
+
+    def __init__(self):
+        self.weighted_avg = NaN
+        self.old_wt = 1.
+        self.nobs = 0
+        self.nrows = 0
+
+
+def ewma_online(ndarray[double_t] input, EWMAState state, double_t com,
+                int adjust, int ignore_na, int minp):
+    """
+    Update ``state`` with the values of ``input``, returning their
+    exponentially-weighted moving average. These are the same as those of
+    ewma on all of the values seen.
+    """
 
     cdef Py_ssize_t N = len(input)
     cdef ndarray[double_t] output = np.empty(N, dtype=float)
@@ -1587,19 +2267,26 @@ def ewma(ndarray[double_t] input, double_t com, int adjust, int ignore_na,
     minp = max(minp, 1)
 
     cdef double alpha, old_wt_factor, new_wt, weighted_avg, old_wt, cur
-    cdef Py_ssize_t i, nobs
+    cdef Py_ssize_t i, nobs, begin
 
     alpha = 1. / (1. + com)
     old_wt_factor = 1. - alpha
     new_wt = 1. if adjust else alpha
 
-    weighted_avg = input[0]
-    is_observation = (weighted_avg == weighted_avg)
-    nobs = int(is_observation)
-    output[0] = weighted_avg if (nobs >= minp) else NaN
-    old_wt = 1.
+    weighted_avg = state.weighted_avg
+    old_wt = state.old_wt
+    nobs = state.nobs
+    begin = 0
 
-    for i from 1 <= i < N:
+    if state.nrows == 0:
+        weighted_avg = input[0]
+        is_observation = (weighted_avg == weighted_avg)
+        nobs = int(is_observation)
+        output[0] = weighted_avg if (nobs >= minp) else NaN
+        old_wt = 1.
+        begin = 1
+
+    for i from begin <= i < N:
         cur = input[i]
         is_observation = (cur == cur)
         nobs += int(is_observation)
@@ -1623,6 +2310,11 @@ def ewma(ndarray[double_t] input, double_t com, int adjust, int ignore_na,
 
         output[i] = weighted_avg if (nobs >= minp) else NaN
 
+    state.weighted_avg = weighted_avg
+    state.old_wt = old_wt
+    state.nobs = nobs
+    state.nrows += N
+
     return output
 
 # ----------------------------------------------------------------------
@@ -95,7 +95,8 @@ def convert_json_to_lines(object arr):
         Py_ssize_t i = 0, num_open_brackets_seen = 0, length
         bint in_quotes = 0, is_escaping = 0
         ndarray[uint8_t] narr
-        unsigned char v, comma, left_bracket, right_brack, newline
+        unsigned char v, comma, left_bracket, right_bracket, newline
+        unsigned char quote, backslash
 
     newline = ord('\n')
     comma = ord(',')
@@ -106,21 +107,22 @@ def convert_json_to_lines(object arr):
 
     narr = np.frombuffer(arr.encode('utf-8'), dtype='u1').copy()
     length = narr.shape[0]
-    for i in range(length):
-        v = narr[i]
-        if v == quote and i > 0 and not is_escaping:
-            in_quotes = ~in_quotes
-        if v == backslash or is_escaping:
-            is_escaping = ~is_escaping
-        if v == comma:  # commas that should be \n
-            if num_open_brackets_seen == 0 and not in_quotes:
-                narr[i] = newline
-        elif v == left_bracket:
-            if not in_quotes:
-                num_open_brackets_seen += 1
-        elif v == right_bracket:
-            if not in_quotes:
-                num_open_brackets_seen -= 1
+    with nogil:
+        for i in range(length):
+            v = narr[i]
+            if v == quote and i > 0 and not is_escaping:
+                in_quotes = not in_quotes
+            if v == backslash or is_escaping:
+                is_escaping = not is_escaping
+            if v == comma:  # commas that should be \n
+                if num_open_brackets_seen == 0 and not in_quotes:
+                    narr[i] = newline
+            elif v == left_bracket:
+                if not in_quotes:
+                    num_open_brackets_seen += 1
+            elif v == right_bracket:
+                if not in_quotes:
+                    num_open_brackets_seen -= 1
 
     return narr.tostring().decode('utf-8')
 
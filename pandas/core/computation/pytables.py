@@ -18,7 +18,7 @@ from pandas.core.tools.timedeltas import _coerce_scalar_to_timedelta_type
 
 
 class Scope(expr.Scope):
-    __slots__ = 'queryables',
+    __slots__ = 'queryables', 'resolved'
 
     def __init__(self, level, global_dict=None, local_dict=None,
                  queryables=None):
@@ -26,6 +26,9 @@ class Scope(expr.Scope):
                                     local_dict=local_dict)
         self.queryables = queryables or dict()
 
+        # the values the names of the expression resolved to
+        self.resolved = dict()
+
 
 class Term(ops.Term):
 
@@ -47,9 +50,11 @@ class Term(ops.Term):
 
         # resolve the rhs (and allow it to be None)
         try:
-            return self.env.resolve(self.name, is_local=False)
+            value = self.env.resolve(self.name, is_local=False)
         except UndefinedVariableError:
-            return self.name
+            value = self.name
+        self.env.resolved[self.name] = value
+        return value
 
     @property
     def value(self):
@@ -42,11 +42,32 @@ def use_numexpr_cb(key):
     expressions.set_use_numexpr(cf.get_option(key))
 
 
+groupby_threads_doc = """
+: int
+    Number of threads used by the cython groupby aggregations (sum, prod,
+    min, max, mean, var, first and last) on numeric data. Rows are split
+    into contiguous blocks which are reduced concurrently and combined.
+    Values of 1 or less disable threading, the default is 1
+"""
+
+window_threads_doc = """
+: int
+    Number of threads used by the rolling and expanding median, quantile,
+    skew, kurt, max and min on the columns of a DataFrame. The columns are
+    rolled concurrently. Values of 1 or less disable threading, the default
+    is 1
+"""
+
+
 with cf.config_prefix('compute'):
     cf.register_option('use_bottleneck', True, use_bottleneck_doc,
                        validator=is_bool, cb=use_bottleneck_cb)
     cf.register_option('use_numexpr', True, use_numexpr_doc,
                        validator=is_bool, cb=use_numexpr_cb)
+    cf.register_option('groupby_threads', 1, groupby_threads_doc,
+                       validator=is_int)
+    cf.register_option('window_threads', 1, window_threads_doc,
+                       validator=is_int)
 #
 # options from the "display" namespace
 
@@ -418,6 +439,16 @@ with cf.config_prefix('mode'):
     cf.register_option('chained_assignment', 'warn', chained_assignment,
                        validator=is_one_of_factory([None, 'warn', 'raise']))
 
+copy_on_write_doc = """
+: boolean
+    Whether deep copies of DataFrame and Series share their data until one
+    of them is modified in place or its ``.values`` are accessed.
+"""
+
+with cf.config_prefix('mode'):
+    cf.register_option('copy_on_write', False, copy_on_write_doc,
+                       validator=is_bool)
+
 # Set up the io.excel specific configuration.
 writer_engine_doc = """
 : string
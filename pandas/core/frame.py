@@ -2063,6 +2063,19 @@ class DataFrame(NDFrame):
         return self._set_value(index, col, value, takeable=takeable)
 
     def _set_value(self, index, col, value, takeable=False):
+        try:
+            loc = col if takeable is True else self.columns.get_loc(col)
+        except (KeyError, TypeError):
+            loc = None
+        if is_integer(loc):
+            # only the block holding the column is written to
+            blk = self._data.blocks[self._data._blknos[loc]]
+            replaced = blk._maybe_copy_on_write()
+        else:
+            replaced = loc is not None and self._data._maybe_copy_on_write()
+        if replaced:
+            # the cached columns are views on the replaced values
+            self._clear_item_cache()
         try:
             if takeable is True:
                 series = self._iget_item_cache(col)
@@ -5704,7 +5717,7 @@ class DataFrame(NDFrame):
 
         if numeric_only is None:
             try:
-                values = self.values
+                values = self._values
                 result = f(values)
             except Exception as e:
 
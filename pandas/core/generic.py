@@ -1652,7 +1652,7 @@ class NDFrame(PandasObject, SelectionMixin):
     def to_json(self, path_or_buf=None, orient=None, date_format=None,
                 double_precision=10, force_ascii=True, date_unit='ms',
                 default_handler=None, lines=False, compression=None,
-                index=True):
+                index=True, chunksize=None, num_threads=None):
         """
         Convert the object to a JSON string.
 
@@ -1727,6 +1727,21 @@ class NDFrame(PandasObject, SelectionMixin):
 
             .. versionadded:: 0.23.0
 
+        chunksize : int, default None
+            If 'orient' is 'records', encode this many rows at a time and
+            write each chunk to the file as it is encoded, instead of
+            building the whole JSON string in memory first.
+
+            .. versionadded:: 0.23.0
+
+        num_threads : int, default None
+            If 'orient' is 'records', encode the chunks in a pool of this
+            many threads, the chunks of a batch being encoded while those
+            of the previous one are written. Without a `chunksize` the rows
+            are split into `num_threads` chunks.
+
+            .. versionadded:: 0.23.0
+
         Returns
         -------
         same type as input object with filtered info axis
@@ -1780,7 +1795,8 @@ class NDFrame(PandasObject, SelectionMixin):
                             force_ascii=force_ascii, date_unit=date_unit,
                             default_handler=default_handler,
                             lines=lines, compression=compression,
-                            index=index)
+                            index=index, chunksize=chunksize,
+                            num_threads=num_threads)
 
     def to_hdf(self, path_or_buf, key, **kwargs):
         """Write the contained data to an HDF5 file using HDFStore.
@@ -1858,7 +1874,7 @@ class NDFrame(PandasObject, SelectionMixin):
                                   **kwargs)
 
     def to_sql(self, name, con, schema=None, if_exists='fail', index=True,
-               index_label=None, chunksize=None, dtype=None):
+               index_label=None, chunksize=None, dtype=None, method=None):
         """
         Write records stored in a DataFrame to a SQL database.
 
@@ -1888,12 +1904,23 @@ class NDFrame(PandasObject, SelectionMixin):
         dtype : dict of column name to SQL type, default None
             Optional specifying the datatype for columns. The SQL type should
             be a SQLAlchemy type, or a string for sqlite3 fallback connection.
+        method : {None, 'multi', callable}, default None
+            Controls the SQL insertion clause used:
+
+            - None : Uses standard SQL ``INSERT`` clause (one per row).
+            - 'multi': Pass multiple values in a single ``INSERT`` clause.
+            - callable with signature ``(pd_table, conn, keys, data)``.
+
+            Details and a sample callable implementation can be found in the
+            section :ref:`insert method <io.sql.method>`.
+
+            .. versionadded:: 0.23.0
 
         """
         from pandas.io import sql
         sql.to_sql(self, name, con, schema=schema, if_exists=if_exists,
                    index=index, index_label=index_label, chunksize=chunksize,
-                   dtype=dtype)
+                   dtype=dtype, method=method)
 
     def to_pickle(self, path, compression='infer',
                   protocol=pkl.HIGHEST_PROTOCOL):
@@ -4244,12 +4271,24 @@ class NDFrame(PandasObject, SelectionMixin):
         will result in a flot64 dtype.
         """
         self._consolidate_inplace()
+        if (len(self._data.blocks) == 1 and
+                config.get_option('mode.copy_on_write')):
+            # the array is a view that may be written to, so it must not
+            # write to shared data, nor be shared later on
+            if self._data._maybe_copy_on_write():
+                # the cached items are views on the replaced values
+                self._clear_item_cache()
+            values = self._data.as_array(
+                transpose=self._AXIS_REVERSED).view()
+            self._data.blocks[0]._add_view(values)
+            return values
         return self._data.as_array(transpose=self._AXIS_REVERSED)
 
     @property
     def _values(self):
-        """internal implementation"""
-        return self.values
+        """internal implementation, read-only if the data is shared"""
+        self._consolidate_inplace()
+        return self._data.as_array(transpose=self._AXIS_REVERSED)
 
     @property
     def _get_values(self):
@@ -4455,10 +4494,22 @@ class NDFrame(PandasObject, SelectionMixin):
             This is in contrast to ``copy.deepcopy`` in the Standard Library,
             which recursively copies object data.
 
+            With the ``mode.copy_on_write`` option enabled, a deep copy shares
+            its data with the caller until either of them is modified in
+            place or its ``.values`` are accessed, at which point that object
+            copies it. Data that may still be written to through a view,
+            such as a column, a slice or the ``.values`` taken before the
+            copy, is copied right away. An array a Series was constructed
+            from without a copy is not tracked.
+
         Returns
         -------
         copy : type of caller
         """
+        if deep is True and config.get_option('mode.copy_on_write'):
+            # cached items are writeable views that would keep the data
+            # from being shared
+            self._clear_item_cache()
         data = self._data.copy(deep=deep)
         return self._constructor(data).__finalize__(self)
 
@@ -1,4 +1,6 @@
+import os
 import types
+import multiprocessing
 from functools import wraps
 import numpy as np
 import datetime
@@ -23,7 +25,7 @@ from pandas.core.dtypes.common import (
     is_interval_dtype,
     is_datetimelike,
     is_datetime64_any_dtype,
-    is_bool, is_integer_dtype,
+    is_bool, is_integer, is_integer_dtype,
     is_complex_dtype,
     is_bool_dtype,
     is_scalar,
@@ -52,15 +54,18 @@ from pandas.core.series import Series
 from pandas.core.panel import Panel
 from pandas.core.sorting import (get_group_index_sorter, get_group_index,
                                  compress_group_index, get_flattened_iterator,
-                                 decons_obs_group_ids, get_indexer_dict)
+                                 decons_obs_group_ids, get_indexer_dict,
+                                 get_hashed_group_index)
 from pandas.util._decorators import (cache_readonly, Substitution,
-                                     Appender, make_signature)
+                                     Appender, make_signature,
+                                     keyword_only_args)
 from pandas.io.formats.printing import pprint_thing
 from pandas.util._validators import validate_kwargs
 
 import pandas.core.common as com
 import pandas.core.algorithms as algorithms
-from pandas.core.config import option_context
+from pandas.core.config import option_context, get_option
+import pandas.core.util.numba_ as numba_
 
 from pandas.plotting._core import boxplot_frame_groupby
 
@@ -102,6 +107,21 @@ _apply_docs = dict(
         callable may take positional and keyword arguments
     args, kwargs : tuple and dict
         Optional positional and keyword arguments to pass to ``func``
+    engine_kwargs : dict, optional
+        Options for applying ``func`` in parallel, which is not passed to
+        ``func``:
+
+        - ``n_jobs`` : int, default 1. Number of workers ``func`` is applied
+          in, each working on a contiguous range of groups, -1 to use all
+          CPUs. The results are combined in group order, as in the serial
+          case.
+        - ``backend`` : {{'thread', 'process'}}, default 'thread'. With
+          'process', the groups are processed in forked worker processes
+          which share the sorted data with the parent without copying it;
+          the results of ``func`` must be picklable. Only used if
+          ``n_jobs`` is not 1.
+
+        .. versionadded:: 0.23.0
 
     Returns
     -------
@@ -113,7 +133,7 @@ _apply_docs = dict(
     first group to decide whether it can take a fast or slow code
     path. This can lead to unexpected behavior if func has
     side-effects, as they will take effect twice for the first
-    group.
+    group. This is not the case when ``engine_kwargs['n_jobs']`` is not 1.
 
     Examples
     --------
@@ -871,7 +891,22 @@ b  2""")
     @Appender(_apply_docs['template']
               .format(input="dataframe",
                       examples=_apply_docs['dataframe_examples']))
-    def apply(self, func, *args, **kwargs):
+    @keyword_only_args
+    def apply(self, func, engine_kwargs=None, *args, **kwargs):
+
+        engine_kwargs = engine_kwargs or {}
+        unknown = set(engine_kwargs) - set(['n_jobs', 'backend'])
+        if unknown:
+            raise ValueError("engine_kwargs does not support "
+                             "{0}".format(', '.join(sorted(unknown))))
+        n_jobs = engine_kwargs.get('n_jobs', 1)
+        backend = engine_kwargs.get('backend', 'thread')
+        if not is_integer(n_jobs) or n_jobs == 0 or n_jobs < -1:
+            raise ValueError("n_jobs must be a positive integer or -1")
+        if backend not in ['thread', 'process']:
+            raise ValueError("backend must be either 'thread' or 'process'")
+        if n_jobs == -1:
+            n_jobs = multiprocessing.cpu_count()
 
         func = self._is_builtin_func(func)
 
@@ -893,11 +928,13 @@ b  2""")
 
         # ignore SettingWithCopy here in case the user mutates
         with option_context('mode.chained_assignment', None):
-            return self._python_apply_general(f)
+            return self._python_apply_general(f, n_jobs=n_jobs,
+                                              backend=backend)
 
-    def _python_apply_general(self, f):
+    def _python_apply_general(self, f, n_jobs=1, backend='thread'):
         keys, values, mutated = self.grouper.apply(f, self._selected_obj,
-                                                   self.axis)
+                                                   self.axis, n_jobs=n_jobs,
+                                                   backend=backend)
 
         return self._wrap_applied_output(
             keys,
@@ -2032,11 +2069,16 @@ class BaseGrouper(object):
                                           self.levels,
                                           self.labels)
 
-    def apply(self, f, data, axis=0):
+    def apply(self, f, data, axis=0, n_jobs=1, backend='thread'):
         mutated = self.mutated
         splitter = self._get_splitter(data, axis=axis)
         group_keys = self._get_group_keys()
 
+        if n_jobs > 1 and axis == 0 and self.ngroups > 1:
+            values, parallel_mutated = self._apply_parallel(
+                f, splitter, group_keys, n_jobs, backend)
+            return group_keys, values, mutated or parallel_mutated
+
         # oh boy
         f_name = com._get_callable_name(f)
         if (f_name not in _plotting_methods and
@@ -2065,6 +2107,61 @@ class BaseGrouper(object):
 
         return group_keys, result_values, mutated
 
+    def _apply_parallel(self, f, splitter, group_keys, n_jobs, backend):
+        """
+        Apply ``f`` to the groups in ``n_jobs`` workers, each taking a
+        contiguous range of groups of about the same number of rows, and
+        return the results in group order
+        """
+        sdata = splitter._get_sorted_data()
+        starts, ends = lib.generate_slices(splitter.slabels, splitter.ngroups)
+        group_keys = list(group_keys)
+
+        n_jobs = min(n_jobs, len(starts))
+        cuts = np.searchsorted(ends, np.arange(1, n_jobs) *
+                               (ends[-1] / float(n_jobs)))
+        tasks = [(group_keys[i[0]:i[-1] + 1], starts[i], ends[i])
+                 for i in np.split(np.arange(len(starts)), cuts) if len(i)]
+
+        if backend == 'thread':
+            from multiprocessing.pool import ThreadPool
+
+            def _apply_task(task):
+                keys, task_starts, task_ends = task
+                return _apply_groups(f, splitter._chop, sdata, keys,
+                                     task_starts, task_ends)
+
+            pool = ThreadPool(processes=len(tasks))
+            try:
+                results = pool.map(_apply_task, tasks)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            if not hasattr(os, 'fork'):
+                raise ValueError("backend='process' requires os.fork, "
+                                 "which is not available on this platform")
+            ctx = multiprocessing.get_context('fork') if compat.PY3 \
+                else multiprocessing
+
+            # the workers inherit the sorted data and the function when
+            # forked, only the group bounds and the results are pickled
+            pool = ctx.Pool(processes=len(tasks),
+                            initializer=_init_apply_worker,
+                            initargs=(f, splitter._chop, sdata))
+            try:
+                results = pool.map(_apply_forked_task, tasks)
+            finally:
+                pool.close()
+                pool.join()
+
+        values = []
+        mutated = False
+        for task_values, task_mutated in results:
+            values.extend(task_values)
+            mutated = mutated or task_mutated
+        return values, mutated
+
     @cache_readonly
     def indices(self):
         """ dict {group name -> group indices} """
@@ -2147,7 +2244,42 @@ class BaseGrouper(object):
             labels = labels[sorter]
         return labels
 
+    @cache_readonly
+    def _hashed_group_info(self):
+        """
+        (comp_ids, obs_rows) from hashing the keys of an unsorted groupby
+        on several plain numeric or datetime keys, where ``obs_rows`` is the
+        first row of each group, or None to label the keys individually
+        """
+        if len(self.groupings) < 2 or self.sort:
+            return None
+        for ping in self.groupings:
+            dtype = getattr(ping.grouper, 'dtype', None)
+            if (ping._labels is not None or not isinstance(dtype, np.dtype)
+                    or dtype.kind not in 'biufmM'):
+                return None
+        return get_hashed_group_index([np.asarray(ping.grouper)
+                                       for ping in self.groupings])
+
+    @cache_readonly
+    def _hashed_levels(self):
+        """
+        (levels, labels) of the keys of a hashed groupby, in order of
+        appearance, factorizing only the keys of the first row of each group
+        """
+        obs_rows = self._hashed_group_info[1]
+        levels, labels = [], []
+        for ping in self.groupings:
+            keys = np.asarray(ping.grouper).take(obs_rows)
+            level_labels, uniques = algorithms.factorize(keys, sort=False)
+            levels.append(Index(uniques, name=ping.name))
+            labels.append(level_labels)
+        return levels, labels
+
     def _get_compressed_labels(self):
+        if self._hashed_group_info is not None:
+            return self._hashed_group_info
+
         all_labels = [ping.labels for ping in self.groupings]
         if len(all_labels) > 1:
             group_index = get_group_index(all_labels, self.shape,
@@ -2164,6 +2296,9 @@ class BaseGrouper(object):
     @property
     def recons_labels(self):
         comp_ids, obs_ids, _ = self.group_info
+        if self._hashed_group_info is not None:
+            return self._hashed_levels[1]
+
         labels = (ping.labels for ping in self.groupings)
         return decons_obs_group_ids(comp_ids,
                                     obs_ids, self.shape, labels, xnull=True)
@@ -2173,6 +2308,12 @@ class BaseGrouper(object):
         if not self.compressed and len(self.groupings) == 1:
             return self.groupings[0].group_index.rename(self.names[0])
 
+        if self._hashed_group_info is not None:
+            # the levels are in order of appearance, as in the unhashed path
+            levels, labels = self._hashed_levels
+            return MultiIndex(levels=levels, labels=labels,
+                              verify_integrity=False, names=self.names)
+
         return MultiIndex(levels=[ping.group_index for ping in self.groupings],
                           labels=self.recons_labels,
                           verify_integrity=False,
@@ -2182,6 +2323,13 @@ class BaseGrouper(object):
         if not self.compressed and len(self.groupings) == 1:
             return [self.groupings[0].group_index]
 
+        if self._hashed_group_info is not None:
+            # take the keys of each group from its first row, without
+            # labelling the keys individually
+            obs_rows = self._hashed_group_info[1]
+            return [Index(ping.grouper, name=ping.name).take(obs_rows)
+                    for ping in self.groupings]
+
         name_list = []
         for ping, labels in zip(self.groupings, self.recons_labels):
             labels = _ensure_platform_int(labels)
@@ -2239,6 +2387,12 @@ class BaseGrouper(object):
         'ohlc': lambda *args: ['open', 'high', 'low', 'close']
     }
 
+    # aggregations whose results on row blocks can be combined, see
+    # _aggregate_threaded
+    _threaded_aggregations = frozenset(['add', 'prod', 'min', 'max', 'mean',
+                                        'var', 'first', 'last'])
+    _min_rows_per_thread = 100000
+
     def _is_builtin_func(self, arg):
         """
         if we define an builtin function for this argument, return it,
@@ -2374,9 +2528,15 @@ class BaseGrouper(object):
             result = _maybe_fill(np.empty(out_shape, dtype=out_dtype),
                                  fill_value=np.nan)
             counts = np.zeros(self.ngroups, dtype=np.int64)
-            result = self._aggregate(
-                result, counts, values, labels, func, is_numeric,
-                is_datetimelike, min_count)
+            num_threads = self._get_num_threads(how, values)
+            if num_threads > 1:
+                result = self._aggregate_threaded(
+                    result, counts, values, labels, func, how, is_numeric,
+                    min_count, num_threads)
+            else:
+                result = self._aggregate(
+                    result, counts, values, labels, func, is_numeric,
+                    is_datetimelike, min_count)
         elif kind == 'transform':
             result = _maybe_fill(np.empty_like(values, dtype=out_dtype),
                                  fill_value=np.nan)
@@ -2443,6 +2603,91 @@ class BaseGrouper(object):
 
         return result
 
+    def _get_num_threads(self, how, values):
+        """
+        Number of row blocks to reduce concurrently for ``how``, 1 if the
+        aggregation should run serially
+        """
+        num_threads = get_option('compute.groupby_threads')
+        if (num_threads <= 1 or how not in self._threaded_aggregations or
+                values.ndim != 2 or values.dtype.kind not in 'fi'):
+            return 1
+        return min(num_threads, len(values) // self._min_rows_per_thread)
+
+    def _aggregate_threaded(self, result, counts, values, comp_ids, agg_func,
+                            how, is_numeric, min_count, num_threads):
+        """
+        Reduce ``num_threads`` contiguous row blocks of ``values`` in a
+        thread pool and combine the per-block results into ``result``.
+
+        The cython kernels release the GIL, so each block runs its kernel
+        into private output and count arrays in parallel. Sums, products,
+        extrema, first and last combine directly; means are combined from
+        the block sums and variances with the pairwise update of Chan et al.
+        """
+        from multiprocessing.pool import ThreadPool
+
+        if how in ['mean', 'var']:
+            add_func = self._get_cython_function('aggregate', 'add', values,
+                                                 is_numeric)
+        need_nobs = how in ['mean', 'var'] or min_count > 0
+        bounds = np.linspace(0, len(values), num_threads + 1).astype(np.int64)
+
+        def _reduce_block(i):
+            block = values[bounds[i]:bounds[i + 1]]
+            labels = comp_ids[bounds[i]:bounds[i + 1]]
+            part = {'counts': np.zeros_like(counts)}
+
+            out = _maybe_fill(np.empty_like(result), fill_value=np.nan)
+            if how == 'mean':
+                add_func(out, part['counts'], block, labels, 0)
+            elif how in ['add', 'prod']:
+                agg_func(out, part['counts'], block, labels, 0)
+            else:
+                agg_func(out, part['counts'], block, labels, -1)
+            part['out'] = out
+
+            if how == 'var':
+                part['sum'] = np.zeros_like(result)
+                add_func(part['sum'], np.zeros_like(counts), block, labels, 0)
+            if need_nobs:
+                part['nobs'] = np.zeros(result.shape, dtype=np.float64)
+                libgroupby.group_add_float64(
+                    part['nobs'], np.zeros_like(counts),
+                    (block == block).astype(np.float64), labels, 0)
+            return part
+
+        pool = ThreadPool(processes=num_threads)
+        try:
+            parts = pool.map(_reduce_block, range(num_threads))
+        finally:
+            pool.close()
+            pool.join()
+
+        for part in parts:
+            counts += part['counts']
+        if need_nobs:
+            nobs = sum(part['nobs'] for part in parts)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if how == 'add':
+                result[:] = sum(part['out'] for part in parts)
+            elif how == 'prod':
+                result[:] = np.prod([part['out'] for part in parts], axis=0)
+            elif how == 'mean':
+                total = sum(part['out'] for part in parts)
+                result[:] = np.where(nobs > 0, total / nobs, np.nan)
+            elif how == 'var':
+                result[:] = _combine_block_variances(parts)
+            else:
+                result[:] = _combine_block_extrema(
+                    [part['out'] for part in parts], how)
+
+        if how in ['add', 'prod'] and min_count > 0:
+            result[nobs < min_count] = np.nan
+
+        return result
+
     def _transform(self, result, values, comp_ids, transform_func,
                    is_numeric, is_datetimelike, **kwargs):
 
@@ -2510,6 +2755,88 @@ class BaseGrouper(object):
         return result, counts
 
 
+# state of a forked worker process of BaseGrouper._apply_parallel, only set
+# in the worker
+_apply_worker_state = {}
+
+
+def _init_apply_worker(f, chop, sdata):
+    _apply_worker_state.update(f=f, chop=chop, sdata=sdata)
+
+
+def _apply_groups(f, chop, sdata, keys, starts, ends):
+    """
+    Apply ``f`` to the groups ``chop(sdata, slice(start, end))``, returning
+    the results and whether any of them is not indexed like its group
+    """
+    results = []
+    mutated = False
+    for key, start, end in zip(keys, starts, ends):
+        group = chop(sdata, slice(start, end))
+        object.__setattr__(group, 'name', key)
+
+        # group might be modified
+        group_axes = _get_axes(group)
+        res = f(group)
+        if not _is_indexed_like(res, group_axes):
+            mutated = True
+        results.append(res)
+    return results, mutated
+
+
+def _apply_forked_task(task):
+    keys, starts, ends = task
+    return _apply_groups(_apply_worker_state['f'],
+                         _apply_worker_state['chop'],
+                         _apply_worker_state['sdata'], keys, starts, ends)
+
+
+def _combine_block_extrema(outs, how):
+    """
+    Combine the per-block results of the min, max, first and last kernels,
+    missing entries being NaN (or iNaT for int64 values)
+    """
+    if outs[0].dtype.kind == 'i':
+        isnull = lambda x: x == iNaT
+    else:
+        isnull = np.isnan
+
+    result = outs[0]
+    for out in outs[1:]:
+        take = isnull(result)
+        if how == 'max':
+            take |= out > result
+        elif how == 'min':
+            take |= out < result
+        elif how == 'last':
+            take[:] = True
+        result = np.where(take & ~isnull(out), out, result)
+    return result
+
+
+def _combine_block_variances(parts):
+    """
+    Combine per-block group variances (ddof=1) using the block counts and
+    sums of the non-missing values
+    """
+    def _moments(part):
+        nobs = part['nobs']
+        mean = np.where(nobs > 0, part['sum'] / nobs, 0)
+        m2 = np.where(nobs > 1, part['out'] * (nobs - 1), 0)
+        return nobs, mean, m2
+
+    nobs, mean, m2 = _moments(parts[0])
+    for part in parts[1:]:
+        block_nobs, block_mean, block_m2 = _moments(part)
+        total = nobs + block_nobs
+        delta = block_mean - mean
+        frac = np.where(total > 0, block_nobs / total, 0)
+        mean = mean + delta * frac
+        m2 = m2 + block_m2 + delta ** 2 * nobs * frac
+        nobs = total
+    return np.where(nobs > 1, m2 / (nobs - 1), np.nan)
+
+
 def generate_bins_generic(values, binner, closed):
     """
     Generate bin edge offsets and bin labels for one array using another array
@@ -3223,6 +3550,16 @@ class SeriesGroupBy(GroupBy):
     1    1    2
     2    3    4
 
+    With ``engine='numba'`` a function of an ndarray is compiled once with
+    numba and applied to the groups in a compiled loop; extra arguments
+    must be positional
+
+    >>> s.groupby([1, 1, 2, 2]).agg(lambda x: x.max() - x.min(),
+    ...                             engine='numba')
+    1    1.0
+    2    1.0
+    dtype: float64
+
     See also
     --------
     pandas.Series.groupby.apply
@@ -3234,15 +3571,25 @@ class SeriesGroupBy(GroupBy):
     @Appender(_apply_docs['template']
               .format(input='series',
                       examples=_apply_docs['series_examples']))
-    def apply(self, func, *args, **kwargs):
-        return super(SeriesGroupBy, self).apply(func, *args, **kwargs)
+    @keyword_only_args
+    def apply(self, func, engine_kwargs=None, *args, **kwargs):
+        return super(SeriesGroupBy, self).apply(
+            func, engine_kwargs=engine_kwargs, *args, **kwargs)
 
     @Appender(_agg_doc)
     @Appender(_shared_docs['aggregate'] % dict(
         klass='Series',
         versionadded=''))
-    def aggregate(self, func_or_funcs, *args, **kwargs):
+    @keyword_only_args
+    def aggregate(self, func_or_funcs, engine='cython', *args, **kwargs):
         _level = kwargs.pop('_level', None)
+        if numba_.validate_engine(engine, kwargs):
+            _, values, begin, end = self._numba_group_bounds()
+            result = numba_.group_aggregate(func_or_funcs, values, begin,
+                                            end, args)
+            return Series(result, index=self.grouper.result_index,
+                          name=self._selection_name)
+
         if isinstance(func_or_funcs, compat.string_types):
             return getattr(self, func_or_funcs)(*args, **kwargs)
 
@@ -3401,7 +3748,17 @@ class SeriesGroupBy(GroupBy):
 
     @Substitution(klass='Series', selected='A.')
     @Appender(_transform_template)
-    def transform(self, func, *args, **kwargs):
+    @keyword_only_args
+    def transform(self, func, engine='cython', *args, **kwargs):
+        if numba_.validate_engine(engine, kwargs):
+            sorter, values, begin, end = self._numba_group_bounds()
+            transformed = numba_.group_transform(func, values, begin, end,
+                                                 args)
+            result = np.empty_like(transformed)
+            result[sorter] = transformed
+            return Series(result, index=self._selected_obj.index,
+                          name=self._selected_obj.name)
+
         func = self._is_cython_func(func) or func
 
         # if string function
@@ -3443,6 +3800,20 @@ class SeriesGroupBy(GroupBy):
         result.index = self._selected_obj.index
         return result
 
+    def _numba_group_bounds(self):
+        """
+        Return the sorter of the values by group, the sorted values and the
+        bounds of each group within them, for engine='numba'
+        """
+        values = self._selected_obj.values
+        if not is_numeric_dtype(values):
+            raise TypeError("engine='numba' requires numeric data")
+
+        ids, _, ngroups = self.grouper.group_info
+        sorter = get_group_index_sorter(ids, ngroups)
+        begin, end = lib.generate_slices(ids.take(sorter), ngroups)
+        return sorter, values.take(sorter), begin, end
+
     def _transform_fast(self, func, func_nm):
         """
         fast version of transform, only applicable to
@@ -4760,6 +5131,248 @@ class NDArrayGroupBy(GroupBy):
     pass
 
 
+class ChunkedGroupBy(object):
+    """
+    Group by aggregation over an iterator of DataFrames, such as the readers
+    returned by ``read_csv(..., chunksize=n)`` or
+    ``HDFStore.select(..., iterator=True)``.
+
+    Every chunk is reduced to per-group partial states, which are merged
+    into a running state, so that only one chunk and one row per group are
+    held in memory at a time.
+
+    Parameters
+    ----------
+    chunks : iterable of DataFrames
+    by : label or list of labels
+        Columns to group by
+    sort : boolean, default True
+        Sort the group keys, otherwise groups appear in the order they were
+        first seen
+
+    Notes
+    -----
+    The supported functions are 'sum', 'prod', 'count', 'size', 'min',
+    'max', 'mean', 'var', 'std', 'first' and 'last'. Means are computed from
+    the merged sums and counts, variances from the merged counts, means and
+    sums of squared deviations using the pairwise update of Chan et al.
+    """
+
+    # partial states kept for each function
+    _statistics = {
+        'sum': ['sum'],
+        'prod': ['prod'],
+        'count': ['count'],
+        'size': ['size'],
+        'min': ['min'],
+        'max': ['max'],
+        'first': ['first'],
+        'last': ['last'],
+        'mean': ['sum', 'count'],
+        'var': ['count', 'mean', 'm2'],
+        'std': ['count', 'mean', 'm2'],
+    }
+    _numeric_only = frozenset(['sum', 'prod', 'mean', 'var', 'std'])
+
+    # value of the states of the groups missing from a chunk, NaN if absent
+    _fill_values = {'sum': 0, 'count': 0, 'size': 0, 'prod': 1}
+
+    def __init__(self, chunks, by, sort=True):
+        self.chunks = chunks
+        self.keys = by if isinstance(by, list) else [by]
+        self.sort = sort
+
+    def aggregate(self, arg):
+        """
+        Aggregate every chunk and combine the partial results
+
+        Parameters
+        ----------
+        arg : string, list of strings or dict
+            Function name(s) to apply to every non-key column, or a dict of
+            column -> function name or list of function names
+
+        Returns
+        -------
+        aggregated : DataFrame, or Series for 'size'
+        """
+        state = None
+        for chunk in self.chunks:
+            if state is None:
+                spec, columns = self._get_spec(chunk, arg)
+                state = self._reduce_chunk(chunk, spec)
+                dtypes = dict((key, values.dtype)
+                              for key, values in compat.iteritems(state))
+            else:
+                state = self._combine(state, self._reduce_chunk(chunk, spec))
+
+        if state is None:
+            raise ValueError("No chunks to aggregate")
+
+        results = [self._finalize(state, dtypes, col, func)
+                   for col, func in spec]
+        if columns is None:
+            result = results[0]
+        else:
+            result = DataFrame(dict(enumerate(results)),
+                               columns=list(range(len(results))))
+            result.columns = columns
+        if self.sort:
+            result = result.sort_index()
+        return result
+
+    agg = aggregate
+
+    def _get_spec(self, chunk, arg):
+        """
+        Return the list of (column, function) pairs to compute and the
+        columns of the result, None for a Series
+        """
+        others = [col for col in chunk.columns if col not in self.keys]
+        numeric = set(chunk._get_numeric_data().columns)
+
+        if isinstance(arg, compat.string_types):
+            if arg == 'size':
+                spec, columns = [(None, arg)], None
+            else:
+                cols = [col for col in others
+                        if arg not in self._numeric_only or col in numeric]
+                spec = [(col, arg) for col in cols]
+                columns = Index(cols)
+        elif isinstance(arg, dict):
+            if any(is_list_like(funcs) for funcs in compat.itervalues(arg)):
+                spec = [(col, func) for col, funcs in compat.iteritems(arg)
+                        for func in (funcs if is_list_like(funcs)
+                                     else [funcs])]
+                columns = MultiIndex.from_tuples(spec)
+            else:
+                spec = list(compat.iteritems(arg))
+                columns = Index([col for col, _ in spec])
+        elif is_list_like(arg):
+            cols = [col for col in others
+                    if not self._numeric_only.intersection(arg) or
+                    col in numeric]
+            spec = [(col, func) for col in cols for func in arg]
+            columns = MultiIndex.from_tuples(spec)
+        else:
+            raise TypeError("aggregation must be a string, a list of "
+                            "strings or a dict")
+
+        for col, func in spec:
+            if func not in self._statistics:
+                raise ValueError("'{func}' is not supported for streaming "
+                                 "aggregation".format(func=func))
+            if col is not None and col not in others:
+                raise KeyError("Column '{col}' does not exist".format(
+                    col=col))
+        return spec, columns
+
+    def _reduce_chunk(self, chunk, spec):
+        grouped = chunk.groupby(self.keys, sort=self.sort)
+        state = collections.OrderedDict()
+        for col, func in spec:
+            for stat in self._statistics[func]:
+                if (col, stat) in state:
+                    continue
+                if stat == 'size':
+                    values = grouped.size()
+                elif stat == 'm2':
+                    values = grouped[col].var() * (grouped[col].count() - 1)
+                    values = values.fillna(0)
+                else:
+                    values = getattr(grouped[col], stat)()
+                state[col, stat] = values
+        return state
+
+    def _combine(self, left, right):
+        """
+        Merge the partial states ``right`` of a chunk into ``left``
+        """
+        index = next(iter(compat.itervalues(left))).index
+        other = next(iter(compat.itervalues(right))).index
+        index = index.append(other[~other.isin(index)])
+
+        # fill the groups missing from one side with the identity of the
+        # sums and products, so that integer states stay integers
+        def align(values, stat):
+            return values.reindex(
+                index, fill_value=self._fill_values.get(stat, np.nan))
+
+        state = collections.OrderedDict()
+        for (col, stat), a in compat.iteritems(left):
+            b = right[col, stat]
+            if stat in ['min', 'max', 'first', 'last']:
+                state[col, stat] = self._combine_extrema(a, b, stat)
+                continue
+
+            a, b = align(a, stat), align(b, stat)
+            if stat in ['sum', 'count', 'size']:
+                state[col, stat] = a.add(b, fill_value=0)
+            elif stat == 'prod':
+                state[col, stat] = a.mul(b, fill_value=1)
+            elif stat == 'mean':
+                # the counts are merged separately, use the chunk counts
+                nobs_a = align(left[col, 'count'], 'count')
+                nobs_b = align(right[col, 'count'], 'count')
+                nobs = nobs_a + nobs_b
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    frac = (nobs_b / nobs).fillna(0)
+                mean_a = a.fillna(0)
+                delta = b.fillna(0) - mean_a
+                state[col, 'mean'] = (mean_a + delta * frac).where(nobs > 0)
+                state[col, 'm2'] = (align(left[col, 'm2'], 'm2').fillna(0) +
+                                    align(right[col, 'm2'], 'm2').fillna(0) +
+                                    delta ** 2 * nobs_a * frac)
+        return state
+
+    @staticmethod
+    def _combine_extrema(a, b, stat):
+        """
+        Merge the min, max, first or last states ``b`` of a chunk into ``a``
+        without aligning them on NaN, so that int64 states are not cast to
+        float64
+        """
+        shared = b.index.isin(a.index)
+        result = a.append(b[~shared])
+
+        # groups present on both sides keep the value of ``a`` unless
+        # the one of ``b`` replaces it
+        b = b[shared]
+        indexer = result.index.get_indexer(b.index)
+        old, new = result._values[indexer], b._values
+        take = notna(new)
+        if stat in ['first', 'min', 'max']:
+            both = take & notna(old)
+            take &= isna(old)
+            if stat == 'min':
+                take[both] = new[both] < old[both]
+            elif stat == 'max':
+                take[both] = new[both] > old[both]
+
+        if take.any():
+            result.iloc[indexer[take]] = new[take]
+        return result
+
+    def _finalize(self, state, dtypes, col, func):
+        if func == 'mean':
+            total, nobs = state[col, 'sum'], state[col, 'count']
+            with np.errstate(invalid='ignore', divide='ignore'):
+                result = (total / nobs).where(nobs > 0)
+        elif func in ['var', 'std']:
+            nobs, m2 = state[col, 'count'], state[col, 'm2']
+            with np.errstate(invalid='ignore', divide='ignore'):
+                result = (m2 / (nobs - 1)).where(nobs > 1)
+            if func == 'std':
+                result = np.sqrt(result)
+        else:
+            result = state[col, func]
+            dtype = dtypes[col, func]
+            if result.dtype != dtype and not result.isna().any():
+                # restore integer dtypes lost when aligning the states
+                result = result.astype(dtype)
+        return result.rename(None)
+
+
 # ----------------------------------------------------------------------
 # Splitting / application
 
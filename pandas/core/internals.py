@@ -5,6 +5,7 @@ import inspect
 import itertools
 import re
 import operator
+import weakref
 from datetime import datetime, timedelta, date
 from collections import defaultdict
 from functools import partial
@@ -14,6 +15,7 @@ import numpy as np
 from pandas._libs import internals as libinternals
 
 from pandas.core.base import PandasObject
+from pandas.core.config import get_option
 
 from pandas.core.dtypes.dtypes import (
     ExtensionDtype, DatetimeTZDtype,
@@ -87,7 +89,7 @@ class Block(PandasObject):
 
     Index-ignorant; let the container take care of that
     """
-    __slots__ = ['_mgr_locs', 'values', 'ndim']
+    __slots__ = ['_mgr_locs', 'values', 'ndim', '_refs', '_views']
     is_numeric = False
     is_float = False
     is_integer = False
@@ -337,7 +339,9 @@ class Block(PandasObject):
         if self._validate_ndim and new_values.ndim != self.ndim:
             raise ValueError("Only same dim slicing is allowed")
 
-        return self.make_block_same_class(new_values, new_mgr_locs)
+        block = self.make_block_same_class(new_values, new_mgr_locs)
+        self._add_view(block)
+        return block
 
     @property
     def shape(self):
@@ -374,6 +378,7 @@ class Block(PandasObject):
         -------
         None
         """
+        self._maybe_copy_on_write()
         self.values[locs] = values
 
     def delete(self, loc):
@@ -769,7 +774,107 @@ class Block(PandasObject):
         values = self.values
         if deep:
             values = values.copy()
-        return self.make_block_same_class(values)
+        block = self.make_block_same_class(values)
+        if not deep:
+            self._add_view(block)
+        return block
+
+    def copy_on_write(self, mgr=None):
+        """
+        copy constructor for ``mode.copy_on_write``: the new block shares
+        read-only values with self until either of them is modified in place
+        """
+        if type(self.values) is not np.ndarray:
+            return self.copy(deep=True)
+
+        refs = getattr(self, '_refs', None)
+        if refs is None:
+            if self.values.base is not None or self._has_views():
+                # the values are a view on memory that another array may
+                # write to, or views on them may be written to
+                return self.copy(deep=True)
+            refs = weakref.WeakSet([self])
+            self._refs = refs
+            self._views = None
+        if self.values.flags.writeable:
+            self.values = self.values.view()
+            self.values.flags.writeable = False
+
+        block = self.make_block_same_class(self.values.view())
+        block._refs = refs
+        refs.add(block)
+        return block
+
+    def _add_view(self, view):
+        """
+        record ``view``, a block or an array created as a view on the values,
+        so that the values are not shared while it may write to them
+        """
+        refs = getattr(self, '_refs', None)
+        if refs is not None:
+            if isinstance(view, Block):
+                # a view on shared values shares them as well
+                view._refs = refs
+                refs.add(view)
+            return
+
+        views = [ref for ref in getattr(self, '_views', None) or []
+                 if ref() is not None]
+        views.append(weakref.ref(view))
+        self._views = views
+
+    def _has_views(self):
+        """ whether a view on the values may still write to them """
+        for ref in getattr(self, '_views', None) or []:
+            view = ref()
+            if isinstance(view, Block):
+                view = view.values
+            if (isinstance(view, np.ndarray) and view.flags.writeable and
+                    np.may_share_memory(view, self.values)):
+                return True
+        return False
+
+    def _maybe_copy_on_write(self):
+        """
+        make the values safe to modify in place, copying them if they are
+        shared with other blocks
+
+        Returns
+        -------
+        boolean, whether the values were replaced
+        """
+        refs = getattr(self, '_refs', None)
+        if refs is not None:
+            refs.discard(self)
+            self._refs = None
+            if not len(refs):
+                # the blocks sharing our values were garbage collected; a
+                # new writeable array leaves the read-only arrays handed out
+                # before read-only
+                values = self.values
+                base = values.base
+                if (isinstance(base, np.ndarray) and base.flags.writeable and
+                        base.shape == values.shape and
+                        base.strides == values.strides and
+                        base.ctypes.data == values.ctypes.data):
+                    self.values = base
+                    return True
+                try:
+                    values = values.view()
+                    values.flags.writeable = True
+                    self.values = values
+                    return True
+                except ValueError:
+                    pass
+            self.values = self.values.copy()
+            return True
+        elif (isinstance(self.values, np.ndarray) and
+              not self.values.flags.writeable and
+              get_option('mode.copy_on_write')):
+            # a view on the values of a block holding shared values
+            self.values = self.values.copy()
+            return True
+        return False
 
     def replace(self, to_replace, value, inplace=False, filter=None,
                 regex=False, convert=True, mgr=None):
@@ -822,6 +927,7 @@ class Block(PandasObject):
                 value = np.nan
 
         # coerce if block dtype can store value
+        self._maybe_copy_on_write()
         values = self.values
         try:
             values, _, value, _ = self._try_coerce_args(values, value)
@@ -961,6 +1067,8 @@ class Block(PandasObject):
         a list of new blocks, the result of the putmask
         """
 
+        if inplace:
+            self._maybe_copy_on_write()
         new_values = self.values if inplace else self.values.copy()
 
         new = getattr(new, 'values', new)
@@ -1178,6 +1286,8 @@ class Block(PandasObject):
                 else:
                     return [self.copy()]
 
+        if inplace:
+            self._maybe_copy_on_write()
         values = self.values if inplace else self.values.copy()
         values, _, fill_value, _ = self._try_coerce_args(values, fill_value)
         values = missing.interpolate_2d(values, method=method, axis=axis,
@@ -1792,6 +1902,8 @@ class NonConsolidatableMixIn(object):
 
         # use block's copy logic.
         # .values may be an Index which does shallow copy by default
+        if inplace:
+            self._maybe_copy_on_write()
         new_values = self.values if inplace else self.copy().values
         new_values, _, new, _ = self._try_coerce_args(new_values, new)
 
@@ -2289,6 +2401,7 @@ class ObjectBlock(Block):
                     return
             except:
                 pass
+        self._maybe_copy_on_write()
         try:
             self.values[locs] = values
         except (ValueError):
@@ -2414,6 +2527,8 @@ class ObjectBlock(Block):
                                                     filter=filter, regex=regex,
                                                     mgr=mgr)
 
+        if inplace:
+            self._maybe_copy_on_write()
         new_values = self.values if inplace else self.values.copy()
 
         # deal with replacing values with objects (strings) that match but
@@ -2702,6 +2817,7 @@ class DatetimeBlock(DatetimeLikeBlockMixin, Block):
             # Workaround for numpy 1.6 bug
             values = conversion.ensure_datetime64ns(values)
 
+        self._maybe_copy_on_write()
         self.values[locs] = values
 
 
@@ -3803,9 +3919,25 @@ class BlockManager(PandasObject):
             new_axes = [copy(ax) for ax in self.axes]
         else:
             new_axes = list(self.axes)
+        if deep is True and get_option('mode.copy_on_write'):
+            return self.apply('copy_on_write', axes=new_axes,
+                              do_integrity_check=False)
         return self.apply('copy', axes=new_axes, deep=deep,
                           do_integrity_check=False)
 
+    def _maybe_copy_on_write(self):
+        """
+        make the values of all blocks safe to modify in place
+
+        Returns
+        -------
+        boolean, whether the values of any block were replaced
+        """
+        replaced = False
+        for blk in self.blocks:
+            replaced = blk._maybe_copy_on_write() or replaced
+        return replaced
+
     def as_array(self, transpose=False, items=None):
         """Convert the blockmanager data into an numpy array.
 
@@ -3946,7 +4078,10 @@ class BlockManager(PandasObject):
         single block
         """
         if len(self.blocks) == 1:
-            return self.blocks[0].iget((slice(None), loc))
+            result = self.blocks[0].iget((slice(None), loc))
+            if isinstance(result, np.ndarray):
+                self.blocks[0]._add_view(result)
+            return result
 
         items = self.items
 
@@ -4033,11 +4168,10 @@ class BlockManager(PandasObject):
             return values
 
         # fastpath shortcut for select a single-dim from a 2-dim BM
-        return SingleBlockManager(
-            [block.make_block_same_class(values,
-                                         placement=slice(0, len(values)),
-                                         ndim=1)],
-            self.axes[1])
+        new_block = block.make_block_same_class(
+            values, placement=slice(0, len(values)), ndim=1)
+        block._add_view(new_block)
+        return SingleBlockManager([new_block], self.axes[1])
 
     def get_scalar(self, tup):
         """
@@ -4587,8 +4721,10 @@ class SingleBlockManager(BlockManager):
         if axis >= self.ndim:
             raise IndexError("Requested axis not found in manager")
 
-        return self.__class__(self._block._slice(slobj),
-                              self.index[slobj], fastpath=True)
+        mgr = self.__class__(self._block._slice(slobj),
+                             self.index[slobj], fastpath=True)
+        self._block._add_view(mgr._block)
+        return mgr
 
     @property
     def index(self):
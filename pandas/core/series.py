@@ -430,6 +430,15 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
                '2013-01-03T05:00:00.000000000'], dtype='datetime64[ns]')
 
         """
+        if get_option('mode.copy_on_write'):
+            # the array may be written to, so it must not write to shared
+            # data, nor be shared later on
+            self._data._maybe_copy_on_write()
+            values = self._data.external_values()
+            if isinstance(values, np.ndarray):
+                values = values.view()
+                self._data._block._add_view(values)
+            return values
         return self._data.external_values()
 
     @property
@@ -841,6 +850,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
 
         # do the setitem
         cacher_needs_updating = self._check_is_chained_assignment_possible()
+        self._data._maybe_copy_on_write()
         setitem(key, value)
         if cacher_needs_updating:
             self._maybe_update_cacher()
@@ -976,6 +986,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
         return self._set_value(label, value, takeable=takeable)
 
     def _set_value(self, label, value, takeable=False):
+        self._data._maybe_copy_on_write()
         try:
             if takeable:
                 self._values[label] = value
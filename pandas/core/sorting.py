@@ -361,6 +361,54 @@ def compress_group_index(group_index, sort=True):
     return comp_ids, obs_group_ids
 
 
+def get_hashed_group_index(keys):
+    """
+    Label the rows of several keys by their combination, in order of first
+    appearance, by hashing the composite keys directly.
+
+    Unlike ``get_group_index`` this needs neither the labels of each key nor
+    offsets into the cartesian product of their sizes: the keys are hashed
+    with ``hash_array``, the hashes are combined per row and factorized once.
+    Rows where any key is null are labelled -1.
+
+    Parameters
+    ----------
+    keys : list of 1-d ndarrays of equal length
+
+    Returns
+    -------
+    tuple of (comp_ids, obs_rows), the group of each row and the position of
+    the first row of each group, or None if two different keys share a hash
+    """
+    from pandas.core.dtypes.missing import array_equivalent
+    from pandas.core.util.hashing import hash_array, _combine_hash_arrays
+
+    mask = isna(keys[0])
+    for key in keys[1:]:
+        mask |= isna(key)
+    if mask.any():
+        keys = [key[~mask] for key in keys]
+
+    hashes = _combine_hash_arrays((hash_array(key) for key in keys),
+                                  len(keys))
+    labels, _ = algorithms.factorize(hashes, sort=False)
+    labels = _ensure_int64(labels)
+    obs_rows = unique_label_indices(labels)
+
+    # distinct keys hashing to the same value would be merged into a
+    # single group, check each row against the first row of its group
+    rows = obs_rows.take(labels)
+    if not all(array_equivalent(key, key.take(rows)) for key in keys):
+        return None
+
+    if mask.any():
+        comp_ids = np.empty(len(mask), dtype=np.int64)
+        comp_ids.fill(-1)
+        comp_ids[~mask] = labels
+        return comp_ids, np.flatnonzero(~mask).take(obs_rows)
+    return labels, obs_rows
+
+
 def _reorder_by_uniques(uniques, labels):
     # sorter is index where elements ought to go
     sorter = uniques.argsort()
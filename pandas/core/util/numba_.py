@@ -0,0 +1,125 @@
+"""
+compile user defined functions with numba for ``engine='numba'``
+"""
+from collections import OrderedDict
+
+import numpy as np
+
+# compiled loops, keyed on the user function and the kind of loop; numba
+# specializes each of them on the dtypes it is called with. A loop keeps
+# its user function alive, so only the most recently used are kept
+_numba_cache = OrderedDict()
+_NUMBA_CACHE_SIZE = 128
+
+
+def _import_numba():
+    try:
+        import numba
+    except ImportError:
+        raise ImportError("engine='numba' requires numba to be installed")
+    return numba
+
+
+def validate_engine(engine, kwargs):
+    """
+    Check the ``engine`` argument, returning True for numba
+    """
+    if engine not in ['cython', 'numba']:
+        raise ValueError("engine must be either 'numba' or 'cython'")
+    if engine == 'numba' and kwargs:
+        raise ValueError("numba does not support keyword arguments, pass "
+                         "them positionally with 'args'")
+    return engine == 'numba'
+
+
+def jit_user_function(func):
+    """
+    Compile ``func`` in nopython mode, unless it is already jitted
+    """
+    numba = _import_numba()
+    if hasattr(func, 'py_func'):
+        return func
+    return numba.jit(func, nopython=True, nogil=True)
+
+
+def _get_loop(func, kind, make_loop):
+    key = (func, kind)
+    loop = _numba_cache.pop(key, None)
+    if loop is None:
+        numba = _import_numba()
+        loop = make_loop(numba, jit_user_function(func))
+        while len(_numba_cache) >= _NUMBA_CACHE_SIZE:
+            _numba_cache.popitem(last=False)
+    _numba_cache[key] = loop
+    return loop
+
+
+def _make_window_loop(numba, func):
+
+    @numba.jit(nopython=True, nogil=True)
+    def loop(values, begin, end, minp, args):
+        result = np.empty(len(begin))
+        for i in range(len(begin)):
+            window = values[begin[i]:end[i]]
+            count = 0
+            for val in window:
+                if np.isfinite(val):
+                    count += 1
+            if count >= minp:
+                result[i] = func(window, *args)
+            else:
+                result[i] = np.nan
+        return result
+
+    return loop
+
+
+def _make_group_agg_loop(numba, func):
+
+    @numba.jit(nopython=True, nogil=True)
+    def loop(values, begin, end, args):
+        result = np.empty(len(begin))
+        for i in range(len(begin)):
+            result[i] = func(values[begin[i]:end[i]], *args)
+        return result
+
+    return loop
+
+
+def _make_group_transform_loop(numba, func):
+
+    @numba.jit(nopython=True, nogil=True)
+    def loop(values, begin, end, args):
+        result = np.full(len(values), np.nan)
+        for i in range(len(begin)):
+            result[begin[i]:end[i]] = func(values[begin[i]:end[i]], *args)
+        return result
+
+    return loop
+
+
+def roll_apply(func, values, begin, end, minp, args):
+    """
+    Apply ``func`` to the windows ``values[begin[i]:end[i]]`` which have at
+    least ``minp`` finite observations, NaN elsewhere
+    """
+    loop = _get_loop(func, 'window', _make_window_loop)
+    return loop(values, begin, end, minp, tuple(args))
+
+
+def group_aggregate(func, values, begin, end, args):
+    """
+    Reduce each group ``values[begin[i]:end[i]]`` of sorted values with
+    ``func``
+    """
+    loop = _get_loop(func, 'group_agg', _make_group_agg_loop)
+    return loop(values, begin, end, tuple(args))
+
+
+def group_transform(func, values, begin, end, args):
+    """
+    Transform each group ``values[begin[i]:end[i]]`` of sorted values with
+    ``func``, which returns a scalar or an array of the group's length
+    """
+    loop = _get_loop(func, 'group_transform', _make_group_transform_loop)
+    return loop(values, begin, end, tuple(args))
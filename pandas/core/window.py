@@ -28,12 +28,15 @@ from pandas.core.dtypes.common import (
     is_timedelta64_dtype,
     is_list_like,
     _ensure_float64,
+    _ensure_int64,
     is_scalar)
 
 from pandas.core.base import (PandasObject, SelectionMixin,
                               GroupByMixin)
 import pandas.core.common as com
 import pandas._libs.window as _window
+from pandas.core.config import get_option
+import pandas.core.util.numba_ as numba_
 
 from pandas import compat
 from pandas.compat.numpy import function as nv
@@ -62,6 +65,10 @@ class _Window(PandasObject, SelectionMixin):
                    'axis', 'on', 'closed']
     exclusions = set()
 
+    # a cython WindowIndexer passed to the rolling functions instead of
+    # the index
+    _window_indexer = None
+
     def __init__(self, obj, window=None, min_periods=None,
                  center=False, win_type=None, axis=0, on=None, closed=None,
                  **kwargs):
@@ -190,6 +197,9 @@ class _Window(PandasObject, SelectionMixin):
         tuple of (index, index_as_ndarray)
         """
 
+        if self._window_indexer is not None:
+            # the window bounds were computed beforehand
+            return index, self._window_indexer
         if self.is_freq_type:
             if index is None:
                 index = self._on
@@ -670,12 +680,19 @@ class _GroupByMixin(GroupByMixin):
     corr = GroupByMixin._dispatch('corr', other=None, pairwise=None)
     cov = GroupByMixin._dispatch('cov', other=None, pairwise=None)
 
+    def _apply_quantiles(self, quantiles, **kwargs):
+        return self._apply(None, 'quantile', quantile=quantiles, **kwargs)
+
     def _apply(self, func, name, window=None, center=None,
                check_minp=None, **kwargs):
         """
         dispatch to apply; we are stripping all of the _apply kwargs and
         performing the original function call on the grouped object
         """
+        result = self._apply_sorted(func, name, check_minp=check_minp,
+                                    **kwargs)
+        if result is not None:
+            return result
 
         def f(x, name=name, *args):
             x = self._shallow_copy(x)
@@ -687,6 +704,91 @@ class _GroupByMixin(GroupByMixin):
 
         return self._groupby.apply(f)
 
+    def _apply_sorted(self, func, name, check_minp=None, **kwargs):
+        """
+        Roll the cython function ``func`` a single time over the object
+        sorted by group, instead of once per group.
+
+        The bounds of the windows of every group are computed by a
+        GroupedWindowIndexer, which the rolling functions take in place of
+        the index.
+
+        Returns
+        -------
+        the result of the groupby apply, or None if the groups must be
+        rolled one at a time
+        """
+        from pandas import MultiIndex
+        from pandas.core.sorting import get_group_index_sorter
+
+        groupby = self._groupby
+        if (not isinstance(func, compat.string_types) or self.center or
+                self.on is not None or self.axis != 0 or groupby.axis != 0 or
+                not groupby.group_keys or not groupby.as_index or
+                self.win_type not in [None, 'freq']):
+            return None
+
+        # a window open on the right may start past the end of the
+        # previous one, from which the median would delete values it never
+        # added
+        if func == 'roll_median_c' and self.closed in ['left', 'neither']:
+            return None
+
+        obj = groupby._selected_obj
+        ids, _, ngroups = groupby.grouper.group_info
+        indexer = get_group_index_sorter(ids, ngroups)
+        indexer = indexer[ids.take(indexer) != -1]
+        if not len(indexer):
+            return None
+        ids = _ensure_int64(ids.take(indexer))
+
+        index = None
+        if self.is_freq_type:
+            if (not needs_i8_conversion(obj.index.dtype) or
+                    obj.index.hasnans):
+                return None
+            index = obj.index.asi8.take(indexer)
+            if (np.diff(index)[np.diff(ids) == 0] < 0).any():
+                # not monotonic within a group
+                return None
+            window = int(self.window)
+        elif isinstance(self, Expanding):
+            if self.min_periods is None:
+                return None
+            sizes = np.bincount(ids)
+            sizes = sizes[sizes > 0]
+            window = max(int(sizes.max()), self.min_periods)
+        else:
+            window = int(self.window)
+        if window <= 0:
+            return None
+
+        if func in _moments:
+            minp = _use_window(self.min_periods, window)
+        else:
+            minp = (check_minp or _use_window)(self.min_periods, window)
+        if (isinstance(self, Expanding) and
+                minp > max(int(sizes.min()), self.min_periods)):
+            # the window of a small group is checked against the minimum
+            # periods on its own
+            return None
+
+        window_indexer = _window.GroupedWindowIndexer(
+            ids, window, minp, index, self.closed)
+        rolling = Rolling(obj.take(indexer), window=window, min_periods=minp,
+                          _window_indexer=window_indexer)
+        result = rolling._apply(func, name, check_minp=lambda p, w: minp,
+                                **kwargs)
+
+        # index the result like the concatenated groups
+        keys = groupby.grouper.result_index.take(ids)
+        index = obj.index.take(indexer)
+        result.index = MultiIndex.from_arrays(
+            [keys.get_level_values(i) for i in range(keys.nlevels)] +
+            [index.get_level_values(i) for i in range(index.nlevels)],
+            names=list(groupby.grouper.names) + list(index.names))
+        return result
+
 
 class _Rolling(_Window):
 
@@ -721,6 +823,12 @@ class _Rolling(_Window):
         if check_minp is None:
             check_minp = _use_window
 
+        if isinstance(func, compat.string_types) and func in _moments:
+            return self._apply_moments([_moments[func]], window=window,
+                                       center=center, **kwargs)[0]
+        threaded = (isinstance(name, compat.string_types) and
+                    name in self._threaded_names)
+
         blocks, obj, index = self._create_blocks()
         index, indexi = self._get_index(index=index)
         results = []
@@ -764,8 +872,14 @@ class _Rolling(_Window):
                     return func(x, window, min_periods=self.min_periods,
                                 closed=self.closed)
 
+            num_threads = 1
+            if threaded and values.ndim > 1:
+                num_threads = self._get_num_threads(values)
+
             with np.errstate(all='ignore'):
-                if values.ndim > 1:
+                if num_threads > 1:
+                    result = self._apply_threaded(calc, values, num_threads)
+                elif values.ndim > 1:
                     result = np.apply_along_axis(calc, self.axis, values)
                 else:
                     result = calc(values)
@@ -777,9 +891,164 @@ class _Rolling(_Window):
 
         return self._wrap_results(results, blocks, obj)
 
+    # the functions whose kernels release the GIL over a whole column
+    _threaded_names = ['median', 'quantile', 'rank', 'skew', 'kurt', 'max',
+                       'min']
+
+    def _get_num_threads(self, values):
+        """
+        Number of columns of the 2-D ``values`` to roll concurrently, 1 if
+        they should be rolled serially
+        """
+        num_threads = get_option('compute.window_threads')
+        return max(min(num_threads, values.shape[1 - self.axis]), 1)
+
+    def _apply_threaded(self, calc, values, num_threads):
+        """
+        Apply ``calc`` along the axis of the 2-D ``values`` like
+        ``np.apply_along_axis``, rolling the 1-D slices in a pool of
+        ``num_threads`` threads.
+        """
+        from multiprocessing.pool import ThreadPool
+
+        def _calc(x):
+            with np.errstate(all='ignore'):
+                return calc(x)
+
+        slices = list(values.T if self.axis == 0 else values)
+        pool = ThreadPool(processes=num_threads)
+        try:
+            result = np.array(pool.map(_calc, slices))
+        finally:
+            pool.close()
+            pool.join()
+        return result.T if self.axis == 0 else result
+
+    def _apply_moments(self, stats, window=None, center=None, ddof=1):
+        """
+        Rolling sum, mean, var and std. Each block is rolled in a single
+        pass computing all of ``stats`` for all of its columns, the window
+        bounds being computed once and the running sums being shared.
+
+        Parameters
+        ----------
+        stats : list of {'sum', 'mean', 'var', 'std'}
+        window : int/array, default to _get_window()
+        center : boolean, default to self.center
+        ddof : int, default 1
+
+        Returns
+        -------
+        list of the results of the stats, each of the type of input
+        """
+        if center is None:
+            center = self.center
+        if window is None:
+            window = self._get_window()
+        minp = _use_window(self.min_periods, window)
+
+        blocks, obj, index = self._create_blocks()
+        index, indexi = self._get_index(index=index)
+        results = [[] for _ in stats]
+        for b in blocks:
+            try:
+                values = self._prep_values(b.values)
+            except TypeError:
+                for stat_results in results:
+                    stat_results.append(b.values.copy())
+                continue
+
+            if values.size == 0:
+                for stat_results in results:
+                    stat_results.append(values.copy())
+                continue
+
+            # roll down the rows of a 2-D array
+            if values.ndim == 1:
+                arr = values.reshape(-1, 1)
+            elif self.axis == 1:
+                arr = values.T
+            else:
+                arr = values
+            if center:
+                offset = _offset(window, center)
+                additional_nans = np.empty((offset, arr.shape[1]))
+                additional_nans.fill(np.NaN)
+                arr = np.concatenate((arr, additional_nans))
+
+            with np.errstate(all='ignore'):
+                out_sum, out_mean, out_var = _window.roll_moments_2d(
+                    np.ascontiguousarray(arr), window, minp, indexi,
+                    self.closed, 'sum' in stats, 'mean' in stats,
+                    'var' in stats or 'std' in stats, ddof)
+            outputs = {'sum': out_sum, 'mean': out_mean, 'var': out_var}
+
+            for stat, stat_results in zip(stats, results):
+                if stat == 'std':
+                    result = _zsqrt(out_var)
+                else:
+                    result = outputs[stat]
+
+                if values.ndim == 1:
+                    result = result.ravel()
+                elif self.axis == 1:
+                    result = result.T
+                if center:
+                    result = self._center_window(result, window)
+
+                stat_results.append(result)
+
+        return [self._wrap_results(stat_results, blocks, obj)
+                for stat_results in results]
+
 
 class _Rolling_and_Expanding(_Rolling):
 
+    def aggregate(self, arg, *args, **kwargs):
+        result = self._aggregate_moments(arg, *args, **kwargs)
+        if result is None:
+            result = super(_Rolling_and_Expanding, self).aggregate(
+                arg, *args, **kwargs)
+        return result
+
+    def _aggregate_moments(self, arg, *args, **kwargs):
+        """
+        Aggregate a list of sum, mean, var and std in a single pass over
+        the blocks, returning None if ``arg`` isn't such a list.
+        """
+        from pandas import concat, MultiIndex
+
+        if (args or kwargs or not isinstance(arg, list) or not arg or
+                isinstance(self, _GroupByMixin) or self.on is not None or
+                self.axis != 0):
+            return None
+        stats = [self._is_cython_func(func) if callable(func) else func
+                 for func in arg]
+        if (not all(isinstance(stat, compat.string_types) and
+                    stat in _moments.values() for stat in stats) or
+                len(set(stats)) != len(stats)):
+            return None
+        keys = [com._get_callable_name(func) or func for func in arg]
+
+        obj = self._selected_obj
+        if obj.ndim == 1:
+            dtypes = [obj.dtype]
+        else:
+            if not len(obj.columns) or not obj.columns.is_unique:
+                return None
+            dtypes = obj.dtypes
+        if not all(is_float_dtype(dtype) or is_integer_dtype(dtype)
+                   for dtype in dtypes):
+            return None
+
+        # laid out as aggregating each column with arg would
+        result = concat(self._apply_moments(stats), keys=keys, axis=1)
+        if obj.ndim == 1:
+            return result
+        columns = MultiIndex.from_product([obj.columns, keys],
+                                          names=[None, None])
+        return result.swaplevel(0, 1, axis=1).reindex(columns=columns)
+
     _shared_docs['count'] = """%(name)s count of number of non-NaN
     observations inside provided window."""
 
@@ -808,21 +1077,39 @@ class _Rolling_and_Expanding(_Rolling):
     ----------
     func : function
         Must produce a single value from an ndarray input
-        \*args and \*\*kwargs are passed to the function""")
+        \*args and \*\*kwargs are passed to the function
+    engine : {'cython', 'numba'}, default 'cython'
+        With 'numba', ``func`` is compiled once in nopython mode and applied
+        to the windows in a compiled loop. This requires numba, and ``func``
+        must accept a float64 ndarray and only take extra positional
+        ``args``.
+
+        .. versionadded:: 0.23.0""")
 
-    def apply(self, func, args=(), kwargs={}):
+    def apply(self, func, args=(), kwargs={}, engine='cython'):
         # TODO: _level is unused?
         _level = kwargs.pop('_level', None)  # noqa
         window = self._get_window()
         offset = _offset(window, self.center)
         index, indexi = self._get_index()
 
-        def f(arg, window, min_periods, closed):
-            minp = _use_window(min_periods, window)
-            return _window.roll_generic(arg, window, minp, indexi, closed,
-                                        offset, func, args, kwargs)
+        if numba_.validate_engine(engine, kwargs):
+
+            def f(arg, window, min_periods, closed):
+                minp = _use_window(min_periods, window)
+                begin, end = _get_window_bounds(len(arg), window, offset,
+                                                indexi, closed)
+                return numba_.roll_apply(func, _ensure_float64(arg), begin,
+                                         end, minp, args)
+        else:
 
-        return self._apply(f, func, args=args, kwargs=kwargs,
+            def f(arg, window, min_periods, closed):
+                minp = _use_window(min_periods, window)
+                return _window.roll_generic(arg, window, minp, indexi,
+                                            closed, offset, func, args,
+                                            kwargs)
+
+        return self._apply(f, func, args=args, kwargs=kwargs, engine=engine,
                            center=False)
 
     def sum(self, *args, **kwargs):
@@ -867,16 +1154,9 @@ class _Rolling_and_Expanding(_Rolling):
 
     def std(self, ddof=1, *args, **kwargs):
         nv.validate_window_func('std', args, kwargs)
-        window = self._get_window()
-        index, indexi = self._get_index()
-
-        def f(arg, *args, **kwargs):
-            minp = _require_min_periods(1)(self.min_periods, window)
-            return _zsqrt(_window.roll_var(arg, window, minp, indexi,
-                                           self.closed, ddof))
-
-        return self._apply(f, 'std', check_minp=_require_min_periods(1),
-                           ddof=ddof, **kwargs)
+        return self._apply('roll_std', 'std',
+                           check_minp=_require_min_periods(1), ddof=ddof,
+                           **kwargs)
 
     _shared_docs['var'] = dedent("""
     %(name)s variance
@@ -910,10 +1190,15 @@ class _Rolling_and_Expanding(_Rolling):
 
     Parameters
     ----------
-    quantile : float
-        0 <= quantile <= 1""")
+    quantile : float or list of floats
+        0 <= quantile <= 1. A list of quantiles is computed in a single
+        pass, returning a DataFrame with a column per quantile, or per
+        column and quantile for a DataFrame.""")
 
     def quantile(self, quantile, **kwargs):
+        if is_list_like(quantile):
+            return self._apply_quantiles(list(quantile), **kwargs)
+
         window = self._get_window()
         index, indexi = self._get_index()
 
@@ -932,6 +1217,113 @@ class _Rolling_and_Expanding(_Rolling):
         return self._apply(f, 'quantile', quantile=quantile,
                            **kwargs)
 
+    def _apply_quantiles(self, quantiles, **kwargs):
+        """
+        Rolling quantiles, all of ``quantiles`` being read from the same
+        skip list of each column.
+
+        Returns
+        -------
+        DataFrame with a column per quantile, or per column and quantile if
+        the input is a DataFrame
+        """
+        from pandas import concat
+
+        if self.axis != 0:
+            raise NotImplementedError("a list of quantiles is only "
+                                      "implemented for axis=0")
+        window = self._get_window()
+        minp = _use_window(self.min_periods, window)
+        blocks, obj, index = self._create_blocks()
+        index, indexi = self._get_index(index=index)
+        offset = _offset(window, self.center)
+        additional_nans = np.array([np.NaN] * offset)
+        nq = len(quantiles)
+
+        def calc(x):
+            if self.center:
+                x = np.concatenate((x, additional_nans))
+            with np.errstate(all='ignore'):
+                result = _window.roll_quantiles(
+                    x, window, minp, indexi, self.closed,
+                    np.asarray(quantiles, dtype=np.float64))
+            if self.center:
+                result = self._center_window(result, window)
+            return result
+
+        # results[k] holds the results of quantiles[k] for every block
+        results = [[] for _ in range(nq)]
+        for b in blocks:
+            try:
+                values = self._prep_values(b.values)
+            except TypeError:
+                for res in results:
+                    res.append(b.values.copy())
+                continue
+
+            if values.size == 0:
+                for res in results:
+                    res.append(values.copy())
+                continue
+
+            if values.ndim == 1:
+                result = calc(values)
+                for k, res in enumerate(results):
+                    res.append(result[:, k])
+            else:
+                result = [calc(values[:, j]) for j in range(values.shape[1])]
+                for k, res in enumerate(results):
+                    res.append(np.column_stack([r[:, k] for r in result]))
+
+        # wrap each quantile like a single quantile, which passes through
+        # the columns that cannot be rolled and puts back the on column
+        result = concat([self._wrap_results(res, blocks, obj)
+                         for res in results], keys=quantiles, axis=1)
+        if result.columns.nlevels == 1:
+            return result
+
+        ncols = len(result.columns) // nq
+        result.columns = result.columns.swaplevel(0, 1)
+        indexer = np.arange(nq * ncols).reshape(nq, ncols).T.ravel()
+        return result.take(indexer, axis=1)
+
+    _shared_docs['rank'] = dedent("""
+    %(name)s rank of each value among the values of its window
+
+    .. versionadded:: 0.23.0
+
+    Parameters
+    ----------
+    method : {'average', 'min', 'max'}, default 'average'
+        How to rank the values tied with the value:
+
+        * average: average rank of the tied values
+        * min: lowest rank of the tied values
+        * max: highest rank of the tied values
+    ascending : boolean, default True
+        Whether the values are ranked in ascending order.
+    pct : boolean, default False
+        Whether to divide the ranks by the number of observations in the
+        window.""")
+
+    def rank(self, method='average', ascending=True, pct=False, **kwargs):
+        if self.center:
+            raise NotImplementedError("rank is not implemented for "
+                                      "center=True")
+        if self.closed in ['left', 'neither']:
+            raise NotImplementedError("rank is only implemented for "
+                                      "windows closed on the right")
+        window = self._get_window()
+        index, indexi = self._get_index()
+
+        def f(arg, *args, **kwargs):
+            minp = _use_window(self.min_periods, window)
+            return _window.roll_rank(arg, window, minp, indexi, self.closed,
+                                     method, ascending, pct)
+
+        return self._apply(f, 'rank', method=method, ascending=ascending,
+                           pct=pct, **kwargs)
+
     _shared_docs['cov'] = dedent("""
     %(name)s sample covariance
 
@@ -1012,6 +1404,34 @@ class _Rolling_and_Expanding(_Rolling):
         return _flex_binary_moment(self._selected_obj, other._selected_obj,
                                    _get_corr, pairwise=bool(pairwise))
 
+    _shared_docs['online'] = dedent("""
+    %(name)s computation updated in place as new rows are appended
+
+    .. versionadded:: 0.23.0
+
+    The state of the computation is built from the rows of the object,
+    then each call to ``update`` with the next rows returns the results
+    for those rows only, identical to the tail of the batch computation
+    over all the rows.
+
+    Parameters
+    ----------
+    func : {'sum', 'mean', 'var', 'std', 'median'}
+        The statistic to compute.
+    ddof : int, default 1
+        Delta Degrees of Freedom of ``var`` and ``std``.
+
+    Returns
+    -------
+    OnlineRolling
+
+    See also
+    --------
+    pandas.core.window.OnlineRolling.update""")
+
+    def online(self, func, ddof=1):
+        return OnlineRolling(self, func, ddof=ddof)
+
 
 class Rolling(_Rolling_and_Expanding):
 
@@ -1163,8 +1583,9 @@ class Rolling(_Rolling_and_Expanding):
     @Substitution(name='rolling')
     @Appender(_doc_template)
     @Appender(_shared_docs['apply'])
-    def apply(self, func, args=(), kwargs={}):
-        return super(Rolling, self).apply(func, args=args, kwargs=kwargs)
+    def apply(self, func, args=(), kwargs={}, engine='cython'):
+        return super(Rolling, self).apply(func, args=args, kwargs=kwargs,
+                                          engine=engine)
 
     @Substitution(name='rolling')
     @Appender(_doc_template)
@@ -1232,6 +1653,13 @@ class Rolling(_Rolling_and_Expanding):
     def quantile(self, quantile, **kwargs):
         return super(Rolling, self).quantile(quantile=quantile, **kwargs)
 
+    @Substitution(name='rolling')
+    @Appender(_doc_template)
+    @Appender(_shared_docs['rank'])
+    def rank(self, method='average', ascending=True, pct=False, **kwargs):
+        return super(Rolling, self).rank(method=method, ascending=ascending,
+                                         pct=pct, **kwargs)
+
     @Substitution(name='rolling')
     @Appender(_doc_template)
     @Appender(_shared_docs['cov'])
@@ -1246,6 +1674,11 @@ class Rolling(_Rolling_and_Expanding):
         return super(Rolling, self).corr(other=other, pairwise=pairwise,
                                          **kwargs)
 
+    @Substitution(name='rolling')
+    @Appender(_shared_docs['online'])
+    def online(self, func, ddof=1):
+        return super(Rolling, self).online(func, ddof=ddof)
+
 
 class RollingGroupby(_GroupByMixin, Rolling):
     """
@@ -1403,8 +1836,9 @@ class Expanding(_Rolling_and_Expanding):
     @Substitution(name='expanding')
     @Appender(_doc_template)
     @Appender(_shared_docs['apply'])
-    def apply(self, func, args=(), kwargs={}):
-        return super(Expanding, self).apply(func, args=args, kwargs=kwargs)
+    def apply(self, func, args=(), kwargs={}, engine='cython'):
+        return super(Expanding, self).apply(func, args=args, kwargs=kwargs,
+                                            engine=engine)
 
     @Substitution(name='expanding')
     @Appender(_doc_template)
@@ -1472,6 +1906,13 @@ class Expanding(_Rolling_and_Expanding):
     def quantile(self, quantile, **kwargs):
         return super(Expanding, self).quantile(quantile=quantile, **kwargs)
 
+    @Substitution(name='expanding')
+    @Appender(_doc_template)
+    @Appender(_shared_docs['rank'])
+    def rank(self, method='average', ascending=True, pct=False, **kwargs):
+        return super(Expanding, self).rank(method=method, ascending=ascending,
+                                           pct=pct, **kwargs)
+
     @Substitution(name='expanding')
     @Appender(_doc_template)
     @Appender(_shared_docs['cov'])
@@ -1486,6 +1927,11 @@ class Expanding(_Rolling_and_Expanding):
         return super(Expanding, self).corr(other=other, pairwise=pairwise,
                                            **kwargs)
 
+    @Substitution(name='expanding')
+    @Appender(_shared_docs['online'])
+    def online(self, func, ddof=1):
+        return super(Expanding, self).online(func, ddof=ddof)
+
 
 class ExpandingGroupby(_GroupByMixin, Expanding):
     """
@@ -1803,6 +2249,223 @@ class EWM(_Rolling):
         return _flex_binary_moment(self._selected_obj, other._selected_obj,
                                    _get_corr, pairwise=bool(pairwise))
 
+    def online(self):
+        """
+        exponential weighted moving average updated in place as new rows
+        are appended
+
+        .. versionadded:: 0.23.0
+
+        The state of the average is built from the rows of the object,
+        then each call to ``update`` with the next rows returns the
+        averages for those rows only, identical to the tail of ``mean``
+        over all the rows.
+
+        Returns
+        -------
+        OnlineEWM
+        """
+        return OnlineEWM(self)
+
+
+class _Online(object):
+    """
+    Base class of the window computations updated in place as new rows
+    are appended.
+
+    Parameters
+    ----------
+    parent : _Rolling
+        the window object whose rows build the initial state
+    """
+
+    def __init__(self, parent):
+        if isinstance(parent, _GroupByMixin):
+            raise NotImplementedError("online is not implemented for "
+                                      "groupby")
+        if parent.axis != 0:
+            raise NotImplementedError("online is only implemented for "
+                                      "axis=0")
+        obj = parent._selected_obj
+        self.ndim = obj.ndim
+        if self.ndim == 1:
+            self.name = obj.name
+            self.columns = None
+            self.ncols = 1
+        else:
+            self.name = None
+            self.columns = obj.columns
+            self.ncols = len(obj.columns)
+        self._prep_values = parent._prep_values
+
+    def _get_values(self, rows):
+        """ the float64 values of the new rows as a 2-D array """
+        if self.ndim == 1:
+            if not isinstance(rows, ABCSeries):
+                raise TypeError("new rows must be passed as a Series")
+        else:
+            if not isinstance(rows, ABCDataFrame):
+                raise TypeError("new rows must be passed as a DataFrame")
+            if not rows.columns.equals(self.columns):
+                raise ValueError("new rows must have the same columns")
+        values = self._prep_values(rows.values)
+        return values.reshape(len(rows), self.ncols)
+
+    def _wrap(self, result, rows):
+        """ wrap the 2-D results of the new rows like the new rows """
+        if self.ndim == 1:
+            return rows._constructor(result[:, 0], index=rows.index,
+                                     name=self.name)
+        return rows._constructor(result, index=rows.index,
+                                 columns=self.columns)
+
+    def update(self, rows):
+        """
+        Append new rows and return the results for those rows.
+
+        Parameters
+        ----------
+        rows : Series or DataFrame
+            the next rows, of the same type and with the same columns as
+            the object the computation was created from
+
+        Returns
+        -------
+        same type as input
+        """
+        return self._wrap(self._update(self._get_values(rows)), rows)
+
+
+class OnlineRolling(_Online):
+    """
+    Rolling or expanding sum, mean, var, std or median updated in place as
+    new rows are appended, see ``Rolling.online``.
+
+    .. versionadded:: 0.23.0
+    """
+
+    _funcs = ['sum', 'mean', 'var', 'std', 'median']
+
+    def __init__(self, parent, func, ddof=1):
+        super(OnlineRolling, self).__init__(parent)
+        if func not in self._funcs:
+            raise ValueError("func must be one of {funcs}"
+                             "".format(funcs=self._funcs))
+        if parent.center:
+            raise NotImplementedError("online is not implemented for "
+                                      "center=True")
+        if isinstance(parent, Expanding):
+            # an expanding window is a window that is never full
+            self.window = np.iinfo(np.int64).max
+            self.min_periods = (1 if parent.min_periods is None
+                                else parent.min_periods)
+        else:
+            if parent.win_type == 'freq' or parent.on is not None:
+                raise NotImplementedError("online is only implemented "
+                                          "for fixed windows")
+            self.window = parent.window
+            self.min_periods = _use_window(parent.min_periods, self.window)
+        self.func = func
+        self.ddof = ddof
+
+        if func == 'median':
+            size = min(self.window, 1024) or 1
+            self._states = [_window.MedianState(size)
+                            for _ in range(self.ncols)]
+        else:
+            self._state = _window.MomentsState(self.ncols)
+
+        # the rows of the window in a ring buffer, row j of all of the rows
+        # being at j % window, needed to remove them once the window is
+        # full; an expanding window never removes rows
+        self._nrows = 0
+        self._ring = None
+        if self.window < np.iinfo(np.int64).max:
+            self._ring = np.empty((0, self.ncols), dtype=np.float64)
+        self._update(self._get_values(parent._selected_obj))
+
+    def _get_removed(self, values):
+        """ the rows removed from the window by each of the new rows, only
+        meaningful once the window is full """
+        if self._ring is None:
+            return values
+
+        # the position in all of the rows of the row each new row removes
+        removed = np.empty_like(values)
+        pos = self._nrows - self.window + np.arange(len(values))
+        seen = (pos >= 0) & (pos < self._nrows)
+        removed[seen] = self._ring[pos[seen] % self.window]
+        new = pos >= self._nrows
+        removed[new] = values[pos[new] - self._nrows]
+        return removed
+
+    def _remember(self, values):
+        """ store the last rows of the window in the ring buffer """
+        n = len(values)
+        if self._ring is not None:
+            # the buffer grows up to the window size while the window
+            # fills, in which case row j is at j
+            size = min(self._nrows + n, self.window)
+            if len(self._ring) < size:
+                ring = np.empty((min(max(size, 2 * len(self._ring)),
+                                     self.window), self.ncols))
+                ring[:self._nrows] = self._ring[:self._nrows]
+                self._ring = ring
+            keep = min(n, self.window)
+            pos = self._nrows + np.arange(n - keep, n)
+            self._ring[pos % self.window] = values[n - keep:]
+        self._nrows += n
+
+    def _update(self, values):
+        values = np.ascontiguousarray(values)
+        removed = self._get_removed(values)
+
+        if self.func == 'median':
+            result = np.empty(values.shape)
+            for i, state in enumerate(self._states):
+                result[:, i] = _window.roll_median_online(
+                    np.ascontiguousarray(values[:, i]),
+                    np.ascontiguousarray(removed[:, i]), state,
+                    self.window, self.min_periods)
+        else:
+            stat = 'var' if self.func == 'std' else self.func
+            sums, means, variances = _window.roll_moments_online(
+                values, removed, self._state, self.window,
+                self.min_periods, stat == 'sum', stat == 'mean',
+                stat == 'var', self.ddof)
+            result = {'sum': sums, 'mean': means, 'var': variances}[stat]
+            if self.func == 'std':
+                result = _zsqrt(result)
+
+        self._remember(values)
+        return result
+
+
+class OnlineEWM(_Online):
+    """
+    Exponential weighted moving average updated in place as new rows are
+    appended, see ``EWM.online``.
+
+    .. versionadded:: 0.23.0
+    """
+
+    def __init__(self, parent):
+        super(OnlineEWM, self).__init__(parent)
+        self.com = parent.com
+        self.adjust = int(parent.adjust)
+        self.ignore_na = int(parent.ignore_na)
+        self.min_periods = int(parent.min_periods)
+        self._states = [_window.EWMAState() for _ in range(self.ncols)]
+        self._update(self._get_values(parent._selected_obj))
+
+    def _update(self, values):
+        result = np.empty(values.shape)
+        for i, state in enumerate(self._states):
+            result[:, i] = _window.ewma_online(
+                np.ascontiguousarray(values[:, i]), state, self.com,
+                self.adjust, self.ignore_na, self.min_periods)
+        return result
+
 # Helper Funcs
 
 
@@ -1950,6 +2613,11 @@ def _get_center_of_mass(comass, span, halflife, alpha):
     return float(comass)
 
 
+# the rolling functions computed together by roll_moments_2d
+_moments = {'roll_sum': 'sum', 'roll_mean': 'mean', 'roll_var': 'var',
+            'roll_std': 'std'}
+
+
 def _offset(window, center):
     if not is_integer(window):
         window = len(window)
@@ -1977,6 +2645,33 @@ def _use_window(minp, window):
         return minp
 
 
+def _get_window_bounds(N, window, offset, index, closed):
+    """
+    Return the bounds of the window of each of the ``N`` observations, the
+    same windows as used by roll_generic
+    """
+    if index is None:
+        end = np.arange(1, N + 1, dtype=np.int64) + offset
+        begin = np.maximum(end - window, 0)
+        return begin, np.minimum(end, N)
+
+    # variable window on a datetimelike index
+    if offset != 0:
+        raise ValueError("unable to roll_generic with a non-zero offset")
+    index = index[:N]
+    left_closed = closed in ['left', 'both']
+    right_closed = closed in [None, 'right', 'both']
+    begin = index.searchsorted(index - window,
+                               side='left' if left_closed else 'right')
+
+    # like the VariableWindowIndexer, a window ends at its own row, so that
+    # it holds the earlier rows with the same timestamp but not the later
+    positions = np.arange(N, dtype=np.int64)
+    begin = np.minimum(begin.astype(np.int64), positions)
+    end = positions + 1 if right_closed else positions
+    return begin, end
+
+
 def _zsqrt(x):
     with np.errstate(all='ignore'):
         result = np.sqrt(x)
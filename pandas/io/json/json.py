@@ -1,5 +1,6 @@
 # pylint: disable-msg=E1101,W0613,W0603
 from itertools import islice
+from multiprocessing.pool import ThreadPool
 import os
 import numpy as np
 
@@ -7,19 +8,26 @@ import pandas._libs.json as json
 from pandas._libs.tslib import iNaT
 from pandas.compat import StringIO, long, u, to_str
 from pandas import compat, isna
-from pandas import Series, DataFrame, to_datetime, MultiIndex
+from pandas import (Series, DataFrame, Index, to_datetime, to_timedelta,
+                    MultiIndex)
 from pandas.io.common import (get_filepath_or_buffer, _get_handle,
                               _infer_compression, _stringify_path,
                               BaseIterator)
 from pandas.io.parsers import _validate_integer
 import pandas.core.common as com
+from pandas.core.frame import _convert_object_array
 from pandas.core.reshape.concat import concat
 from pandas.io.formats.printing import pprint_thing
 from .normalize import _convert_to_line_delimits
-from .table_schema import build_table_schema, parse_table_schema
-from pandas.core.dtypes.common import is_period_dtype
+from .table_schema import (build_table_schema, parse_table_schema,
+                           convert_json_schema_to_pandas_types)
+from pandas.core.dtypes.common import (
+    is_period_dtype, is_numeric_dtype, is_bool_dtype, is_integer_dtype,
+    is_datetime64_dtype, is_datetime64tz_dtype, is_timedelta64_dtype)
+from pandas.core.dtypes.cast import construct_1d_object_array_from_listlike
 
 loads = json.loads
+loads_lines = json.loads_lines
 dumps = json.dumps
 
 TABLE_SCHEMA_VERSION = '0.20.0'
@@ -29,7 +37,7 @@ TABLE_SCHEMA_VERSION = '0.20.0'
 def to_json(path_or_buf, obj, orient=None, date_format='epoch',
             double_precision=10, force_ascii=True, date_unit='ms',
             default_handler=None, lines=False, compression=None,
-            index=True):
+            index=True, chunksize=None, num_threads=None):
 
     if not index and orient not in ['split', 'table']:
         raise ValueError("'index=False' is only valid when 'orient' is "
@@ -40,6 +48,13 @@ def to_json(path_or_buf, obj, orient=None, date_format='epoch',
         raise ValueError(
             "'lines' keyword only valid when 'orient' is records")
 
+    chunksize = _validate_integer('chunksize', chunksize, 1)
+    num_threads = _validate_integer('num_threads', num_threads, 1)
+    chunked = chunksize is not None or (num_threads or 1) > 1
+    if chunked and orient != 'records':
+        raise ValueError("'chunksize' and 'num_threads' are only valid "
+                         "when 'orient' is records")
+
     if orient == 'table' and isinstance(obj, Series):
         obj = obj.to_frame(name=obj.name or 'values')
     if orient == 'table' and isinstance(obj, DataFrame):
@@ -51,25 +66,94 @@ def to_json(path_or_buf, obj, orient=None, date_format='epoch',
     else:
         raise NotImplementedError("'obj' should be a Series or a DataFrame")
 
-    s = writer(
+    writer = writer(
         obj, orient=orient, date_format=date_format,
         double_precision=double_precision, ensure_ascii=force_ascii,
         date_unit=date_unit, default_handler=default_handler,
-        index=index).write()
+        index=index)
 
-    if lines:
-        s = _convert_to_line_delimits(s)
+    if chunked:
+        pieces = _write_chunks(writer, lines, chunksize, num_threads)
+    else:
+        s = writer.write()
+        if lines:
+            s = _convert_to_line_delimits(s)
+        pieces = [s]
 
     if isinstance(path_or_buf, compat.string_types):
         fh, handles = _get_handle(path_or_buf, 'w', compression=compression)
         try:
-            fh.write(s)
+            for s in pieces:
+                fh.write(s)
         finally:
             fh.close()
     elif path_or_buf is None:
-        return s
+        return ''.join(pieces)
     else:
-        path_or_buf.write(s)
+        for s in pieces:
+            path_or_buf.write(s)
+
+
+def _write_chunks(writer, lines, chunksize, num_threads):
+    """
+    Encode the rows of the object of a records ``writer`` in chunks of
+    ``chunksize`` rows, yielding the pieces of the output in order.
+
+    With ``num_threads`` the chunks are encoded ``num_threads`` at a time
+    in a thread pool, the next batch being encoded while the pieces of the
+    previous one are consumed. Only the line delimiting of the chunks runs
+    without the GIL, the encoder holds it throughout.
+    """
+    nrows = len(writer.obj)
+    num_threads = num_threads or 1
+    if chunksize is None:
+        chunksize = max(-(-nrows // num_threads), 1)
+
+    def _encode(chunk):
+        s = writer.write(chunk)
+        if lines:
+            return _convert_to_line_delimits(s)
+        # strip the brackets, the chunks are joined into a single list
+        return s[1:-1]
+
+    chunks = (writer.obj.iloc[start:start + chunksize]
+              for start in range(0, nrows, chunksize))
+    if num_threads == 1:
+        batches = ([_encode(chunk)] for chunk in chunks)
+    else:
+        batches = _encode_batches(_encode, chunks, num_threads)
+
+    sep = '\n' if lines else ','
+    if not lines:
+        yield '['
+    first = True
+    for batch in batches:
+        for s in batch:
+            if not first:
+                yield sep
+            first = False
+            yield s
+    if not lines:
+        yield ']'
+
+
+def _encode_batches(encode, chunks, num_threads):
+    """ encode the chunks ``num_threads`` at a time in a thread pool,
+    yielding the encoded batches in order """
+    pool = ThreadPool(processes=num_threads)
+    try:
+        pending = None
+        while True:
+            batch = list(islice(chunks, num_threads))
+            result = pool.map_async(encode, batch) if batch else None
+            if pending is not None:
+                yield pending.get()
+            if result is None:
+                break
+            pending = result
+    finally:
+        pool.close()
+        pool.join()
 
 
 class Writer(object):
@@ -95,8 +179,11 @@ class Writer(object):
     def _format_axes(self):
         raise com.AbstractMethodError(self)
 
-    def write(self):
-        return self._write(self.obj, self.orient, self.double_precision,
+    def write(self, obj=None):
+        """ the JSON of the object, or of ``obj``, a slice of its rows """
+        if obj is None:
+            obj = self.obj
+        return self._write(obj, self.orient, self.double_precision,
                            self.ensure_ascii, self.date_unit,
                            self.date_format == 'iso', self.default_handler)
 
@@ -224,7 +311,7 @@ class JSONTableWriter(FrameWriter):
 def read_json(path_or_buf=None, orient=None, typ='frame', dtype=True,
               convert_axes=True, convert_dates=True, keep_default_dates=True,
               numpy=False, precise_float=False, date_unit=None, encoding=None,
-              lines=False, chunksize=None, compression='infer'):
+              lines=False, chunksize=None, compression='infer', schema=None):
     """
     Convert a JSON string to pandas object
 
@@ -335,6 +422,16 @@ def read_json(path_or_buf=None, orient=None, typ='frame', dtype=True,
 
         .. versionadded:: 0.21.0
 
+    schema : dict, default None
+        The dtypes of the columns of a frame, either as a Table Schema (see
+        :func:`pandas.io.json.build_table_schema`) or as a dict of column
+        names to dtypes. The columns in the schema are converted to their
+        dtype directly, skipping the dtype and date inference of ``dtype``
+        and ``convert_dates``; a column that does not conform raises. Dates
+        given as epochs are read in ``date_unit``, milliseconds by default.
+
+        .. versionadded:: 0.23.0
+
     Returns
     -------
     result : Series or DataFrame, depending on the value of `typ`.
@@ -414,6 +511,7 @@ def read_json(path_or_buf=None, orient=None, typ='frame', dtype=True,
         keep_default_dates=keep_default_dates, numpy=numpy,
         precise_float=precise_float, date_unit=date_unit, encoding=encoding,
         lines=lines, chunksize=chunksize, compression=compression,
+        schema=schema,
     )
 
     if chunksize:
@@ -438,7 +536,8 @@ class JsonReader(BaseIterator):
     """
     def __init__(self, filepath_or_buffer, orient, typ, dtype, convert_axes,
                  convert_dates, keep_default_dates, numpy, precise_float,
-                 date_unit, encoding, lines, chunksize, compression):
+                 date_unit, encoding, lines, chunksize, compression,
+                 schema=None):
 
         self.path_or_buf = filepath_or_buffer
         self.orient = orient
@@ -462,6 +561,12 @@ class JsonReader(BaseIterator):
             if not self.lines:
                 raise ValueError("chunksize can only be passed if lines=True")
 
+        self.schema = None
+        if schema is not None:
+            if self.typ != 'frame':
+                raise ValueError("schema can only be passed if typ='frame'")
+            self.schema = convert_json_schema_to_pandas_types(schema)
+
         data = self._get_data_from_filepath(filepath_or_buffer)
         self.data = self._preprocess_data(data)
 
@@ -510,11 +615,6 @@ class JsonReader(BaseIterator):
 
         return data
 
-    def _combine_lines(self, lines):
-        """Combines a list of JSON objects into one JSON object"""
-        lines = filter(None, map(lambda x: x.strip(), lines))
-        return '[' + ','.join(lines) + ']'
-
     def read(self):
         """Read the whole JSON input into a pandas object"""
         if self.lines and self.chunksize:
@@ -522,16 +622,15 @@ class JsonReader(BaseIterator):
         elif self.lines:
 
             data = to_str(self.data)
-            obj = self._get_object_parser(
-                self._combine_lines(data.split('\n'))
-            )
+            obj = self._get_object_parser(data.split('\n'), lines=True)
         else:
             obj = self._get_object_parser(self.data)
         self.close()
         return obj
 
-    def _get_object_parser(self, json):
-        """parses a json document into a pandas object"""
+    def _get_object_parser(self, json, lines=False):
+        """parses a json document, or a list of json lines, into a pandas
+        object"""
         typ = self.typ
         dtype = self.dtype
         kwargs = {
@@ -539,7 +638,8 @@ class JsonReader(BaseIterator):
             "convert_axes": self.convert_axes,
             "convert_dates": self.convert_dates,
             "keep_default_dates": self.keep_default_dates, "numpy": self.numpy,
-            "precise_float": self.precise_float, "date_unit": self.date_unit
+            "precise_float": self.precise_float, "date_unit": self.date_unit,
+            "lines": lines, "schema": self.schema
         }
         obj = None
         if typ == 'frame':
@@ -566,8 +666,7 @@ class JsonReader(BaseIterator):
     def __next__(self):
         lines = list(islice(self.data, self.chunksize))
         if lines:
-            lines_json = self._combine_lines(lines)
-            obj = self._get_object_parser(lines_json)
+            obj = self._get_object_parser(lines, lines=True)
 
             # Make sure that the returned objects have the right index.
             obj.index = range(self.nrows_seen, self.nrows_seen + len(obj))
@@ -579,6 +678,41 @@ class JsonReader(BaseIterator):
         raise StopIteration
 
 
+def _combine_lines(lines):
+    """Combines a list of JSON objects into one JSON object"""
+    lines = filter(None, map(lambda x: x.strip(), lines))
+    return '[' + ','.join(lines) + ']'
+
+
+_SCHEMA_BOOLS = {'true': True, 'false': False}
+
+
+def _schema_bools(name, values):
+    """ the booleans of the values of a boolean column of the schema,
+    which must be booleans or the strings 'true' and 'false' """
+    result = np.empty(len(values), dtype=np.bool_)
+    for i, val in enumerate(values):
+        if isinstance(val, (bool, np.bool_)):
+            result[i] = val
+        elif isinstance(val, compat.string_types) and val in _SCHEMA_BOOLS:
+            result[i] = _SCHEMA_BOOLS[val]
+        else:
+            raise ValueError("cannot convert {val!r} of column '{name}' to "
+                             "bool, only booleans and 'true' or 'false' "
+                             "are accepted".format(val=val, name=name))
+    return result
+
+
+def _check_schema_integers(name, values, result):
+    """ raise if casting the floats ``values`` of a column of the schema to
+    the integers ``result`` truncated any of them """
+    if values.dtype.kind == 'f' and not (result == values).all():
+        raise ValueError("cannot safely cast non-equivalent {dtype} to "
+                         "{to_dtype} in column '{name}'".format(
+                             dtype=values.dtype, to_dtype=result.dtype,
+                             name=name))
+
+
 class Parser(object):
 
     _STAMP_UNITS = ('s', 'ms', 'us', 'ns')
@@ -590,7 +724,8 @@ class Parser(object):
 
     def __init__(self, json, orient, dtype=True, convert_axes=True,
                  convert_dates=True, keep_default_dates=False, numpy=False,
-                 precise_float=False, date_unit=None):
+                 precise_float=False, date_unit=None, lines=False,
+                 schema=None):
         self.json = json
 
         if orient is None:
@@ -617,6 +752,8 @@ class Parser(object):
         self.convert_dates = convert_dates
         self.date_unit = date_unit
         self.keep_default_dates = keep_default_dates
+        self.lines = lines
+        self.schema = schema or {}
         self.obj = None
 
     def check_keys_split(self, decoded):
@@ -631,7 +768,10 @@ class Parser(object):
 
         # try numpy
         numpy = self.numpy
-        if numpy:
+        if self.lines:
+            self._parse_lines()
+
+        elif numpy:
             self._parse_numpy()
 
         else:
@@ -644,6 +784,14 @@ class Parser(object):
         self._try_convert_types()
         return self.obj
 
+    def _parse_lines(self):
+        """ parse a list of json documents, one per line """
+        self.json = _combine_lines(self.json)
+        if self.numpy:
+            self._parse_numpy()
+        else:
+            self._parse_no_numpy()
+
     def _convert_axes(self):
         """ try to convert axes """
         for axis in self.obj._AXIS_NUMBERS.keys():
@@ -730,6 +878,42 @@ class Parser(object):
 
         return data, result
 
+    def _convert_to_schema(self, name, data):
+        """ convert a column to its dtype in the schema, without inference """
+        dtype = self.schema[name]
+        if data.dtype == dtype:
+            return data, False
+
+        if (is_datetime64_dtype(dtype) or is_datetime64tz_dtype(dtype) or
+                is_timedelta64_dtype(dtype)):
+
+            # epochs with missing values are decoded as objects
+            if data.dtype == np.object_:
+                data = data.infer_objects()
+            unit = None
+            if is_numeric_dtype(data):
+                unit = self.date_unit or 'ms'
+
+            if is_timedelta64_dtype(dtype):
+                if unit is None:
+                    return to_timedelta(data), True
+                return to_timedelta(data, unit=unit), True
+
+            tz = getattr(dtype, 'tz', None)
+            new_data = to_datetime(data, unit=unit, utc=tz is not None)
+            if tz is not None:
+                new_data = new_data.dt.tz_convert(tz)
+            return new_data, True
+
+        if is_bool_dtype(dtype):
+            return Series(_schema_bools(name, data.values), index=data.index,
+                          name=data.name), True
+
+        new_data = data.astype(dtype)
+        if is_integer_dtype(dtype):
+            _check_schema_integers(name, data.values, new_data.values)
+        return new_data, True
+
     def _try_convert_to_date(self, data):
         """ try to parse a ndarray like into a date column
             try to coerce object in epoch/iso formats and
@@ -818,6 +1002,59 @@ class FrameParser(Parser):
     _default_orient = 'columns'
     _split_keys = ('columns', 'index', 'data')
 
+    def _parse_lines(self):
+        if self.numpy or self.orient not in ('columns', 'records'):
+            return super(FrameParser, self)._parse_lines()
+
+        # decode the object of every line straight into the values of
+        # its keys, instead of parsing a list of dicts
+        try:
+            keys, values, nrows = loads_lines(
+                self.json, precise_float=self.precise_float)
+        except TypeError:
+            # not an object on every line
+            return super(FrameParser, self)._parse_lines()
+
+        if not nrows:
+            self.obj = DataFrame()
+            return
+
+        # the columns are sorted as for a list of dicts
+        values = dict(zip(keys, values))
+        try:
+            columns = sorted(keys)
+        except TypeError:
+            columns = keys
+        arrays = [self._lines_column(c, values[c]) for c in columns]
+
+        # infer the dtypes of the columns without a numeric schema
+        objects = [i for i, arr in enumerate(arrays)
+                   if arr.dtype == np.object_]
+        converted, _ = _convert_object_array([arrays[i] for i in objects],
+                                             [columns[i] for i in objects])
+        for i, arr in zip(objects, converted):
+            arrays[i] = arr
+
+        self.obj = DataFrame._from_arrays(arrays, Index(columns),
+                                          com._default_index(nrows))
+
+    def _lines_column(self, name, values):
+        """ the array of the values of a key, of its dtype in the schema if
+        that is numeric """
+        dtype = self.schema.get(name)
+        if dtype is not None and is_bool_dtype(dtype):
+            return _schema_bools(name, values)
+        if dtype is not None and is_numeric_dtype(dtype):
+            try:
+                result = np.array(values, dtype=dtype)
+            except (TypeError, ValueError):
+                pass
+            else:
+                if is_integer_dtype(dtype):
+                    _check_schema_integers(name, np.asarray(values), result)
+                return result
+        return construct_1d_object_array_from_listlike(values)
+
     def _parse_numpy(self):
 
         json = self.json
@@ -892,11 +1129,16 @@ class FrameParser(Parser):
     def _try_convert_types(self):
         if self.obj is None:
             return
+        if self.schema:
+            self._process_converter(
+                lambda col, c: self._convert_to_schema(col, c),
+                lambda col, c: col in self.schema)
         if self.convert_dates:
             self._try_convert_dates()
 
         self._process_converter(
-            lambda col, c: self._try_convert_data(col, c, convert_dates=False))
+            lambda col, c: self._try_convert_data(col, c, convert_dates=False),
+            lambda col, c: col not in self.schema)
 
     def _try_convert_dates(self):
         if self.obj is None:
@@ -925,5 +1167,6 @@ class FrameParser(Parser):
 
         self._process_converter(
             lambda col, c: self._try_convert_to_date(c),
-            lambda col, c: ((self.keep_default_dates and is_ok(col)) or
-                            col in convert_dates))
+            lambda col, c: (col not in self.schema and
+                            ((self.keep_default_dates and is_ok(col)) or
+                             col in convert_dates)))
@@ -5,8 +5,12 @@ import copy
 from collections import defaultdict
 import numpy as np
 
+from pandas._libs import lib
 from pandas._libs.writers import convert_json_to_lines
-from pandas import compat, DataFrame
+from pandas import compat, DataFrame, Index
+from pandas.compat import OrderedDict
+import pandas.core.common as com
+from pandas.core.frame import _convert_object_array
 
 
 def _convert_to_line_delimits(s):
@@ -91,6 +95,45 @@ def nested_to_record(ds, prefix="", sep=".", level=0):
     return new_ds
 
 
+def _flatten_records(data, sep="."):
+    """
+    Flatten a list of nested dicts into a DataFrame column by column.
+
+    The key paths are discovered once across all records and each path is
+    then extracted into a column in a single pass, giving the same result
+    as ``DataFrame(nested_to_record(data, sep=sep))`` without building a
+    flattened dict per record. Returns None if the records can't be
+    flattened this way (ordered dicts, or key paths flattening to the same
+    name), in which case the caller falls back on ``nested_to_record``.
+    """
+    if any(isinstance(d, OrderedDict) for d in data):
+        return None
+
+    paths = lib.nested_key_paths(data)
+
+    def _name(path):
+        if len(path) == 1:
+            return path[0]
+        return sep.join(k if isinstance(k, compat.string_types) else str(k)
+                        for k in path)
+
+    names = [_name(path) for path in paths]
+    if len(set(names)) != len(names):
+        return None
+
+    try:
+        order = sorted(range(len(names)), key=lambda i: names[i])
+    except TypeError:
+        order = range(len(names))
+    paths = [paths[i] for i in order]
+    names = [names[i] for i in order]
+
+    content = list(lib.nested_dicts_to_array(data, paths).T)
+    arrays, columns = _convert_object_array(content, names)
+    return DataFrame._from_arrays(arrays, Index(columns),
+                                  com._default_index(len(data)))
+
+
 def json_normalize(data, record_path=None, meta=None,
                    meta_prefix=None,
                    record_prefix=None,
@@ -197,6 +240,9 @@ def json_normalize(data, record_path=None, meta=None,
             #
             # TODO: handle record value which are lists, at least error
             #       reasonably
+            result = _flatten_records(data, sep=sep)
+            if result is not None:
+                return result
             data = nested_to_record(data, sep=sep)
         return DataFrame(data)
     elif not isinstance(record_path, list):
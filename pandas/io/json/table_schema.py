@@ -12,7 +12,7 @@ import pandas.core.common as com
 from pandas.core.dtypes.common import (
     is_integer_dtype, is_timedelta64_dtype, is_numeric_dtype,
     is_bool_dtype, is_datetime64_dtype, is_datetime64tz_dtype,
-    is_categorical_dtype, is_period_dtype, is_string_dtype
+    is_categorical_dtype, is_period_dtype, is_string_dtype, pandas_dtype
 )
 
 loads = json.loads
@@ -179,6 +179,51 @@ def convert_json_field_to_pandas_type(field):
     raise ValueError("Unsupported or invalid field type: {}".format(typ))
 
 
+def convert_json_schema_to_pandas_types(schema):
+    """
+    Converts a JSON table schema, or a mapping of names to dtypes, into a
+    mapping of the names to their NumPy / pandas types
+
+    Parameters
+    ----------
+    schema : dict
+        A JSON table schema, with a list of fields with a ``'name'`` under
+        ``'fields'``, or a mapping of column names to dtypes
+
+    Returns
+    -------
+    dtypes : dict
+
+    Raises
+    -----
+    TypeError
+        If the schema is not a dict
+    ValueError
+        If the type of a field is unknown or currently unsupported
+
+    Examples
+    --------
+    >>> convert_json_schema_to_pandas_types({'fields': [
+                                                {'name': 'an_int',
+                                                 'type': 'integer'}]})
+    {'an_int': dtype('int64')}
+    >>> convert_json_schema_to_pandas_types({'a_float': 'float32'})
+    {'a_float': dtype('float32')}
+    """
+    if not isinstance(schema, dict):
+        raise TypeError("schema must be a JSON table schema or a dict of "
+                        "column names to dtypes")
+
+    fields = schema.get('fields')
+    if isinstance(fields, list) and all(isinstance(field, dict) and
+                                        'name' in field
+                                        for field in fields):
+        schema = {field['name']: convert_json_field_to_pandas_type(field)
+                  for field in fields}
+    return {name: pandas_dtype(dtype)
+            for name, dtype in schema.items()}
+
+
 def build_table_schema(data, index=True, primary_key=None, version=True):
     """
     Create a Table schema from ``data``.
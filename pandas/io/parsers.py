@@ -5,7 +5,9 @@ from __future__ import print_function
 from collections import defaultdict
 import re
 import csv
+import mmap
 import sys
+import tokenize
 import warnings
 import datetime
 from textwrap import fill
@@ -22,12 +24,14 @@ from pandas.core.dtypes.common import (
     is_object_dtype, is_string_dtype,
     is_scalar, is_categorical_dtype)
 from pandas.core.dtypes.dtypes import CategoricalDtype
-from pandas.core.dtypes.missing import isna
+from pandas.core.dtypes.missing import isna, notna
+from pandas.core.dtypes.concat import union_categoricals
 from pandas.core.dtypes.cast import astype_nansafe
 from pandas.core.index import (Index, MultiIndex, RangeIndex,
                                _ensure_index_from_sequences)
 from pandas.core.series import Series
 from pandas.core.frame import DataFrame
+from pandas.core.reshape.concat import concat
 from pandas.core.arrays import Categorical
 from pandas.core import algorithms
 import pandas.core.common as com
@@ -143,6 +147,17 @@ skipfooter : int, default 0
     Number of lines at bottom of file to skip (Unsupported with engine='c')
 nrows : int, default None
     Number of rows of file to read. Useful for reading pieces of large files
+filter : str or callable, default None
+    Only keep the rows matching this condition. A string is evaluated like
+    :meth:`DataFrame.query`, so it can refer to columns by name and to local
+    variables with ``@``. A callable is passed each parsed chunk as a
+    DataFrame and must return a boolean mask. The file is parsed and filtered
+    in chunks, so rows which do not match never accumulate in memory, and
+    columns a string condition refers to are read even if they are excluded
+    by `usecols`. As with `chunksize`, dtypes are inferred per chunk.
+    `chunksize` and `nrows` count the rows of the file before filtering.
+
+    .. versionadded:: 0.23.0
 na_values : scalar, str, list-like, or dict, default None
     Additional strings to recognize as NA/NaN. If dict passed, specific
     per-column NA values.  By default the following values are interpreted as
@@ -290,6 +305,25 @@ memory_map : boolean, default False
     If a filepath is provided for `filepath_or_buffer`, map the file object
     directly onto memory and access the data directly from there. Using this
     option can improve performance because there is no longer any I/O overhead.
+num_threads : int, default None
+    If greater than 1, split the input at record boundaries into
+    ``num_threads`` pieces and tokenize and convert them concurrently in a
+    thread pool, then combine the columns with the same dtype inference as
+    a single-threaded parse. Cannot be combined with `chunksize`,
+    `iterator` or `nrows`. Inputs using `compression`, `comment`,
+    `escapechar`, a list-like `header` or non-integer `skiprows` are
+    parsed on a single thread. Line numbers in error messages are relative
+    to the piece in which the error occurred. (Only valid with C parser)
+
+    .. versionadded:: 0.23.0
+intern_strings : boolean, default False
+    Intern the strings of object columns, so that each distinct value is
+    stored once across all columns and chunks instead of once per column and
+    chunk. Reduces memory use for repetitive string data read with
+    ``low_memory=True``, `chunksize` or `num_threads`. (Only valid with C
+    parser)
+
+    .. versionadded:: 0.23.0
 
 Returns
 -------
@@ -485,6 +519,7 @@ _parser_defaults = {
     'usecols': None,
 
     'nrows': None,
+    'filter': None,
     # 'iterator': False,
     'chunksize': None,
     'verbose': False,
@@ -506,7 +541,9 @@ _c_parser_defaults = {
     'error_bad_lines': True,
     'warn_bad_lines': True,
     'tupleize_cols': False,
-    'float_precision': None
+    'float_precision': None,
+    'num_threads': None,
+    'intern_strings': False
 }
 
 _fwf_defaults = {
@@ -518,6 +555,8 @@ _c_unsupported = {'skipfooter'}
 _python_unsupported = {
     'low_memory',
     'float_precision',
+    'num_threads',
+    'intern_strings',
 }
 
 _deprecated_defaults = {
@@ -527,6 +566,9 @@ _deprecated_args = {
     'tupleize_cols',
 }
 
+# number of rows parsed at a time when reading with a `filter`
+_FILTER_CHUNKSIZE = 2 ** 16
+
 
 def _make_parser_function(name, sep=','):
 
@@ -554,6 +596,7 @@ def _make_parser_function(name, sep=','):
                  skipinitialspace=False,
                  skiprows=None,
                  nrows=None,
+                 filter=None,
 
                  # NA and Missing Data Handling
                  na_values=None,
@@ -597,7 +640,9 @@ def _make_parser_function(name, sep=','):
                  delim_whitespace=False,
                  low_memory=_c_parser_defaults['low_memory'],
                  memory_map=False,
-                 float_precision=None):
+                 float_precision=None,
+                 num_threads=None,
+                 intern_strings=False):
 
         # Alias sep -> delimiter.
         if delimiter is None:
@@ -614,6 +659,10 @@ def _make_parser_function(name, sep=','):
             engine = 'c'
             engine_specified = False
 
+        if isinstance(filter, compat.string_types):
+            # resolve local variables in the scope of the caller
+            filter = _QueryFilter(filter, level=1)
+
         kwds = dict(delimiter=delimiter,
                     engine=engine,
                     dialect=dialect,
@@ -646,6 +695,7 @@ def _make_parser_function(name, sep=','):
                     date_parser=date_parser,
 
                     nrows=nrows,
+                    filter=filter,
                     iterator=iterator,
                     chunksize=chunksize,
                     skipfooter=skipfooter,
@@ -657,6 +707,8 @@ def _make_parser_function(name, sep=','):
                     squeeze=squeeze,
                     memory_map=memory_map,
                     float_precision=float_precision,
+                    num_threads=num_threads,
+                    intern_strings=intern_strings,
 
                     na_filter=na_filter,
                     delim_whitespace=delim_whitespace,
@@ -698,6 +750,9 @@ def read_fwf(filepath_or_buffer, colspecs='infer', widths=None, **kwds):
             colspecs.append((col, col + w))
             col += w
 
+    if isinstance(kwds.get('filter'), compat.string_types):
+        kwds['filter'] = _QueryFilter(kwds['filter'], level=1)
+
     kwds['colspecs'] = colspecs
     kwds['engine'] = 'python-fwf'
     return _read(filepath_or_buffer, kwds)
@@ -769,6 +824,25 @@ class TextFileReader(BaseIterator):
         self.chunksize = options.pop('chunksize', None)
         self.nrows = options.pop('nrows', None)
         self.squeeze = options.pop('squeeze', False)
+        self.filter = options.pop('filter', None)
+        self._filter_usecols = None
+
+        if self.filter is not None:
+            if isinstance(self.filter, compat.string_types):
+                self.filter = _QueryFilter(self.filter, level=1)
+            elif not callable(self.filter):
+                raise TypeError("'filter' must be a string or a callable")
+            options['usecols'] = self._project_filter_usecols(
+                options['usecols'])
+
+        num_threads = _validate_integer('num_threads',
+                                        options['num_threads'], 1)
+        if num_threads is not None and num_threads > 1:
+            if (self.chunksize is not None or self.nrows is not None or
+                    kwds.get('iterator', False)):
+                raise ValueError("'num_threads' cannot be used together "
+                                 "with 'chunksize', 'iterator' or 'nrows'")
+        options['num_threads'] = num_threads
 
         # might mutate self.engine
         self.engine = self._check_file_or_buffer(f, engine)
@@ -1019,6 +1093,81 @@ class TextFileReader(BaseIterator):
     def _failover_to_python(self):
         raise com.AbstractMethodError(self)
 
+    def _project_filter_usecols(self, usecols):
+        """
+        Extend ``usecols`` with the columns referenced by a string filter,
+        remembering the original selection to apply after filtering.
+        """
+        names = getattr(self.filter, 'names', None)
+        if usecols is None or names is None:
+            return usecols
+
+        usecols, usecols_dtype = _validate_usecols_arg(usecols)
+        if usecols_dtype == 'integer':
+            raise ValueError("'filter' requires 'usecols' to be given as "
+                             "column labels or a callable")
+
+        self._filter_usecols = usecols
+        return lambda name: name in names or _evaluate_usecols_label(
+            usecols, name)
+
+    def _apply_filter(self, df):
+        mask = self.filter(df)
+        df = df.loc[mask]
+
+        usecols = self._filter_usecols
+        if usecols is not None:
+            if not callable(usecols):
+                missing = [col for col in usecols if col not in df and
+                           col not in df.index.names]
+                if missing:
+                    raise ValueError("Usecols do not match columns, columns "
+                                     "expected but not found: "
+                                     "{missing}".format(missing=missing))
+            df = df[[col for col in df.columns
+                     if _evaluate_usecols_label(usecols, col)]]
+        return df
+
+    def _read_filtered(self, nrows=None):
+        """
+        Read up to ``nrows`` rows in chunks of at most ``_FILTER_CHUNKSIZE``
+        rows, keeping only the rows matching ``self.filter``.
+        """
+        if (self.options.get('skipfooter') or
+                (self.options.get('num_threads') or 1) > 1):
+            # these can only be parsed in one go
+            return self._apply_filter(self._read_frame(nrows))
+
+        frames = []
+        while nrows is None or nrows > 0:
+            size = _FILTER_CHUNKSIZE
+            if nrows is not None:
+                size = min(size, nrows)
+
+            try:
+                df = self._read_frame(size)
+            except StopIteration:
+                if frames:
+                    break
+                raise
+
+            frames.append(self._apply_filter(df))
+            if nrows is not None:
+                nrows -= len(df)
+
+        if len(frames) == 1:
+            return frames[0]
+        result = concat(frames)
+
+        # chunks of categorical columns infer their own categories, which
+        # concat would combine as object; union them like a single reader
+        for i, dtype in enumerate(frames[0].dtypes):
+            if (is_categorical_dtype(dtype) and
+                    not is_categorical_dtype(result.dtypes.iloc[i])):
+                arrs = [frame.iloc[:, i].values for frame in frames]
+                result[result.columns[i]] = _concat_thread_arrays(arrs)
+        return result
+
     def read(self, nrows=None):
         nrows = _validate_integer('nrows', nrows)
 
@@ -1026,6 +1175,16 @@ class TextFileReader(BaseIterator):
             if self.options.get('skipfooter'):
                 raise ValueError('skipfooter not supported for iteration')
 
+        if self.filter is None:
+            df = self._read_frame(nrows)
+        else:
+            df = self._read_filtered(nrows)
+
+        if self.squeeze and len(df.columns) == 1:
+            return df[df.columns[0]].copy()
+        return df
+
+    def _read_frame(self, nrows=None):
         ret = self._engine.read(nrows)
 
         # May alter columns / col_dict
@@ -1044,9 +1203,6 @@ class TextFileReader(BaseIterator):
         df = DataFrame(col_dict, columns=columns, index=index)
 
         self._currow += new_rows
-
-        if self.squeeze and len(df.columns) == 1:
-            return df[df.columns[0]].copy()
         return df
 
     def _create_index(self, ret):
@@ -1062,6 +1218,19 @@ class TextFileReader(BaseIterator):
             size = min(size, self.nrows - self._currow)
         return self.read(nrows=size)
 
+    def groupby(self, by, sort=True):
+        """
+        Group the remaining chunks by the columns ``by`` for aggregation
+        across all chunks, see :class:`pandas.core.groupby.ChunkedGroupBy`
+
+        Examples
+        --------
+        >>> reader = pd.read_csv('data.csv', chunksize=10 ** 6)
+        >>> reader.groupby('key').agg({'value': ['sum', 'mean']})
+        """
+        from pandas.core.groupby import ChunkedGroupBy
+        return ChunkedGroupBy(self, by, sort=sort)
+
 
 def _is_index_col(col):
     return col is not None and col is not False
@@ -1098,6 +1267,18 @@ def _evaluate_usecols(usecols, names):
     return usecols
 
 
+def _evaluate_usecols_label(usecols, name):
+    """
+    Check whether a single column label is selected by ``usecols``, which
+    must be None, a callable or a set of labels.
+    """
+    if usecols is None:
+        return True
+    if callable(usecols):
+        return bool(usecols(name))
+    return name in usecols
+
+
 def _validate_usecols_names(usecols, names):
     """
     Validates that all usecols are present in a given
@@ -1222,6 +1403,213 @@ def _validate_parse_dates_arg(parse_dates):
     return parse_dates
 
 
+def _split_record_offsets(buf, num_pieces, skip_records, quotechar,
+                          lineterminator, skip_blank_lines=True,
+                          delimiter=b',', skipinitialspace=False):
+    """
+    Find offsets splitting ``buf`` into at most ``num_pieces`` pieces of
+    roughly equal size, each ending just after a record terminator that is
+    not inside a quoted field.
+
+    Parameters
+    ----------
+    buf : bytes or mmap
+    num_pieces : int
+    skip_records : int
+        Number of leading records (skipped rows and the header) which are
+        kept in the first piece.
+    quotechar : bytes or None
+        Quote character, or None if quoting is disabled.
+    lineterminator : bytes
+    skip_blank_lines : boolean, default True
+        Whether blank lines are excluded when counting ``skip_records``.
+    delimiter : bytes or None, default b','
+        Field delimiter, or None if fields are separated by whitespace.
+    skipinitialspace : boolean, default False
+        Whether spaces after a delimiter are skipped.
+
+    Returns
+    -------
+    offsets : list of int
+        Starting with 0 and ending with ``len(buf)``.
+    """
+    if delimiter is None:
+        separators = (b' ', b'\t', lineterminator)
+    else:
+        separators = (delimiter, lineterminator)
+
+    def _opens_field(idx):
+        # like the tokenizer, a quote only starts a quoted field at the
+        # start of a field; elsewhere it is an ordinary character
+        if skipinitialspace:
+            while idx > 0 and buf[idx - 1:idx] == b' ':
+                idx -= 1
+        return idx == 0 or buf[idx - 1:idx] in separators
+
+    def _in_quotes(start, end, in_quotes):
+        # the quote state at ``end``, given the state at ``start``
+        while True:
+            idx = buf.find(quotechar, start, end)
+            if idx < 0:
+                return in_quotes
+            if in_quotes:
+                if buf[idx + 1:idx + 2] == quotechar:
+                    # an escaped quote
+                    idx += 1
+                else:
+                    in_quotes = False
+            elif _opens_field(idx):
+                in_quotes = True
+            start = idx + 1
+
+    def _record_end(start, target):
+        # ``start`` is a record start, which lies outside of a quoted field
+        in_quotes = False
+        while True:
+            idx = buf.find(lineterminator, target)
+            if idx < 0:
+                return None
+            if quotechar is not None:
+                in_quotes = _in_quotes(start, idx, in_quotes)
+                start = idx
+            if not in_quotes:
+                return idx + 1
+            target = idx + 1
+
+    nbytes = len(buf)
+    pos = 0
+    records = 0
+    while records < skip_records:
+        end = _record_end(pos, pos)
+        if end is None:
+            return [0, nbytes]
+        if not (skip_blank_lines and not buf[pos:end].strip()):
+            records += 1
+        pos = end
+
+    offsets = [0]
+    for k in range(1, num_pieces):
+        end = _record_end(pos, max(pos, nbytes * k // num_pieces))
+        if end is None or end >= nbytes:
+            break
+        offsets.append(end)
+        pos = end
+    offsets.append(nbytes)
+    return offsets
+
+
+class _BufferRange(object):
+    """
+    File-like object reading the bytes ``buf[start:end]``, which are only
+    copied as they are read.
+    """
+
+    def __init__(self, buf, start, end):
+        self.buf = buf
+        self.pos = start
+        self.end = end
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            stop = self.end
+        else:
+            stop = min(self.pos + size, self.end)
+        data = self.buf[self.pos:stop]
+        self.pos = stop
+        return data
+
+
+def _is_bool_object(values):
+    """
+    Check whether an object array holds booleans and missing values only,
+    as produced by upcasting a boolean column containing NaN.
+    """
+    return lib.infer_dtype(values[notna(values)]) in ('boolean', 'empty')
+
+
+def _concat_thread_arrays(arrs, has_converter=False):
+    """
+    Combine the arrays parsed for one column from consecutive pieces,
+    matching the dtype a single reader would have inferred.
+
+    Returns None if the pieces were inferred as incompatible dtypes, in
+    which case the column has to be read back as strings.
+    """
+    dtypes = [arr.dtype for arr in arrs]
+
+    if all(is_categorical_dtype(dtype) for dtype in dtypes):
+        sort_categories = not all(
+            arr.categories.equals(arrs[0].categories) for arr in arrs)
+        return union_categoricals(arrs, sort_categories=sort_categories)
+
+    if all(is_dtype_equal(dtype, dtypes[0]) for dtype in dtypes):
+        return np.concatenate(arrs)
+
+    if has_converter:
+        # a single reader infers once over all converted values
+        return lib.maybe_convert_objects(
+            np.concatenate([_ensure_object(arr) for arr in arrs]))
+
+    kinds = {dtype.kind for dtype in dtypes}
+    if kinds <= set('iuf'):
+        return np.concatenate(arrs)
+
+    # booleans with missing values are upcast to object, and all-missing
+    # pieces are parsed as float
+    if all(dtype.kind == 'b' or
+           (dtype.kind == 'f' and isna(arr).all()) or
+           (dtype.kind == 'O' and _is_bool_object(arr))
+           for dtype, arr in zip(dtypes, arrs)):
+        return np.concatenate([_ensure_object(arr) for arr in arrs])
+
+    return None
+
+
+class _QueryFilter(object):
+    """
+    Row filter evaluating a query string on parsed chunks, see the `filter`
+    argument of :func:`read_csv`.
+
+    Parameters
+    ----------
+    expr : str
+        Boolean expression in the syntax of :meth:`DataFrame.query`.
+    level : int
+        Number of frames above the caller whose variables are visible to
+        the expression through ``@``.
+    """
+
+    def __init__(self, expr, level=0):
+        frame = sys._getframe(level + 1)
+        try:
+            self.global_dict = frame.f_globals
+            self.local_dict = frame.f_locals.copy()
+        finally:
+            del frame
+
+        self.expr = expr
+        self.names = _get_query_names(expr)
+
+    def __call__(self, df):
+        return df.eval(self.expr, global_dict=self.global_dict,
+                       local_dict=self.local_dict)
+
+
+def _get_query_names(expr):
+    """
+    Return the identifiers in a query string which may refer to columns,
+    i.e. all names not prefixed with ``@``.
+    """
+    names = set()
+    prev = None
+    for toknum, tokval, _, _, _ in tokenize.generate_tokens(
+            StringIO(expr).readline):
+        if toknum == tokenize.NAME and prev != '@':
+            names.add(tokval)
+        prev = tokval
+    return names
+
+
 class ParserBase(object):
 
     def __init__(self, kwds):
@@ -1691,7 +2079,35 @@ class CParserWrapper(ParserBase):
         # #2442
         kwds['allow_leading_cols'] = self.index_col is not False
 
-        self._reader = parsers.TextReader(src, **kwds)
+        self._num_threads = kwds.pop('num_threads', None)
+        self._thread_buf = None
+        self._thread_pieces = None
+
+        offsets = None
+        if self._num_threads is not None and self._num_threads > 1:
+            src, offsets = self._split_source(src, kwds, self._num_threads)
+
+        if offsets is not None and len(offsets) > 2:
+            # the pieces are byte ranges of the source, which each reader
+            # reads as it parses
+            pieces = lzip(offsets[:-1], offsets[1:])
+            self._reader = parsers.TextReader(
+                _BufferRange(src, *pieces[0]), **kwds)
+
+            if self._reader.leading_cols:
+                # implicit index columns are only detected from the first
+                # data row, so keep such files on a single reader
+                self._reader = parsers.TextReader(
+                    _BufferRange(src, 0, len(src)), **kwds)
+            else:
+                self._thread_kwds = kwds
+                self._thread_buf = src
+                self._thread_pieces = pieces
+        elif offsets is not None:
+            self._reader = parsers.TextReader(
+                _BufferRange(src, 0, len(src)), **kwds)
+        else:
+            self._reader = parsers.TextReader(src, **kwds)
 
         # XXX
         self.usecols, self.usecols_dtype = _validate_usecols_arg(
@@ -1833,9 +2249,174 @@ class CParserWrapper(ParserBase):
     def set_error_bad_lines(self, status):
         self._reader.set_error_bad_lines(int(status))
 
+    def _split_source(self, src, kwds, num_threads):
+        """
+        Map a file path, or read a file-like source into memory, and find
+        the offsets at which it can be split into ``num_threads`` pieces
+        for concurrent parsing.
+
+        Returns
+        -------
+        src : bytes, mmap or the unchanged source
+        offsets : list of int, or None if the options require the source
+            to be parsed by a single reader
+        """
+        skiprows = kwds.get('skiprows')
+        header = kwds.get('header')
+
+        if (kwds.get('compression') is not None or
+                kwds.get('comment') is not None or
+                kwds.get('escapechar') is not None or
+                not kwds.get('doublequote', True) or
+                not (skiprows is None or is_integer(skiprows)) or
+                not (header is None or is_integer(header))):
+            return src, None
+
+        if isinstance(src, compat.string_types):
+            with open(src, 'rb') as fh:
+                try:
+                    buf = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, EnvironmentError):
+                    # e.g. an empty file, which cannot be mapped
+                    buf = fh.read()
+                else:
+                    self.handles.append(buf)
+        elif hasattr(src, 'read'):
+            buf = src.read()
+            if isinstance(buf, compat.text_type):
+                # mirror the C reader, which encodes text buffers as utf-8
+                buf = buf.encode('utf-8')
+        else:
+            return src, None
+
+        quotechar = kwds.get('quotechar')
+        if kwds.get('quoting') == csv.QUOTE_NONE or not quotechar:
+            quotechar = None
+        elif not isinstance(quotechar, bytes):
+            quotechar = quotechar.encode('utf-8')
+
+        lineterminator = kwds.get('lineterminator') or b'\n'
+        if not isinstance(lineterminator, bytes):
+            lineterminator = lineterminator.encode('utf-8')
+
+        if kwds.get('delim_whitespace'):
+            delimiter = None
+        else:
+            delimiter = kwds.get('delimiter') or b','
+            if not isinstance(delimiter, bytes):
+                delimiter = delimiter.encode('utf-8')
+
+        skip_records = (skiprows or 0) + (0 if header is None else header + 1)
+        offsets = _split_record_offsets(
+            buf, num_threads, skip_records, quotechar, lineterminator,
+            kwds.get('skip_blank_lines', True), delimiter,
+            kwds.get('skipinitialspace', False))
+        return buf, offsets
+
+    def _make_thread_reader(self, piece, first=False, dtype=None):
+        kwds = self._thread_kwds.copy()
+        if not first:
+            if self._reader.header is not None:
+                names = list(self._reader.header[0])
+            else:
+                names = lrange(self._reader.table_width)
+
+            # the header and skipped rows always live in the first piece
+            kwds.update(header=None, names=names, skiprows=None,
+                        allow_leading_cols=False)
+        if dtype is not None:
+            kwds['dtype'] = dtype
+
+        reader = parsers.TextReader(_BufferRange(self._thread_buf, *piece),
+                                    **kwds)
+        for i in self._reader.noconvert:
+            reader.set_noconvert(i)
+        return reader
+
+    def _read_threaded(self, nrows=None):
+        """
+        Parse the first piece with the main reader and the remaining pieces
+        with fresh readers, all in a thread pool, and combine the columns.
+        """
+        from multiprocessing.pool import ThreadPool
+
+        if nrows is not None:
+            raise ValueError("'nrows' is not supported with 'num_threads'")
+
+        pieces = self._thread_pieces
+        self._thread_pieces = None
+
+        def _read_piece(i):
+            if i == 0:
+                reader = self._reader
+            else:
+                reader = self._make_thread_reader(pieces[i])
+            try:
+                return reader.read()
+            except StopIteration:
+                return None
+
+        pool = ThreadPool(processes=self._num_threads)
+        try:
+            chunks = pool.map(_read_piece, range(len(pieces)))
+        finally:
+            pool.close()
+            pool.join()
+
+        # pieces holding only blank lines produce no data
+        chunks = [(i, chunk) for i, chunk in enumerate(chunks)
+                  if chunk is not None]
+        if not chunks:
+            raise StopIteration
+
+        result = {}
+        for key in chunks[0][1]:
+            arrs = [chunk.pop(key) for _, chunk in chunks]
+            values = _concat_thread_arrays(arrs, self._has_converter(key))
+
+            if values is None:
+                # disagreeing inference means that a single-threaded parse
+                # would have left the whole column as strings, so re-read
+                # the pieces which were converted to something else
+                dtype = self._thread_object_dtype(key)
+                for j, (i, _) in enumerate(chunks):
+                    if (is_object_dtype(arrs[j]) and
+                            not _is_bool_object(arrs[j])):
+                        continue
+                    reader = self._make_thread_reader(
+                        pieces[i], first=i == 0, dtype=dtype)
+                    arrs[j] = reader.read()[key]
+                values = np.concatenate(arrs)
+
+            result[key] = values
+
+        return result
+
+    def _thread_column_name(self, i):
+        header = self._reader.header
+        if header is not None and i < len(header[0]):
+            return header[0][i]
+        return None
+
+    def _has_converter(self, i):
+        converters = self.kwds.get('converters') or {}
+        return (i in converters or
+                self._thread_column_name(i) in converters)
+
+    def _thread_object_dtype(self, i):
+        # user dtypes keyed by name take precedence in the reader, and none
+        # can be set for a column whose pieces were inferred differently
+        dtype = self.kwds.get('dtype')
+        dtype = dict(dtype) if isinstance(dtype, dict) else {}
+        dtype[i] = np.object_
+        return dtype
+
     def read(self, nrows=None):
         try:
-            data = self._reader.read(nrows)
+            if self._thread_pieces is not None:
+                data = self._read_threaded(nrows)
+            else:
+                data = self._reader.read(nrows)
         except StopIteration:
             if self._first_chunk:
                 self._first_chunk = False
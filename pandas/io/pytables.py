@@ -11,6 +11,7 @@ import copy
 import itertools
 import warnings
 import os
+from multiprocessing.pool import ThreadPool
 
 from pandas.core.dtypes.common import (
     is_list_like,
@@ -21,6 +22,7 @@ from pandas.core.dtypes.common import (
     _ensure_object,
     _ensure_int64,
     _ensure_platform_int)
+from pandas.core.dtypes.inference import is_scalar
 from pandas.core.dtypes.missing import array_equivalent
 
 import numpy as np
@@ -43,9 +45,11 @@ from pandas.core.internals import (BlockManager, make_block,
                                    _factor_indexer, _block_shape)
 from pandas.core.index import _ensure_index
 from pandas import compat
-from pandas.compat import u_safe as u, PY3, range, lrange, string_types, filter
+from pandas.compat import (u_safe as u, PY3, range, lrange, string_types,
+                           filter, OrderedDict)
 from pandas.core.config import get_option
-from pandas.core.computation.pytables import Expr, maybe_expression
+from pandas.core.computation.pytables import Expr, BinOp, maybe_expression
+from pandas.core.computation.ops import UndefinedVariableError
 
 from pandas._libs import algos, lib, writers as libwriters
 from pandas._libs.tslibs import timezones
@@ -90,6 +94,41 @@ def _ensure_str(name):
 Term = Expr
 
 
+class _LRUCache(object):
+    """ a mapping holding at most maxsize of the most recently used items """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        try:
+            value = self._data.pop(key)
+        except KeyError:
+            return default
+        self._data[key] = value
+        return value
+
+    def set(self, key, value):
+        self._data.pop(key, None)
+        if self.maxsize <= 0:
+            return
+        while len(self._data) >= self.maxsize:
+            self._data.popitem(last=False)
+        self._data[key] = value
+
+    def clear(self):
+        self._data.clear()
+
+
+# the where expressions already parsed and evaluated against a table layout
+_EXPR_CACHE_SIZE = 256
+_expr_cache = _LRUCache(_EXPR_CACHE_SIZE)
+
+
 def _ensure_term(where, scope_level):
     """
     ensure that the where is a Term or a list of Term
@@ -224,6 +263,17 @@ format_doc = """
     default format writing format, if None, then
     put will default to 'fixed' and append will default to 'table'
 """
+read_threads_doc = """
+: int
+    number of threads converting the data columns read from a table,
+    the reads from the file itself are not concurrent
+"""
+coordinate_cache_size_doc = """
+: int
+    number of where conditions per store whose selected coordinates are
+    cached, so that repeated selections do not scan the table again,
+    0 disables the cache
+"""
 
 with config.config_prefix('io.hdf'):
     config.register_option('dropna_table', False, dropna_doc,
@@ -232,6 +282,11 @@ with config.config_prefix('io.hdf'):
         'default_format', None, format_doc,
         validator=config.is_one_of_factory(['fixed', 'table', None])
     )
+    config.register_option('read_threads', 1, read_threads_doc,
+                           validator=config.is_int)
+    config.register_option('coordinate_cache_size', 0,
+                           coordinate_cache_size_doc,
+                           validator=config.is_int)
 
 # oh the troubles to reduce import time
 _table_mod = None
@@ -462,6 +517,7 @@ class HDFStore(StringMixin):
         self._complib = complib
         self._fletcher32 = fletcher32
         self._filters = None
+        self._coordinate_cache = _LRUCache(0)
         self.open(mode=mode, **kwargs)
 
     def __fspath__(self):
@@ -617,6 +673,7 @@ class HDFStore(StringMixin):
         if self._handle is not None:
             self._handle.close()
         self._handle = None
+        self._coordinate_cache.clear()
 
     @property
     def is_open(self):
@@ -725,6 +782,13 @@ class HDFStore(StringMixin):
         where : list of Term (or convertible) objects, optional
         start : integer (defaults to None), row number to start selection
         stop  : integer (defaults to None), row number to stop selection
+
+        Notes
+        -----
+        With the ``io.hdf.coordinate_cache_size`` option set, the coordinates
+        of a condition are cached until the table is written to, or until the
+        store is closed. Modifications of the file made outside of the store
+        are not detected.
         """
         where = _ensure_term(where, scope_level=1)
         return self.get_storer(key).read_coordinates(where=where, start=start,
@@ -885,6 +949,7 @@ class HDFStore(StringMixin):
 
         """
         where = _ensure_term(where, scope_level=1)
+        self._coordinate_cache.clear()
         try:
             s = self.get_storer(key)
         except:
@@ -942,6 +1007,15 @@ class HDFStore(StringMixin):
         encoding     : default None, provide an encoding for strings
         dropna       : boolean, default False, do not write an ALL nan row to
             the store settable by the option 'io.hdf.dropna_table'
+        index        : boolean, list of columns or 'deferred', default True
+            Index the axes and data columns (True), the given columns, or
+            nothing (False). With 'deferred' the columns are indexed when the
+            table is created, but appended rows are only added to the indexes
+            by :meth:`HDFStore.create_table_index`, or by an append with
+            index; until then selections search these rows linearly.
+
+            .. versionchanged:: 0.23.0
+               ``'deferred'`` was added
 
         Notes
         -----
@@ -1288,6 +1362,7 @@ class HDFStore(StringMixin):
 
     def _write_to_group(self, key, value, format, index=True, append=False,
                         complib=None, encoding=None, **kwargs):
+        self._coordinate_cache.clear()
         group = self.get_node(key)
 
         # remove the node if we are not appending
@@ -1335,11 +1410,19 @@ class HDFStore(StringMixin):
                 'Compression not supported on Fixed format stores'
             )
 
+        # defer indexing the appended rows to the end of the table
+        deferred = isinstance(index, string_types) and index == 'deferred'
+        if deferred and s.is_exists:
+            s.table.autoindex = False
+
         # write the object
         s.write(obj=value, append=append, complib=complib, **kwargs)
 
         if s.is_table and index:
-            s.create_index(columns=index)
+            if deferred:
+                s.create_index(deferred=True)
+            else:
+                s.create_index(columns=index)
 
     def _read_group(self, group, **kwargs):
         s = self._create_storer(group)
@@ -1432,6 +1515,14 @@ class TableIterator(object):
         if self.auto_close:
             self.store.close()
 
+    def groupby(self, by, sort=True):
+        """
+        Group the chunks by the columns ``by`` for aggregation across all
+        chunks, see :class:`pandas.core.groupby.ChunkedGroupBy`
+        """
+        from pandas.core.groupby import ChunkedGroupBy
+        return ChunkedGroupBy(self, by, sort=sort)
+
     def get_result(self, coordinates=False):
 
         #  return the actual iterator
@@ -3252,7 +3343,8 @@ class Table(Fixed):
 
         return self._indexables
 
-    def create_index(self, columns=None, optlevel=None, kind=None):
+    def create_index(self, columns=None, optlevel=None, kind=None,
+                     deferred=False):
         """
         Create a pytables index on the specified columns
           note: cannot index Time64Col() or ComplexCol currently;
@@ -3264,6 +3356,10 @@ class Table(Fixed):
             index), None or list_like (the indexers to index)
         optlevel: optimization level (defaults to 6)
         kind    : kind of index (defaults to 'medium')
+        deferred : boolean, default False
+            do not add the rows appended from now on to the indexes, until
+            the index is created again without deferred; these rows are
+            searched linearly by a selection
 
         Exceptions
         ----------
@@ -3321,6 +3417,22 @@ class Table(Fixed):
                             'data_columns when initializing the table.')
                     v.create_index(**kw)
 
+        # index the rows appended while the index was deferred in one batch
+        if deferred:
+            table.autoindex = False
+        elif not table.autoindex:
+            table.autoindex = True
+            table.flush_rows_to_index()
+
+    @property
+    def unindexed_rows(self):
+        """ the number of rows at the end of the table not in its indexes """
+        indexes = self.table.colindexes
+        if not len(indexes):
+            return 0
+        return self.nrows - min(i.nelements
+                                for i in compat.itervalues(indexes))
+
     def read_axes(self, where, **kwargs):
         """create and return the axes sniffed from the table: return boolean
         for success
@@ -3338,11 +3450,40 @@ class Table(Fixed):
         values = self.selection.select()
 
         # convert the data
+        self.convert_axes(values)
+
+        return True
+
+    def convert_axes(self, values):
+        """ convert the axes from the rows values read from the table
+
+        the data columns are converted in the threads of a pool when the
+        io.hdf.read_threads option is larger than 1; as HDF5 is not thread
+        safe, the axes which touch the file are converted serially
+        """
+
+        def convert(a):
+            return a.convert(values, nan_rep=self.nan_rep,
+                             encoding=self.encoding)
+
         for a in self.axes:
             a.set_info(self.info)
-            a.convert(values, nan_rep=self.nan_rep, encoding=self.encoding)
 
-        return True
+        for a in self.index_axes:
+            convert(a)
+
+        num_threads = min(get_option('io.hdf.read_threads'),
+                          len(self.values_axes))
+        if num_threads <= 1:
+            for a in self.values_axes:
+                convert(a)
+        else:
+            pool = ThreadPool(num_threads)
+            try:
+                pool.map(convert, self.values_axes)
+            finally:
+                pool.close()
+                pool.join()
 
     def get_object(self, obj):
         """ return the data for this obj """
@@ -4689,11 +4830,78 @@ class Selection(object):
 
         if self.coordinates is None:
 
+            key = self._expr_cache_key(where)
+            cached = self._lookup_expr(key, where)
+            if cached is not None:
+                self.terms, self.condition, self.filter = cached
+                return
+
             self.terms = self.generate(where)
 
             # create the numexpr & the filter
             if self.terms is not None:
                 self.condition, self.filter = self.terms.evaluate()
+                self._store_expr(key)
+
+    def _expr_cache_key(self, where):
+        """
+        the key of a where expression in the expression cache, None if the
+        expression cannot be cached; the parsed terms depend on the expression
+        and on the kinds of the queryables of the table only
+        """
+        if not (isinstance(where, Expr) and
+                isinstance(where.expr, string_types)):
+            return None
+
+        layout = []
+        for name, axis in compat.iteritems(self.table.queryables()):
+            kind = _ensure_decoded(getattr(axis, 'kind', None))
+            meta = _ensure_decoded(getattr(axis, 'meta', None))
+
+            # categorical terms are converted against the categories
+            if meta is not None:
+                return None
+            layout.append((name, axis is None, kind))
+
+        return where.expr, self.table.encoding, tuple(sorted(layout))
+
+    def _lookup_expr(self, key, where):
+        """
+        return the (terms, condition, filter) of a cached expression, if the
+        variables it references still resolve to the same values
+        """
+        if key is None:
+            return None
+        cached = _expr_cache.get(key)
+        if cached is None:
+            return None
+
+        # an unparsed expression only captures the scope of the variables
+        resolved, condition, filt = cached
+        terms = Expr(where, encoding=self.table.encoding)
+        for name, value in compat.iteritems(resolved):
+            try:
+                current = terms.env.resolve(name, is_local=False)
+            except UndefinedVariableError:
+                current = name
+            if not _same_resolved_value(current, value):
+                return None
+        return terms, condition, filt
+
+    def _store_expr(self, key):
+        """ cache the evaluated terms if they only depend on scalars """
+        if key is None:
+            return
+        resolved = self.terms.env.resolved
+        if not all(_is_cacheable_value(value)
+                   for value in compat.itervalues(resolved)):
+            return
+
+        # the evaluated condition and filter only need their formatted
+        # values, do not keep the table (and its data) alive
+        for op in (self.condition, self.filter):
+            _release_queryables(op)
+        _expr_cache.set(key, (dict(resolved), self.condition, self.filter))
 
     def generate(self, where):
         """ where can be a : dict,list,tuple,string """
@@ -4722,6 +4930,8 @@ class Selection(object):
         generate the selection
         """
         if self.condition is not None:
+            if self._coordinate_cache() is not None:
+                return self.table.table.read_coordinates(self.select_coords())
             return self.table.table.read_where(self.condition.format(),
                                                start=self.start,
                                                stop=self.stop)
@@ -4745,14 +4955,62 @@ class Selection(object):
             stop += nrows
 
         if self.condition is not None:
-            return self.table.table.get_where_list(self.condition.format(),
-                                                   start=start, stop=stop,
-                                                   sort=True)
+            condition = self.condition.format()
+            cache = self._coordinate_cache()
+            if cache is not None:
+                key = (self.table.pathname, condition, start, stop)
+                cached = cache.get(key)
+
+                # rows are only ever appended or removed, so a table with the
+                # same number of rows has not changed since
+                if cached is not None and cached[0] == nrows:
+                    return cached[1]
+
+            coords = self.table.table.get_where_list(condition,
+                                                     start=start, stop=stop,
+                                                     sort=True)
+            if cache is not None:
+                coords.flags.writeable = False
+                cache.set(key, (nrows, coords))
+            return coords
         elif self.coordinates is not None:
             return self.coordinates
 
         return np.arange(start, stop)
 
+    def _coordinate_cache(self):
+        """
+        the cache of the selected coordinates of the store of the table,
+        None if caching is disabled
+        """
+        size = get_option('io.hdf.coordinate_cache_size')
+        if size <= 0:
+            return None
+        cache = self.table.parent._coordinate_cache
+        cache.maxsize = size
+        return cache
+
+
+def _is_cacheable_value(value):
+    return is_scalar(value) or isinstance(value, type) or callable(value)
+
+
+def _same_resolved_value(left, right):
+    if is_scalar(left) and is_scalar(right):
+        try:
+            return type(left) is type(right) and bool(left == right)
+        except (TypeError, ValueError):
+            return False
+    return left is right
+
+
+def _release_queryables(op):
+    """ drop the references of an evaluated BinOp tree to the table """
+    if isinstance(op, BinOp):
+        op.queryables = None
+        _release_queryables(op.lhs)
+        _release_queryables(op.rhs)
+
 # utilities ###
 
 
@@ -9,18 +9,26 @@ from datetime import datetime, date, time
 
 import warnings
 import re
+from itertools import islice
+from decimal import Decimal
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
 import numpy as np
 
 import pandas._libs.lib as lib
 from pandas.core.dtypes.missing import isna
 from pandas.core.dtypes.dtypes import DatetimeTZDtype
+from pandas.core.dtypes.cast import (
+    construct_1d_object_array_from_listlike, maybe_cast_to_datetime)
 from pandas.core.dtypes.common import (
-    is_list_like, is_dict_like,
+    is_list_like, is_dict_like, is_integer,
     is_datetime64tz_dtype)
 
 from pandas.compat import (map, zip, raise_with_traceback,
                            string_types, text_type)
-from pandas.core.api import DataFrame, Series
+from pandas.core.api import DataFrame, Series, Index
+from pandas.core.reshape.concat import concat
+import pandas.core.common as com
 from pandas.core.base import PandasObject
 from pandas.core.tools.datetimes import to_datetime
 
@@ -131,12 +139,66 @@ def _parse_date_columns(data_frame, parse_dates):
     return data_frame
 
 
-def _wrap_result(data, columns, index_col=None, coerce_float=True,
+# number of rows fetched at a time when reading a whole result set
+_FETCH_BATCHSIZE = 10000
+
+
+def _fetch_batches(fetchmany):
+    """Yield the rows of a result set in lists of _FETCH_BATCHSIZE rows."""
+    while True:
+        rows = fetchmany(_FETCH_BATCHSIZE)
+        if not rows:
+            break
+        yield rows
+
+
+def _concat_column(chunks, coerce_float=True):
+    """Concatenate the converted batches of a column."""
+    if len(chunks) == 1:
+        arr = chunks[0]
+    elif len(set(chunk.dtype for chunk in chunks)) == 1:
+        arr = np.concatenate(chunks)
+    else:
+        # the batches were inferred differently (e.g. ints followed by a
+        # batch holding NULLs), infer again on the whole column
+        arr = np.concatenate([chunk.astype(object) for chunk in chunks])
+        arr = lib.maybe_convert_objects(arr, try_float=coerce_float)
+    return maybe_cast_to_datetime(arr, None)
+
+
+def _frame_from_batches(batches, columns, coerce_float=True):
+    """
+    Construct a DataFrame from batches of rows, one column at a time.
+
+    Unlike ``DataFrame.from_records`` on all rows, this never builds an object
+    array of the whole result set: the values of each batch are converted to
+    a typed array per column, and the rows of the batch can be released
+    before the next one is fetched.
+    """
+    chunks = [[] for _ in columns]
+    nrows = 0
+    for rows in batches:
+        nrows += len(rows)
+        for col_chunks, values in zip(chunks, zip(*rows)):
+            values = construct_1d_object_array_from_listlike(values)
+            col_chunks.append(lib.maybe_convert_objects(
+                values, try_float=coerce_float))
+
+    if nrows == 0:
+        return DataFrame.from_records([], columns=columns,
+                                      coerce_float=coerce_float)
+
+    arrays = [_concat_column(col_chunks, coerce_float=coerce_float)
+              for col_chunks in chunks]
+    return DataFrame._from_arrays(arrays, Index(columns),
+                                  com._default_index(nrows))
+
+
+def _wrap_result(batches, columns, index_col=None, coerce_float=True,
                  parse_dates=None):
-    """Wrap result set of query in a DataFrame."""
+    """Wrap the batches of rows of a result set in a DataFrame."""
 
-    frame = DataFrame.from_records(data, columns=columns,
-                                   coerce_float=coerce_float)
+    frame = _frame_from_batches(batches, columns, coerce_float=coerce_float)
 
     _parse_date_columns(frame, parse_dates)
 
@@ -146,6 +208,40 @@ def _wrap_result(data, columns, index_col=None, coerce_float=True,
     return frame
 
 
+def _partition_edges(lower, upper, num_partitions):
+    """
+    Return the increasing edges of num_partitions ranges of about the same
+    width covering [lower, upper], for numbers, dates and datetimes.
+    """
+    delta = upper - lower
+    if isinstance(delta, (float, Decimal)):
+        edges = [lower + delta * i / num_partitions
+                 for i in range(num_partitions)]
+    else:
+        # keep integers, dates and datetimes exact
+        edges = [lower + delta * i // num_partitions
+                 for i in range(num_partitions)]
+    edges.append(upper)
+
+    # narrow ranges of integers or dates give empty partitions
+    return [edge for i, edge in enumerate(edges)
+            if i == 0 or edge != edges[i - 1]]
+
+
+def _is_pooled_engine(con):
+    """
+    Whether every thread can check out its own connection to the database
+    of the SQLAlchemy connectable con.
+    """
+    from sqlalchemy.engine import Engine
+    if not isinstance(con, Engine):
+        # a Connection can not be used from several threads
+        return False
+    # every connection to an in-memory sqlite database opens a new database
+    return not (con.dialect.name == 'sqlite' and
+                con.url.database in (None, '', ':memory:'))
+
+
 def execute(sql, con, cur=None, params=None):
     """
     Execute the given SQL query using the provided connection object.
@@ -179,7 +275,8 @@ def execute(sql, con, cur=None, params=None):
 
 def read_sql_table(table_name, con, schema=None, index_col=None,
                    coerce_float=True, parse_dates=None, columns=None,
-                   chunksize=None):
+                   chunksize=None, partition_column=None,
+                   num_partitions=None):
     """Read SQL database table into a DataFrame.
 
     Given a table name and a SQLAlchemy connectable, returns a DataFrame.
@@ -213,6 +310,20 @@ def read_sql_table(table_name, con, schema=None, index_col=None,
     chunksize : int, default None
         If specified, returns an iterator where `chunksize` is the number of
         rows to include in each chunk.
+    partition_column : string, default None
+        Name of a numeric, date or datetime column used to split the table
+        in ``num_partitions`` ranges of values that are read concurrently,
+        each in a thread with its own connection of the pool of the engine.
+        The pieces are concatenated in increasing order of the ranges. Rows
+        where the column is NULL are read with the first range. With
+        ``chunksize`` the ranges are read one after the other.
+
+        .. versionadded:: 0.23.0
+    num_partitions : int, default None
+        Number of ranges to split the table in when ``partition_column`` is
+        given, defaults to the number of CPUs.
+
+        .. versionadded:: 0.23.0
 
     Returns
     -------
@@ -222,6 +333,10 @@ def read_sql_table(table_name, con, schema=None, index_col=None,
     -----
     Any datetime values with time zone information will be converted to UTC.
 
+    The partitions are only read concurrently when ``con`` is an Engine
+    (or database string URI) whose connections all access the same
+    database, i.e. not for an in-memory SQLite database.
+
     See also
     --------
     read_sql_query : Read SQL query into a DataFrame.
@@ -244,7 +359,8 @@ def read_sql_table(table_name, con, schema=None, index_col=None,
     pandas_sql = SQLDatabase(con, meta=meta)
     table = pandas_sql.read_table(
         table_name, index_col=index_col, coerce_float=coerce_float,
-        parse_dates=parse_dates, columns=columns, chunksize=chunksize)
+        parse_dates=parse_dates, columns=columns, chunksize=chunksize,
+        partition_column=partition_column, num_partitions=num_partitions)
 
     if table is not None:
         return table
@@ -398,7 +514,7 @@ def read_sql(sql, con, index_col=None, coerce_float=True, params=None,
 
 
 def to_sql(frame, name, con, schema=None, if_exists='fail', index=True,
-           index_label=None, chunksize=None, dtype=None):
+           index_label=None, chunksize=None, dtype=None, method=None):
     """
     Write records stored in a DataFrame to a SQL database.
 
@@ -432,10 +548,23 @@ def to_sql(frame, name, con, schema=None, if_exists='fail', index=True,
         Optional specifying the datatype for columns. The SQL type should
         be a SQLAlchemy type, or a string for sqlite3 fallback connection.
         If all columns are of the same type, one single value can be used.
+    method : {None, 'multi', callable}, default None
+        Controls the SQL insertion clause used:
+
+        - None : Uses standard SQL ``INSERT`` clause (one per row).
+        - 'multi': Pass multiple values in a single ``INSERT`` clause.
+        - callable with signature ``(pd_table, conn, keys, data)``, called
+          for every chunk of rows with the column names ``keys`` and
+          ``data``, a list of the object arrays holding the values of each
+          column. This allows plugging in bulk loaders such as
+          ``COPY FROM STDIN``.
+
+        .. versionadded:: 0.23.0
 
     """
     if if_exists not in ('fail', 'replace', 'append'):
         raise ValueError("'{0}' is not valid for if_exists".format(if_exists))
+    _validate_insert_method(method)
 
     pandas_sql = pandasSQL_builder(con, schema=schema)
 
@@ -447,7 +576,12 @@ def to_sql(frame, name, con, schema=None, if_exists='fail', index=True,
 
     pandas_sql.to_sql(frame, name, if_exists=if_exists, index=index,
                       index_label=index_label, schema=schema,
-                      chunksize=chunksize, dtype=dtype)
+                      chunksize=chunksize, dtype=dtype, method=method)
+
+
+def _validate_insert_method(method):
+    if method is not None and method != 'multi' and not callable(method):
+        raise ValueError("'{0}' is not valid for method".format(method))
 
 
 def has_table(table_name, con, schema=None):
@@ -615,7 +749,21 @@ class SQLTable(PandasObject):
         data = [{k: v for k, v in zip(keys, row)} for row in data_iter]
         conn.execute(self.insert_statement(), data)
 
-    def insert(self, chunksize=None):
+    def _execute_insert_multi(self, conn, keys, data_iter):
+        """ insert all rows with a single multi-row VALUES statement """
+        data = [{k: v for k, v in zip(keys, row)} for row in data_iter]
+        conn.execute(self.insert_statement().values(data))
+
+    def insert(self, chunksize=None, method=None):
+        if method is None:
+            exec_insert = self._execute_insert
+        elif method == 'multi':
+            exec_insert = self._execute_insert_multi
+        elif callable(method):
+            exec_insert = None
+        else:
+            raise ValueError("'{0}' is not valid for method".format(method))
+
         keys, data_list = self.insert_data()
 
         nrows = len(self.frame)
@@ -637,8 +785,12 @@ class SQLTable(PandasObject):
                 if start_i >= end_i:
                     break
 
-                chunk_iter = zip(*[arr[start_i:end_i] for arr in data_list])
-                self._execute_insert(conn, keys, chunk_iter)
+                chunk = [arr[start_i:end_i] for arr in data_list]
+                if exec_insert is None:
+                    # user defined loaders receive the column arrays
+                    method(self, conn, keys, chunk)
+                else:
+                    exec_insert(conn, keys, zip(*chunk))
 
     def _query_iterator(self, result, chunksize, columns, coerce_float=True,
                         parse_dates=None):
@@ -649,8 +801,8 @@ class SQLTable(PandasObject):
             if not data:
                 break
             else:
-                self.frame = DataFrame.from_records(
-                    data, columns=columns, coerce_float=coerce_float)
+                self.frame = _frame_from_batches(
+                    [data], columns, coerce_float=coerce_float)
 
                 self._harmonize_columns(parse_dates=parse_dates)
 
@@ -660,7 +812,7 @@ class SQLTable(PandasObject):
                 yield self.frame
 
     def read(self, coerce_float=True, parse_dates=None, columns=None,
-             chunksize=None):
+             chunksize=None, partition_column=None, num_partitions=None):
 
         if columns is not None and len(columns) > 0:
             from sqlalchemy import select
@@ -671,6 +823,13 @@ class SQLTable(PandasObject):
         else:
             sql_select = self.table.select()
 
+        if partition_column is not None:
+            return self._read_partitions(sql_select, partition_column,
+                                         num_partitions,
+                                         coerce_float=coerce_float,
+                                         parse_dates=parse_dates,
+                                         chunksize=chunksize)
+
         result = self.pd_sql.execute(sql_select)
         column_names = result.keys()
 
@@ -679,9 +838,9 @@ class SQLTable(PandasObject):
                                         coerce_float=coerce_float,
                                         parse_dates=parse_dates)
         else:
-            data = result.fetchall()
-            self.frame = DataFrame.from_records(
-                data, columns=column_names, coerce_float=coerce_float)
+            self.frame = _frame_from_batches(
+                _fetch_batches(result.fetchmany), column_names,
+                coerce_float=coerce_float)
 
             self._harmonize_columns(parse_dates=parse_dates)
 
@@ -690,6 +849,114 @@ class SQLTable(PandasObject):
 
             return self.frame
 
+    def _partition_selects(self, sql_select, partition_column,
+                           num_partitions):
+        """
+        Split sql_select into num_partitions selects over contiguous ranges
+        of the values of partition_column
+        """
+        from sqlalchemy import select, func, and_, or_
+        from sqlalchemy.types import Numeric, Integer, Date, DateTime
+
+        if num_partitions is None:
+            num_partitions = cpu_count()
+        elif not is_integer(num_partitions) or num_partitions < 1:
+            raise ValueError("num_partitions must be a positive integer")
+
+        try:
+            col = self.table.c[partition_column]
+        except KeyError:
+            raise ValueError("partition_column '{0}' is not a column of "
+                             "table '{1}'".format(partition_column,
+                                                  self.name))
+
+        # the ranges are computed from the difference of the bounds
+        if not isinstance(col.type, (Numeric, Integer, Date, DateTime)):
+            raise ValueError("partition_column '{0}' must be a numeric, date "
+                             "or datetime column, not {1}".format(
+                                 partition_column, col.type))
+
+        bounds = select([func.min(col), func.max(col)])
+        lower, upper = self.pd_sql.execute(bounds).fetchone()
+        if lower is None or lower == upper:
+            return [sql_select]
+
+        edges = _partition_edges(lower, upper, num_partitions)
+        selects = []
+        for i, (start, stop) in enumerate(zip(edges[:-1], edges[1:])):
+            if i == len(edges) - 2:
+                cond = and_(col >= start, col <= stop)
+            else:
+                cond = and_(col >= start, col < stop)
+            if i == 0:
+                # rows with a NULL partition_column are read with the first
+                cond = or_(cond, col.is_(None))
+            selects.append(sql_select.where(cond))
+        return selects
+
+    def _read_partitions(self, sql_select, partition_column, num_partitions,
+                         coerce_float=True, parse_dates=None,
+                         chunksize=None):
+        selects = self._partition_selects(sql_select, partition_column,
+                                          num_partitions)
+
+        if chunksize is not None:
+            return self._partition_iterator(selects, chunksize,
+                                            coerce_float=coerce_float,
+                                            parse_dates=parse_dates)
+
+        connectable = self.pd_sql.connectable
+        concurrent = len(selects) > 1 and _is_pooled_engine(connectable)
+
+        def read_partition(partition_select):
+            if concurrent:
+                # every thread checks out its own connection of the pool
+                with connectable.connect() as conn:
+                    result = conn.execute(partition_select)
+                    return _frame_from_batches(
+                        _fetch_batches(result.fetchmany), result.keys(),
+                        coerce_float=coerce_float)
+            result = self.pd_sql.execute(partition_select)
+            return _frame_from_batches(
+                _fetch_batches(result.fetchmany), result.keys(),
+                coerce_float=coerce_float)
+
+        if concurrent:
+            pool = ThreadPool(len(selects))
+            try:
+                frames = pool.map(read_partition, selects)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            frames = [read_partition(s) for s in selects]
+
+        # empty partitions have object columns, which would upcast the others
+        frames = [frame for frame in frames if len(frame)] or frames[:1]
+        if len(frames) == 1:
+            self.frame = frames[0]
+        else:
+            self.frame = concat(frames, ignore_index=True)
+
+        self._harmonize_columns(parse_dates=parse_dates)
+
+        if self.index is not None:
+            self.frame.set_index(self.index, inplace=True)
+
+        return self.frame
+
+    def _partition_iterator(self, selects, chunksize, coerce_float=True,
+                            parse_dates=None):
+        """Return generator through the chunks of every partition."""
+
+        for partition_select in selects:
+            result = self.pd_sql.execute(partition_select)
+            for frame in self._query_iterator(result, chunksize,
+                                              result.keys(),
+                                              coerce_float=coerce_float,
+                                              parse_dates=parse_dates):
+                yield frame
+
     def _index_name(self, index, index_label):
         # for writing: index=True to include index in sql table
         if index is True:
@@ -955,7 +1222,8 @@ class SQLDatabase(PandasSQL):
 
     def read_table(self, table_name, index_col=None, coerce_float=True,
                    parse_dates=None, columns=None, schema=None,
-                   chunksize=None):
+                   chunksize=None, partition_column=None,
+                   num_partitions=None):
         """Read SQL database table into a DataFrame.
 
         Parameters
@@ -986,6 +1254,11 @@ class SQLDatabase(PandasSQL):
         chunksize : int, default None
             If specified, return an iterator where `chunksize` is the number
             of rows to include in each chunk.
+        partition_column : string, default None
+            Column whose ranges of values are read concurrently, see
+            :func:`read_sql_table`.
+        num_partitions : int, default None
+            Number of ranges to read when ``partition_column`` is given.
 
         Returns
         -------
@@ -1000,7 +1273,9 @@ class SQLDatabase(PandasSQL):
         table = SQLTable(table_name, self, index=index_col, schema=schema)
         return table.read(coerce_float=coerce_float,
                           parse_dates=parse_dates, columns=columns,
-                          chunksize=chunksize)
+                          chunksize=chunksize,
+                          partition_column=partition_column,
+                          num_partitions=num_partitions)
 
     @staticmethod
     def _query_iterator(result, chunksize, columns, index_col=None,
@@ -1012,7 +1287,7 @@ class SQLDatabase(PandasSQL):
             if not data:
                 break
             else:
-                yield _wrap_result(data, columns, index_col=index_col,
+                yield _wrap_result([data], columns, index_col=index_col,
                                    coerce_float=coerce_float,
                                    parse_dates=parse_dates)
 
@@ -1069,8 +1344,8 @@ class SQLDatabase(PandasSQL):
                                         coerce_float=coerce_float,
                                         parse_dates=parse_dates)
         else:
-            data = result.fetchall()
-            frame = _wrap_result(data, columns, index_col=index_col,
+            frame = _wrap_result(_fetch_batches(result.fetchmany), columns,
+                                 index_col=index_col,
                                  coerce_float=coerce_float,
                                  parse_dates=parse_dates)
             return frame
@@ -1078,7 +1353,8 @@ class SQLDatabase(PandasSQL):
     read_sql = read_query
 
     def to_sql(self, frame, name, if_exists='fail', index=True,
-               index_label=None, schema=None, chunksize=None, dtype=None):
+               index_label=None, schema=None, chunksize=None, dtype=None,
+               method=None):
         """
         Write records stored in a DataFrame to a SQL database.
 
@@ -1108,6 +1384,10 @@ class SQLDatabase(PandasSQL):
             Optional specifying the datatype for columns. The SQL type should
             be a SQLAlchemy type. If all columns are of the same type, one
             single value can be used.
+        method : {None, 'multi', callable}, default None
+            Controls the SQL insertion clause used, see :func:`to_sql`.
+
+            .. versionadded:: 0.23.0
 
         """
         if dtype and not is_dict_like(dtype):
@@ -1124,7 +1404,7 @@ class SQLDatabase(PandasSQL):
                          if_exists=if_exists, index_label=index_label,
                          schema=schema, dtype=dtype)
         table.create()
-        table.insert(chunksize)
+        table.insert(chunksize, method=method)
         if (not name.isdigit() and not name.islower()):
             # check for potentially case sensitivity issues (GH7815)
             # Only check when name is not a number and name is not lower case
@@ -1222,6 +1502,9 @@ def _get_valid_sqlite_name(name):
     return '"' + uname.replace('"', '""') + '"'
 
 
+# the default SQLITE_MAX_VARIABLE_NUMBER of sqlite < 3.32
+_SQLITE_MAX_VARIABLE_NUMBER = 999
+
 _SAFE_NAMES_WARNING = ("The spaces in these column names will not be changed. "
                        "In pandas versions < 0.14, spaces were converted to "
                        "underscores.")
@@ -1250,7 +1533,7 @@ class SQLiteTable(SQLTable):
             for stmt in self.table:
                 conn.execute(stmt)
 
-    def insert_statement(self):
+    def insert_statement(self, num_rows=1):
         names = list(map(text_type, self.frame.columns))
         wld = '?'  # wildcard char
         escape = _get_valid_sqlite_name
@@ -1260,14 +1543,27 @@ class SQLiteTable(SQLTable):
 
         bracketed_names = [escape(column) for column in names]
         col_names = ','.join(bracketed_names)
-        wildcards = ','.join([wld] * len(names))
-        insert_statement = 'INSERT INTO %s (%s) VALUES (%s)' % (
+        row_wildcards = '(%s)' % ','.join([wld] * len(names))
+        wildcards = ','.join([row_wildcards] * num_rows)
+        insert_statement = 'INSERT INTO %s (%s) VALUES %s' % (
             escape(self.name), col_names, wildcards)
         return insert_statement
 
     def _execute_insert(self, conn, keys, data_iter):
-        data_list = list(data_iter)
-        conn.executemany(self.insert_statement(), data_list)
+        # executemany consumes the rows lazily, without building a list
+        conn.executemany(self.insert_statement(), data_iter)
+
+    def _execute_insert_multi(self, conn, keys, data_iter):
+        # sqlite limits the number of parameters of a single statement
+        num_rows = max(_SQLITE_MAX_VARIABLE_NUMBER // len(keys), 1)
+        statement = self.insert_statement(num_rows=num_rows)
+        while True:
+            rows = list(islice(data_iter, num_rows))
+            if not rows:
+                break
+            if len(rows) < num_rows:
+                statement = self.insert_statement(num_rows=len(rows))
+            conn.execute(statement, [val for row in rows for val in row])
 
     def _create_table_setup(self):
         """
@@ -1402,7 +1698,7 @@ class SQLiteDatabase(PandasSQL):
                 cursor.close()
                 break
             else:
-                yield _wrap_result(data, columns, index_col=index_col,
+                yield _wrap_result([data], columns, index_col=index_col,
                                    coerce_float=coerce_float,
                                    parse_dates=parse_dates)
 
@@ -1419,22 +1715,16 @@ class SQLiteDatabase(PandasSQL):
                                         coerce_float=coerce_float,
                                         parse_dates=parse_dates)
         else:
-            data = self._fetchall_as_list(cursor)
-            cursor.close()
-
-            frame = _wrap_result(data, columns, index_col=index_col,
+            frame = _wrap_result(_fetch_batches(cursor.fetchmany), columns,
+                                 index_col=index_col,
                                  coerce_float=coerce_float,
                                  parse_dates=parse_dates)
+            cursor.close()
             return frame
 
-    def _fetchall_as_list(self, cur):
-        result = cur.fetchall()
-        if not isinstance(result, list):
-            result = list(result)
-        return result
-
     def to_sql(self, frame, name, if_exists='fail', index=True,
-               index_label=None, schema=None, chunksize=None, dtype=None):
+               index_label=None, schema=None, chunksize=None, dtype=None,
+               method=None):
         """
         Write records stored in a DataFrame to a SQL database.
 
@@ -1463,6 +1753,10 @@ class SQLiteDatabase(PandasSQL):
             Optional specifying the datatype for columns. The SQL type should
             be a string. If all columns are of the same type, one single value
             can be used.
+        method : {None, 'multi', callable}, default None
+            Controls the SQL insertion clause used, see :func:`to_sql`.
+
+            .. versionadded:: 0.23.0
 
         """
         if dtype and not is_dict_like(dtype):
@@ -1478,7 +1772,7 @@ class SQLiteDatabase(PandasSQL):
                             if_exists=if_exists, index_label=index_label,
                             dtype=dtype)
         table.create()
-        table.insert(chunksize)
+        table.insert(chunksize, method=method)
 
     def has_table(self, name, schema=None):
         # TODO(wesm): unused?
@@ -340,6 +340,146 @@ class TestDataFrameBlockInternals(TestData):
         copy = self.mixed_frame.copy()
         assert copy._data is not self.mixed_frame._data
 
+    @pytest.mark.parametrize('setter', [
+        lambda df: df.__setitem__('a', 10),
+        lambda df: df.loc.__setitem__((0, 'a'), 10),
+        lambda df: df.iloc.__setitem__((0, 0), 10),
+        lambda df: df.at.__setitem__((0, 'a'), 10),
+        lambda df: df.iat.__setitem__((0, 0), 10),
+        lambda df: df.fillna(10, inplace=True),
+        lambda df: df.replace(1.0, 10, inplace=True)])
+    def test_copy_on_write(self, setter):
+        df = DataFrame({'a': [1.0, 2.0, np.nan], 'b': [4.0, 5.0, 6.0]})
+        expected = df.copy()
+
+        with pd.option_context('mode.copy_on_write', True):
+            cop = df.copy()
+            assert np.shares_memory(cop._data.blocks[0].values,
+                                    df._data.blocks[0].values)
+
+            # modifying the copy does not modify the original
+            setter(cop)
+            assert not cop.equals(expected)
+            assert_frame_equal(df, expected)
+
+            # and the other way around
+            cop = df.copy()
+            result = cop.copy()
+            setter(df)
+            assert_frame_equal(cop, result)
+
+    def test_copy_on_write_series(self):
+        s = Series([1, 2, 3])
+
+        with pd.option_context('mode.copy_on_write', True):
+            cop = s.copy()
+            assert np.shares_memory(cop._values, s._values)
+            assert not cop._values.flags.writeable
+
+            cop[0] = 10
+            tm.assert_series_equal(s, Series([1, 2, 3]))
+            tm.assert_series_equal(cop, Series([10, 2, 3]))
+
+            # the original is the only owner of its data again
+            s[0] = 5
+            tm.assert_series_equal(s, Series([5, 2, 3]))
+            assert s._values.flags.writeable
+
+    def test_copy_on_write_values(self):
+        df = DataFrame({'a': [1.0, 2.0, 3.0]})
+        s = Series([1, 2, 3])
+
+        with pd.option_context('mode.copy_on_write', True):
+            cop = df.copy()
+            df.values[0, 0] = 10
+            assert df.loc[0, 'a'] == 10
+            assert_frame_equal(cop, DataFrame({'a': [1.0, 2.0, 3.0]}))
+
+            cop = s.copy()
+            s.values[0] = 10
+            assert s[0] == 10
+            tm.assert_series_equal(cop, Series([1, 2, 3]))
+
+    def test_copy_on_write_external_views(self):
+        # data that views may write to is copied right away
+        df = DataFrame({'a': [1.0, 2.0, 3.0]})
+        values = np.array([[1.0, 2.0], [3.0, 4.0]])
+        frame = DataFrame(values, columns=['a', 'b'])
+
+        with pd.option_context('mode.copy_on_write', True):
+            for view in [lambda: df['a'], lambda: df.iloc[:2],
+                         lambda: df.copy(deep=False), lambda: df.values]:
+                v = view()
+                cop = df.copy()
+                assert not np.shares_memory(cop._data.blocks[0].values,
+                                            df._data.blocks[0].values)
+                del v
+
+            col = df['a']
+            cop = df.copy()
+            col[0] = 10
+            assert_frame_equal(cop, DataFrame({'a': [1.0, 2.0, 3.0]}))
+
+            # the block values are a view on the array of the caller
+            cop = frame.copy()
+            values[0, 0] = 10
+            assert_frame_equal(cop, DataFrame([[1.0, 2.0], [3.0, 4.0]],
+                                              columns=['a', 'b']))
+
+    def test_copy_on_write_readers(self):
+        # reading the data does not unshare it
+        df = DataFrame({'a': [1.0, 2.0, 3.0], 'b': [1, 2, 3]})
+
+        with pd.option_context('mode.copy_on_write', True):
+            cop = df.copy()
+            cop.sum()
+            cop.mean(axis=1)
+            for blk, other in zip(cop._data.blocks, df._data.blocks):
+                assert np.shares_memory(blk.values, other.values)
+
+            cop = df[['a']].copy()
+            cop.sum()
+            assert not cop._values.flags.writeable
+            assert not cop['a']._values.flags.writeable
+
+    def test_copy_on_write_set_value(self):
+        # a scalar write only unshares the block holding the column
+        df = DataFrame({'a': [1.0, 2.0, 3.0], 'b': [1, 2, 3]})
+
+        with pd.option_context('mode.copy_on_write', True):
+            for setter in [lambda cop: cop.at.__setitem__((0, 'a'), 10),
+                           lambda cop: cop.iat.__setitem__((0, 0), 10)]:
+                cop = df.copy()
+                setter(cop)
+                assert cop.loc[0, 'a'] == 10
+                assert df.loc[0, 'a'] == 1
+                assert np.shares_memory(cop._data.blocks[1].values,
+                                        df._data.blocks[1].values)
+                assert not np.shares_memory(cop._data.blocks[0].values,
+                                            df._data.blocks[0].values)
+
+    def test_copy_on_write_view_of_copy(self):
+        # a column of a copy keeps the data of the original from becoming
+        # writeable again once the copy is gone
+        df = DataFrame({'a': [1.0, 2.0, 3.0]})
+
+        with pd.option_context('mode.copy_on_write', True,
+                               'mode.chained_assignment', None):
+            col = df.copy()['a']
+            df.loc[0, 'a'] = 10
+            tm.assert_series_equal(col, Series([1.0, 2.0, 3.0], name='a'))
+
+    def test_copy_on_write_chained_assignment(self):
+        df = DataFrame({'a': [1.0, 2.0, 3.0]})
+
+        with pd.option_context('mode.copy_on_write', True,
+                               'mode.chained_assignment', None):
+            cop = df.copy()
+            cop['a'][0] = 10
+
+        assert_frame_equal(df, DataFrame({'a': [1.0, 2.0, 3.0]}))
+        assert_frame_equal(cop, DataFrame({'a': [10.0, 2.0, 3.0]}))
+
     def test_pickle(self):
         unpickled = tm.round_trip_pickle(self.mixed_frame)
         assert_frame_equal(self.mixed_frame, unpickled)
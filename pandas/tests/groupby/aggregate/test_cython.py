@@ -204,3 +204,45 @@ def test_cython_with_timestamp_and_nat(op, data):
 
     result = df.groupby('a').aggregate(op)
     tm.assert_frame_equal(expected, result)
+
+
+@pytest.mark.parametrize('op', ['sum', 'prod', 'min', 'max', 'mean', 'var',
+                                'first', 'last'])
+@pytest.mark.parametrize('num_threads', [2, 3, 8])
+def test_cython_agg_threaded(monkeypatch, op, num_threads):
+    monkeypatch.setattr(pd.core.groupby.BaseGrouper,
+                        '_min_rows_per_thread', 10)
+
+    N = 1000
+    df = DataFrame({'key': np.random.randint(0, 30, N),
+                    'float': np.random.randn(N),
+                    'int': np.random.randint(-3, 4, N),
+                    'dates': pd.date_range('2000-01-01', periods=N,
+                                           freq='s')})
+    df.loc[::7, 'float'] = nan
+    df.loc[df.key == 3, 'float'] = nan
+    df.loc[df.key == 5, 'dates'] = NaT
+    if op == 'prod':
+        df = df.drop('dates', axis=1)
+
+    grouped = df.groupby('key')
+    expected = getattr(grouped, op)()
+    with pd.option_context('compute.groupby_threads', num_threads):
+        result = getattr(grouped, op)()
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize('op', ['sum', 'prod'])
+def test_cython_agg_threaded_min_count(monkeypatch, op):
+    monkeypatch.setattr(pd.core.groupby.BaseGrouper,
+                        '_min_rows_per_thread', 10)
+
+    s = Series(np.random.randn(100))
+    s[:60] = nan
+    labels = np.arange(100) // 20
+
+    expected = getattr(s.groupby(labels), op)(min_count=10)
+    with pd.option_context('compute.groupby_threads', 4):
+        result = getattr(s.groupby(labels), op)(min_count=10)
+    tm.assert_series_equal(result, expected)
+    assert result.isna().sum() == 3
@@ -21,6 +21,7 @@ from pandas import (
 from pandas.core.groupby import SpecificationError
 from pandas.io.formats.printing import pprint_thing
 import pandas.util.testing as tm
+import pandas.util._test_decorators as td
 
 
 def test_agg_api():
@@ -500,3 +501,32 @@ def test_agg_category_nansum():
                                                    name='A'),
                          name='B')
     tm.assert_series_equal(result, expected)
+
+
+@td.skip_if_no('numba')
+@pytest.mark.parametrize('by', [[0, 1, 0, 2, 2, 1, 0, 1],
+                                [[0, 0, 1, 1, 0, 0, 1, 1],
+                                 [0, 1, 0, 1, 0, 1, 0, 1]]])
+def test_agg_numba(by):
+    s = pd.Series(np.arange(8.), name='x')
+
+    def f(x, offset):
+        return x.max() - x.min() + offset
+
+    result = s.groupby(by).agg(f, 1., engine='numba')
+    expected = s.groupby(by).agg(lambda x: f(x.values, 1.))
+    tm.assert_series_equal(result, expected)
+
+    result = s.groupby(by).transform(f, 1., engine='numba')
+    expected = s.groupby(by).transform(lambda x: f(x.values, 1.))
+    tm.assert_series_equal(result, expected)
+
+
+def test_agg_numba_invalid():
+    s = pd.Series(['a', 'b'])
+    with tm.assert_raises_regex(ValueError, "engine must be either"):
+        s.groupby([0, 1]).agg(len, engine='foo')
+    with tm.assert_raises_regex(ValueError, "keyword arguments"):
+        s.groupby([0, 1]).agg(len, engine='numba', foo=1)
+    with tm.assert_raises_regex(TypeError, "requires numeric data"):
+        s.groupby([0, 1]).agg(len, engine='numba')
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+"""
+test streaming aggregation over chunks
+"""
+
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from pandas import DataFrame, read_csv
+from pandas.compat import StringIO
+from pandas.core.groupby import ChunkedGroupBy
+import pandas.util.testing as tm
+
+
+@pytest.fixture
+def df():
+    N = 1000
+    df = DataFrame({'a': np.random.randint(0, 10, N),
+                    'b': np.random.randint(0, 3, N),
+                    'c': np.random.randn(N),
+                    'd': np.random.randint(0, 100, N),
+                    'e': pd.date_range('2000-01-01', periods=N, freq='H'),
+                    'f': np.random.choice(['x', 'y', 'z'], N)})
+    df.loc[::7, 'c'] = np.nan
+    df.loc[df.a == 3, 'c'] = np.nan
+    return df
+
+
+def _chunks(df, chunksize=128):
+    return (df.iloc[i:i + chunksize] for i in range(0, len(df), chunksize))
+
+
+@pytest.mark.parametrize('func', ['sum', 'count', 'min', 'max', 'mean',
+                                  'var', 'std', 'first', 'last'])
+@pytest.mark.parametrize('by', ['a', ['a', 'b']])
+def test_agg(df, func, by):
+    result = ChunkedGroupBy(_chunks(df), by).agg(func)
+    expected = df.groupby(by).agg(func)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_agg_prod(df):
+    df = df[['a', 'b']]
+    result = ChunkedGroupBy(_chunks(df), 'a').agg('prod')
+    expected = df.groupby('a').agg('prod')
+    tm.assert_frame_equal(result, expected)
+
+
+def test_agg_size(df):
+    result = ChunkedGroupBy(_chunks(df), ['a', 'b']).agg('size')
+    expected = df.groupby(['a', 'b']).size()
+    tm.assert_series_equal(result, expected)
+
+
+def test_agg_dict_and_list(df):
+    spec = {'c': ['sum', 'mean', 'var'], 'd': 'max'}
+    result = ChunkedGroupBy(_chunks(df), 'a').agg(spec)
+    expected = df.groupby('a').agg(spec)
+    tm.assert_frame_equal(result, expected[result.columns])
+
+    result = ChunkedGroupBy(_chunks(df[['a', 'c', 'd']]), 'a').agg(
+        ['min', 'mean'])
+    expected = df[['a', 'c', 'd']].groupby('a').agg(['min', 'mean'])
+    tm.assert_frame_equal(result, expected)
+
+
+def test_agg_int64_precision():
+    # groups only in some chunks must not round trip through float64
+    big = 2 ** 60
+    df = DataFrame({'a': [0, 0, 1, 1, 2, 2],
+                    'd': np.array([big, 1, big, 3, big, 5], dtype='int64')})
+    result = ChunkedGroupBy(_chunks(df, chunksize=2), 'a').agg(
+        ['sum', 'count'])
+    expected = df.groupby('a').agg(['sum', 'count'])
+    tm.assert_frame_equal(result, expected)
+    assert (result.dtypes == np.int64).all()
+    assert result.loc[2, ('d', 'sum')] == big + 5
+
+
+def test_agg_int64_extrema():
+    big = 2 ** 62
+    df = DataFrame({'a': [0, 0, 1, 1, 2, 2, 0, 1],
+                    'd': np.array([big + 1, big + 3, big + 5, big + 2,
+                                   big + 7, big + 9, big + 4, big + 11],
+                                  dtype='int64')})
+    funcs = ['min', 'max', 'first', 'last']
+    result = ChunkedGroupBy(_chunks(df, chunksize=2), 'a').agg(funcs)
+    expected = df.groupby('a').agg(funcs)
+    tm.assert_frame_equal(result, expected)
+    assert (result.dtypes == np.int64).all()
+    assert result.loc[1, ('d', 'last')] == big + 11
+
+
+def test_agg_unsorted(df):
+    result = ChunkedGroupBy(_chunks(df), 'a', sort=False).agg('sum')
+    expected = df.groupby('a', sort=False).sum()
+    tm.assert_frame_equal(result, expected)
+
+
+def test_agg_invalid(df):
+    with tm.assert_raises_regex(ValueError, "'median' is not supported"):
+        ChunkedGroupBy(_chunks(df), 'a').agg('median')
+    with tm.assert_raises_regex(KeyError, "'g' does not exist"):
+        ChunkedGroupBy(_chunks(df), 'a').agg({'g': 'sum'})
+    with tm.assert_raises_regex(ValueError, "No chunks"):
+        ChunkedGroupBy(iter([]), 'a').agg('sum')
+
+
+def test_text_file_reader_groupby(df):
+    df = df[['a', 'b', 'c', 'd']]
+    data = df.to_csv(index=False)
+
+    reader = read_csv(StringIO(data), chunksize=100)
+    result = reader.groupby(['a', 'b']).agg({'c': ['mean', 'std'],
+                                             'd': ['sum', 'count']})
+    expected = df.groupby(['a', 'b']).agg({'c': ['mean', 'std'],
+                                           'd': ['sum', 'count']})
+    tm.assert_frame_equal(result, expected[result.columns])
@@ -21,6 +21,7 @@ import numpy as np
 
 import pandas.core.nanops as nanops
 import pandas.util.testing as tm
+import pandas.util._test_decorators as td
 import pandas as pd
 from .common import MixIn
 
@@ -2922,6 +2923,87 @@ class TestGroupBy(MixIn):
         with tm.assert_raises_regex(KeyError, "(7, 8)"):
             df.groupby((7, 8)).mean()
 
+    @pytest.mark.parametrize('backend', [
+        'thread', pytest.param('process', marks=td.skip_if_windows)])
+    @pytest.mark.parametrize('n_jobs', [2, 3, -1])
+    def test_apply_parallel(self, backend, n_jobs):
+        df = DataFrame({'key': np.random.randint(0, 20, 200),
+                        'key2': np.random.randint(0, 2, 200),
+                        'value': np.random.randn(200)})
+        df.loc[::17, 'key'] = np.nan
+        engine_kwargs = {'n_jobs': n_jobs, 'backend': backend}
+
+        funcs = [lambda g: g.value.max() - g.value.min(),
+                 lambda g: g.sort_values('value').head(2),
+                 lambda g: g.assign(value=g.value - g.value.mean())]
+        for by in ['key', ['key', 'key2']]:
+            grouped = df.groupby(by)
+            for f in funcs:
+                expected = grouped.apply(f)
+                result = grouped.apply(f, engine_kwargs=engine_kwargs)
+                assert_equal = (assert_series_equal
+                                if isinstance(expected, Series)
+                                else assert_frame_equal)
+                assert_equal(result, expected)
+
+        # positional and keyword arguments are passed along
+        result = df.groupby('key').value.apply(
+            lambda x, a, b: x.sum() * a + b, 2, b=1,
+            engine_kwargs=engine_kwargs)
+        expected = df.groupby('key').value.sum() * 2 + 1
+        assert_series_equal(result, expected)
+
+        # including those named like the engine options
+        result = df.groupby('key').value.apply(
+            lambda x, n_jobs, backend: x.sum() * n_jobs, n_jobs=3,
+            backend='foo')
+        expected = df.groupby('key').value.sum() * 3
+        assert_series_equal(result, expected)
+
+    def test_apply_parallel_invalid(self):
+        grouped = DataFrame({'a': [1, 2], 'b': [1, 2]}).groupby('a')
+        for n_jobs in [0, -2, 1.5]:
+            with tm.assert_raises_regex(ValueError, "n_jobs must be"):
+                grouped.apply(len, engine_kwargs={'n_jobs': n_jobs})
+        with tm.assert_raises_regex(ValueError, "backend must be"):
+            grouped.apply(len, engine_kwargs={'n_jobs': 2, 'backend': 'foo'})
+        with tm.assert_raises_regex(ValueError, "does not support nogil"):
+            grouped.apply(len, engine_kwargs={'nogil': True})
+
+    def test_groupby_unsorted_multiple_keys(self):
+        # multiple numeric keys with sort=False are labelled by hashing
+        N = 1000
+        df = DataFrame({'a': np.random.randint(0, 10, N),
+                        'b': np.random.randint(0, 10, N).astype(float),
+                        'c': pd.date_range('2000', periods=10).take(
+                            np.random.randint(0, 10, N)),
+                        'value': np.random.randn(N)})
+        df.loc[::13, 'b'] = np.nan
+        keys = ['a', 'b', 'c']
+
+        grouped = df.groupby(keys, sort=False)
+        assert grouped.grouper._hashed_group_info is not None
+
+        first = df[keys].dropna().drop_duplicates()
+        expected_index = MultiIndex.from_arrays([first[k] for k in keys])
+        expected = df.groupby(keys).sum().reindex(expected_index)
+        assert_frame_equal(grouped.sum(), expected)
+        assert_frame_equal(grouped.first(), df.groupby(keys).first().reindex(
+            expected_index))
+
+        result = grouped.value.size()
+        assert_series_equal(result, df.groupby(keys).value.size().reindex(
+            expected_index))
+
+        # the levels are the observed keys in order of appearance, and the
+        # keys are not factorized over all rows
+        result = grouped.sum().index
+        for level, key in zip(result.levels, keys):
+            tm.assert_index_equal(level, Index(first[key].unique(),
+                                               name=key))
+        for ping in grouped.grouper.groupings:
+            assert ping._labels is None
+
 
 def _check_groupby(df, result, keys, field, f=lambda x: x.sum()):
     tups = lmap(tuple, df[keys].values)
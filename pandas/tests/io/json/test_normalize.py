@@ -206,6 +206,20 @@ class TestJSONNormalize(object):
 
         tm.assert_frame_equal(result, expected)
 
+    def test_nested_records_columnar(self):
+        data = [{'id': 1, 'name': {'first': 'Coleen', 'last': 'Volk'}},
+                {'name': {'given': 'Mose', 'family': 'Regner'}},
+                {'id': 2, 'name': 'Faye Raker',
+                 'address': {'zip': {}, 'geo': {'lat': 1.5}}}]
+
+        result = json_normalize(data)
+        expected = DataFrame(nested_to_record(data))
+        tm.assert_frame_equal(result, expected)
+
+        result = json_normalize(data, sep='_')
+        expected = DataFrame(nested_to_record(data, sep='_'))
+        tm.assert_frame_equal(result, expected)
+
     def test_non_ascii_key(self):
         if compat.PY3:
             testjson = (
@@ -7,6 +7,8 @@ import os
 import numpy as np
 from pandas import (Series, DataFrame, DatetimeIndex, Timestamp,
                     read_json, compat)
+from pandas.api.types import CategoricalDtype
+from pandas.io.json import build_table_schema
 from datetime import timedelta
 import pandas as pd
 import json
@@ -785,6 +787,73 @@ class TestPandasContainer(object):
             result = read_json(json, date_unit=None)
             assert_frame_equal(result, df)
 
+    @pytest.mark.parametrize('lines', [False, True])
+    def test_read_json_schema(self, lines):
+        df = DataFrame({'a': [1, 2, 3],
+                        'b': [1.5, np.nan, 2.5],
+                        'c': ['x', 'y', 'x'],
+                        'd': pd.date_range('2013-01-01', periods=3),
+                        'e': pd.to_timedelta([1, 2, 3], unit='s'),
+                        'f': ['1', '2', '3']})
+        df['c'] = df['c'].astype(CategoricalDtype(['x', 'y']))
+
+        # durations are only written as epochs
+        json = df.drop('e', axis=1).to_json(orient='records', lines=lines,
+                                            date_format='iso')
+        schema = build_table_schema(df.drop('e', axis=1), index=False)
+        result = read_json(json, orient='records', lines=lines,
+                           schema=schema)
+        assert_frame_equal(result, df.drop('e', axis=1))
+
+        # a dict of dtypes, epoch dates are read in date_unit
+        json = df.to_json(orient='records', lines=lines, date_unit='s')
+        schema = {'a': 'float32', 'd': 'datetime64[ns]', 'e': 'm8[ns]',
+                  'f': 'int64'}
+        result = read_json(json, orient='records', lines=lines,
+                           schema=schema, date_unit='s')
+        expected = df.astype({'a': 'float32', 'f': 'int64'})
+        expected['c'] = expected['c'].astype(object)
+        assert_frame_equal(result, expected)
+
+    def test_read_json_schema_invalid(self):
+        json = '[{"a": 1}, {"a": "x"}]'
+        with pytest.raises(ValueError):
+            read_json(json, orient='records', schema={'a': 'int64'})
+        with tm.assert_raises_regex(ValueError, "typ='frame'"):
+            read_json('[1, 2]', typ='series', schema={'a': 'int64'})
+        with tm.assert_raises_regex(TypeError, "schema must be"):
+            read_json(json, orient='records', schema=['a'])
+
+    @pytest.mark.parametrize('lines', [False, True])
+    def test_read_json_schema_casts(self, lines):
+        def read(data, schema):
+            json = DataFrame(data).to_json(orient='records', lines=lines)
+            return read_json(json, orient='records', lines=lines,
+                             schema=schema)
+
+        # floats are not truncated to integers
+        result = read({'a': [1., 2.]}, {'a': 'int64'})
+        assert_frame_equal(result, DataFrame({'a': [1, 2]}))
+        with tm.assert_raises_regex(ValueError, "non-equivalent"):
+            read({'a': [1., 1.5]}, {'a': 'int64'})
+
+        # only booleans and 'true' / 'false' are booleans
+        result = read({'a': ['true', 'false']}, {'a': 'bool'})
+        assert_frame_equal(result, DataFrame({'a': [True, False]}))
+        with tm.assert_raises_regex(ValueError, "to bool"):
+            read({'a': ['true', 'no']}, {'a': 'bool'})
+        with tm.assert_raises_regex(ValueError, "to bool"):
+            read({'a': [1, 0]}, {'a': 'bool'})
+
+    def test_read_json_schema_fields_column(self):
+        # a column named fields is not a table schema
+        json = '[{"fields": 1, "a": 2}]'
+        result = read_json(json, orient='records',
+                           schema={'fields': 'int64', 'a': 'float64'})
+        expected = DataFrame({'a': [2.], 'fields': [1]},
+                             columns=['a', 'fields'])
+        assert_frame_equal(result, expected)
+
     def test_weird_nested_json(self):
         # this used to core dump the parser
         s = r'''{
@@ -65,6 +65,40 @@ def test_to_jsonl():
     assert_frame_equal(read_json(result, lines=True), df)
 
 
+@pytest.mark.parametrize("lines", [True, False])
+@pytest.mark.parametrize("chunksize,num_threads", [
+    (1, None), (2, None), (10, None), (None, 2), (1, 3)])
+def test_to_json_chunks(lines, chunksize, num_threads):
+    df = DataFrame({'a': range(5), 'b': ['x,"}', 'y', None, 'z\\', 'w'],
+                    'c': pd.date_range('20130101', periods=5)})
+    expected = df.to_json(orient='records', lines=lines)
+
+    result = df.to_json(orient='records', lines=lines, chunksize=chunksize,
+                        num_threads=num_threads)
+    assert result == expected
+
+    with ensure_clean('test.json') as path:
+        df.to_json(path, orient='records', lines=lines, chunksize=chunksize,
+                   num_threads=num_threads)
+        with open(path) as fh:
+            assert fh.read() == expected
+
+    result = df.iloc[:0].to_json(orient='records', lines=lines,
+                                 chunksize=chunksize, num_threads=num_threads)
+    assert result == df.iloc[:0].to_json(orient='records', lines=lines)
+
+
+def test_to_json_chunks_invalid():
+    df = DataFrame({'a': [1, 2]})
+    msg = "'chunksize' and 'num_threads' are only valid"
+    with tm.assert_raises_regex(ValueError, msg):
+        df.to_json(chunksize=1)
+    with tm.assert_raises_regex(ValueError, msg):
+        df.to_json(orient='split', num_threads=2)
+    with tm.assert_raises_regex(ValueError, "'chunksize' must be an integer"):
+        df.to_json(orient='records', chunksize=0)
+
+
 @pytest.mark.parametrize("chunksize", [1, 1.0])
 def test_readjson_chunks(lines_json_df, chunksize):
     # Basic test that read_json(chunks=True) gives the same result as
@@ -167,3 +201,30 @@ def test_readjson_chunks_multiple_empty_lines(chunksize):
         test = pd.concat(test)
     tm.assert_frame_equal(
         orig, test, obj="chunksize: {chunksize}".format(chunksize=chunksize))
+
+
+@pytest.mark.parametrize("chunksize", [None, 4])
+def test_readjson_lines_missing_keys(chunksize):
+    j = ('{"b": 1, "a": "x"}\n{"c": [1, 2], "a": "y"}\n'
+         '{"b": 2.5, "b": 3, "d": {"e": null}}\n{}\n')
+    result = read_json(j, lines=True, chunksize=chunksize)
+    if chunksize is not None:
+        result = pd.concat(result)
+    expected = DataFrame([{"b": 1, "a": "x"}, {"c": [1, 2], "a": "y"},
+                          {"b": 3, "d": {"e": None}}, {}])
+    assert_frame_equal(result, expected)
+
+
+def test_readjson_lines_not_objects():
+    result = read_json('[1, "a"]\n[2, "b"]\n', lines=True)
+    expected = DataFrame([[1, "a"], [2, "b"]])
+    assert_frame_equal(result, expected)
+
+    result = read_json('{"a": 1}\n{"a": 2}\n', lines=True, orient='index')
+    expected = DataFrame([{"a": 1}, {"a": 2}]).T
+    assert_frame_equal(result, expected)
+
+
+def test_readjson_lines_invalid():
+    with pytest.raises(ValueError):
+        read_json('{"a": 1}\n{"a": \n', lines=True)
@@ -670,6 +670,30 @@ class TestUltraJSONTests(object):
 
         assert False, "Wrong exception"
 
+    def test_decodeLines(self):
+        lines = ['{"a": 1, "b": "x"}\n', '\n', b'{"b": [1, {"c": null}]}',
+                 '{"a": 2, "a": 3}']
+        keys, values, nrows = ujson.loads_lines(lines)
+        assert keys == ['a', 'b']
+        assert nrows == 3
+        assert values[0][0] == 1
+        assert np.isnan(values[0][1])
+        assert values[0][2] == 3
+        assert values[1][:2] == ['x', [1, {'c': None}]]
+        assert np.isnan(values[1][2])
+
+        assert ujson.loads_lines([]) == ([], [], 0)
+
+    @pytest.mark.parametrize('lines, exc', [
+        (['[1, 2]'], TypeError),
+        (['{"a": [{"b": 1}]}', '[{"a": 1}]'], TypeError),
+        (['{"a": 1} {"b": 2}'], ValueError),
+        (['{"a": '], ValueError),
+        ([1], TypeError)])
+    def test_decodeLinesInvalid(self, lines, exc):
+        with pytest.raises(exc):
+            ujson.loads_lines(lines)
+
     def test_decodeNumericIntPos(self):
         input = "31337"
         assert 31337 == ujson.decode(input)
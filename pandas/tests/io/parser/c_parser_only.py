@@ -18,7 +18,8 @@ import pandas as pd
 import pandas.util.testing as tm
 import pandas.util._test_decorators as td
 from pandas import DataFrame
-from pandas.compat import StringIO, range, lrange
+from pandas.compat import StringIO, BytesIO, range, lrange
+from pandas.errors import EmptyDataError
 
 
 class CParserTests(object):
@@ -485,3 +486,128 @@ No,No,No"""
             ['x' * (1 << 20) for _ in range(2100)]))
         df = self.read_csv(csv, low_memory=False)
         assert not df.empty
+
+    @pytest.mark.parametrize("num_threads", [2, 3, 8])
+    def test_num_threads(self, num_threads):
+        data = ('a,b,c,d\n' +
+                '\n'.join('{0},{1},"x\n{0}",{2}'.format(i, i * 0.5, i % 2 == 0)
+                          for i in range(100)))
+
+        expected = self.read_csv(StringIO(data))
+        result = self.read_csv(StringIO(data), num_threads=num_threads)
+        tm.assert_frame_equal(result, expected)
+
+        result = self.read_csv(StringIO(data), num_threads=num_threads,
+                               usecols=['a', 'c'], index_col='a')
+        tm.assert_frame_equal(result, expected[['a', 'c']].set_index('a'))
+
+        result = self.read_csv(StringIO(data), num_threads=num_threads,
+                               skiprows=1, header=None)
+        tm.assert_frame_equal(result, self.read_csv(StringIO(data),
+                                                    skiprows=1, header=None))
+
+    def test_num_threads_path(self):
+        # files are mapped and each reader reads its own byte range
+        data = ('a,b\n' +
+                '\n'.join('{0},"x\n{0}"'.format(i) for i in range(100)))
+
+        with tm.ensure_clean('__num_threads__.csv') as path:
+            with open(path, 'w') as f:
+                f.write(data)
+
+            result = self.read_csv(path, num_threads=4)
+            tm.assert_frame_equal(result, self.read_csv(StringIO(data)))
+
+        with tm.ensure_clean('__num_threads_empty__.csv') as path:
+            open(path, 'w').close()
+            with pytest.raises(EmptyDataError):
+                self.read_csv(path, num_threads=4)
+
+    @pytest.mark.parametrize("num_threads", [2, 3, 8])
+    def test_num_threads_stray_quote(self, num_threads):
+        # a quote inside an unquoted field does not start a quoted field,
+        # so it must not shift the points at which the source is split
+        data = ('a,b,c\n' +
+                '\n'.join('{0},5" pipe,"x\n""{0}"""'.format(i)
+                          for i in range(100)))
+
+        expected = self.read_csv(StringIO(data))
+        assert expected.shape == (100, 3)
+        result = self.read_csv(StringIO(data), num_threads=num_threads)
+        tm.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize("values", [
+        ['1', '2', '3.5', '4'],
+        ['1', '2', '', '4'],
+        ['1', '2', 'x', '4'],
+        ['True', 'False', '', 'True'],
+        ['True', 'False', '1', 'True'],
+        ['', '', 'a', 'b'],
+    ])
+    def test_num_threads_inference(self, values):
+        # pieces inferred as different dtypes are combined as a single
+        # reader would have inferred the whole column
+        data = 'a,b\n' + '\n'.join('{0},{1}'.format(i, v)
+                                   for i, v in enumerate(values))
+
+        expected = self.read_csv(StringIO(data))
+        result = self.read_csv(StringIO(data), num_threads=4)
+        tm.assert_frame_equal(result, expected)
+
+    def test_num_threads_categorical(self):
+        data = 'a\n' + '\n'.join(['b', 'a', 'c', 'a', 'd', 'b'] * 3)
+
+        expected = self.read_csv(StringIO(data), dtype='category')
+        result = self.read_csv(StringIO(data), dtype='category',
+                               num_threads=4)
+        tm.assert_frame_equal(result, expected)
+
+    def test_num_threads_single_thread_fallback(self):
+        # comment characters may hide quotes, so parse on a single thread
+        data = 'a,b\n1,2 # "\n3,4\n5,6\n'
+
+        expected = self.read_csv(StringIO(data), comment='#')
+        result = self.read_csv(StringIO(data), comment='#', num_threads=2)
+        tm.assert_frame_equal(result, expected)
+
+    def test_num_threads_invalid(self):
+        data = 'a\n1\n2'
+
+        msg = "'num_threads' must be an integer >=1"
+        with tm.assert_raises_regex(ValueError, msg):
+            self.read_csv(StringIO(data), num_threads=0)
+
+        msg = "cannot be used together"
+        with tm.assert_raises_regex(ValueError, msg):
+            self.read_csv(StringIO(data), num_threads=2, chunksize=1)
+        with tm.assert_raises_regex(ValueError, msg):
+            self.read_csv(StringIO(data), num_threads=2, nrows=1)
+
+    def test_intern_strings(self):
+        data = 'a,b\n' + '\n'.join(['foo,foo', 'bar,foo'] * 50)
+
+        result = self.read_csv(StringIO(data), intern_strings=True)
+        expected = self.read_csv(StringIO(data))
+        tm.assert_frame_equal(result, expected)
+
+        # shared across columns
+        assert result['a'][0] is result['b'][0]
+
+        # and across the pieces parsed on other threads
+        result = self.read_csv(StringIO(data), intern_strings=True,
+                               num_threads=4)
+        assert len(set(map(id, result['b']))) == 1
+
+    @pytest.mark.parametrize('encoding', ['utf-8', 'latin-1'])
+    def test_intern_strings_unicode(self, encoding):
+        # the strings are unicode on PY2 when an encoding is given
+        data = u'a,b\n' + u'\n'.join([u'f\xf6\xf6,f\xf6\xf6',
+                                      u'b\xe4r,f\xf6\xf6'] * 50)
+        data = data.encode(encoding)
+
+        result = self.read_csv(BytesIO(data), encoding=encoding,
+                               intern_strings=True)
+        expected = self.read_csv(BytesIO(data), encoding=encoding)
+        tm.assert_frame_equal(result, expected)
+        assert result['a'][0] == u'f\xf6\xf6'
+        assert result['a'][0] is result['b'][0]
@@ -374,6 +374,68 @@ bar,foo"""
         with tm.assert_raises_regex(ValueError, msg):
             self.read_csv(StringIO(self.data1), nrows=-1)
 
+    def test_read_filter(self):
+        rows = ['{0},{1},x{0}'.format(i, i % 3) for i in range(20)]
+        data = 'a,b,c\n' + '\n'.join(rows)
+        df = self.read_csv(StringIO(data))
+
+        result = self.read_csv(StringIO(data), filter='b == 1 and a > 5')
+        tm.assert_frame_equal(result, df[(df.b == 1) & (df.a > 5)])
+
+        result = self.read_csv(StringIO(data), filter=lambda x: x.b == 2)
+        tm.assert_frame_equal(result, df[df.b == 2])
+
+        # columns used by the condition are dropped again
+        result = self.read_csv(StringIO(data), filter='b == 1',
+                               usecols=['a', 'c'])
+        tm.assert_frame_equal(result, df.loc[df.b == 1, ['a', 'c']])
+
+        result = self.read_csv(StringIO(data), filter='a < 12', nrows=10)
+        tm.assert_frame_equal(result, df[:10])
+
+        result = self.read_csv(StringIO(data), filter='b > 5')
+        tm.assert_frame_equal(result, df[df.b > 5])
+
+        reader = self.read_csv(StringIO(data), filter='b == 0', chunksize=7)
+        chunks = list(reader)
+        assert len(chunks) == 3
+        part = df[7:14]
+        tm.assert_frame_equal(chunks[1], part[part.b == 0])
+        tm.assert_frame_equal(pd.concat(chunks), df[df.b == 0])
+
+    def test_read_filter_categorical(self, monkeypatch):
+        # each chunk infers its own categories, which are combined
+        monkeypatch.setattr('pandas.io.parsers._FILTER_CHUNKSIZE', 3)
+        data = 'a,b\n' + '\n'.join(['1,x', '2,y', '3,x', '4,z', '5,w'])
+
+        result = self.read_csv(StringIO(data), dtype={'b': 'category'},
+                               filter='a != 2')
+        expected = self.read_csv(StringIO(data), dtype={'b': 'category'})
+        tm.assert_frame_equal(result, expected[expected.a != 2])
+
+    def test_read_filter_scope(self):
+        data = 'a,b\n1,2\n3,4\n5,6'
+        threshold = 2  # noqa
+
+        result = pd.read_csv(StringIO(data), engine=self.engine,
+                             filter='a > @threshold')
+        expected = DataFrame({'a': [3, 5], 'b': [4, 6]}, index=[1, 2])
+        tm.assert_frame_equal(result, expected)
+
+    def test_read_filter_invalid(self):
+        data = 'a,b\n1,2\n3,4'
+
+        with tm.assert_raises_regex(TypeError, "must be a string or"):
+            self.read_csv(StringIO(data), filter=1)
+
+        msg = "requires 'usecols' to be given as column labels"
+        with tm.assert_raises_regex(ValueError, msg):
+            self.read_csv(StringIO(data), filter='a > 1', usecols=[0])
+
+        msg = "Usecols do not match columns"
+        with tm.assert_raises_regex(ValueError, msg):
+            self.read_csv(StringIO(data), filter='a > 1', usecols=['a', 'c'])
+
     def test_read_chunksize(self):
         reader = self.read_csv(StringIO(self.data1), index_col=0, chunksize=2)
         df = self.read_csv(StringIO(self.data1), index_col=0)
@@ -1384,6 +1446,10 @@ j,-inF"""
         out = self.read_csv(mmap_file, memory_map=True)
         tm.assert_frame_equal(out, expected)
 
+        with open(mmap_file, 'rb') as f:
+            out = self.read_csv(f, memory_map=True)
+        tm.assert_frame_equal(out, expected)
+
     def test_null_byte_char(self):
         # see gh-2741
         data = '\x00,foo'
@@ -54,6 +54,38 @@ class TestTextReader(object):
         finally:
             f.close()
 
+    def test_file_handle_mmap_position(self):
+        # the mapping starts at the current position of the handle
+        with open(self.csv1, 'rb') as f:
+            f.readline()
+            expected = TextReader(f, header=None).read()
+
+        with open(self.csv1, 'rb') as f:
+            f.readline()
+            reader = TextReader(f, memory_map=True, header=None)
+            result = reader.read()
+
+        for i in expected:
+            tm.assert_numpy_array_equal(result[i], expected[i])
+
+    def test_file_handle_mmap_small_chunks(self):
+        # tokenize in chunks smaller than a page, so consumed pages are
+        # released while later parts of the mapping are still being read
+        data = '\n'.join('{0},{1}'.format(i, 'x' * (i % 50))
+                         for i in range(10000))
+        path = '__{}__.csv'.format(tm.rands(10))
+
+        with tm.ensure_clean(path) as path:
+            with open(path, 'w') as f:
+                f.write(data)
+
+            with open(path, 'rb') as f:
+                reader = TextReader(f, memory_map=True, header=None,
+                                    tokenize_chunksize=1000)
+                result = reader.read()
+
+        tm.assert_numpy_array_equal(result[0], np.arange(10000))
+
     def test_StringIO(self):
         with open(self.csv1, 'rb') as f:
             text = f.read()
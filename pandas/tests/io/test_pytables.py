@@ -1683,6 +1683,34 @@ class TestHDFStore(Base):
                 store.put('f2', df)
                 pytest.raises(TypeError, store.create_table_index, 'f2')
 
+    def test_append_deferred_index(self):
+
+        with ensure_clean_store(self.path) as store:
+            def table():
+                return store.get_storer('df')
+
+            df = tm.makeTimeDataFrame(50)
+            df['int'] = np.arange(50)
+            store.append('df', df.iloc[:10], data_columns=['int'],
+                         index='deferred')
+            assert table().table.cols.int.is_indexed
+            assert not table().table.autoindex
+            assert table().unindexed_rows == 0
+
+            for i in range(10, 50, 10):
+                store.append('df', df.iloc[i:i + 10], index='deferred')
+            assert table().unindexed_rows == 40
+
+            # the unindexed rows are searched too
+            result = store.select('df', 'int > 5 & int < 45')
+            tm.assert_frame_equal(result, df[(df.int > 5) & (df.int < 45)])
+
+            store.create_table_index('df')
+            assert table().table.autoindex
+            assert table().unindexed_rows == 0
+            result = store.select('df', 'int > 5 & int < 45')
+            tm.assert_frame_equal(result, df[(df.int > 5) & (df.int < 45)])
+
     def test_append_diff_item_order(self):
 
         with catch_warnings(record=True):
@@ -3089,6 +3117,75 @@ class TestHDFStore(Base):
                 expected = df[df.A > 0].reindex(columns=['C', 'D'])
                 tm.assert_frame_equal(expected, result)
 
+    def test_select_read_threads(self):
+
+        with ensure_clean_store(self.path) as store:
+            df = tm.makeTimeDataFrame(100)
+            df['int'] = np.arange(100)
+            df['string'] = 'foo'
+            df.loc[df.index[3:6], 'string'] = np.nan
+            df['cat'] = pd.Categorical(['a', 'b'] * 50)
+            df['datetime'] = date_range('2000-01-01', periods=100, tz='UTC')
+            store.append('df', df, data_columns=['int', 'string'])
+
+            for where in [None, 'int > 50', "string == 'foo'"]:
+                expected = store.select('df', where=where)
+                with pd.option_context('io.hdf.read_threads', 4):
+                    result = store.select('df', where=where)
+                tm.assert_frame_equal(result, expected)
+
+            tm.assert_frame_equal(expected, df[df.string == 'foo'])
+
+    def test_select_cached_where(self):
+
+        with ensure_clean_store(self.path) as store:
+            df = DataFrame({'A': np.arange(10), 'B': np.arange(10.)})
+            store.append('df', df, data_columns=['A', 'B'])
+
+            # the same expression resolving to different values
+            for value in [2, 5, 5, 2.0, 7]:
+                result = store.select('df', 'A > value')
+                tm.assert_frame_equal(result, df[df.A > value])
+
+            # a variable referencing a non-scalar
+            for values in [[1, 2], [3]]:
+                result = store.select('df', 'A = values')
+                tm.assert_frame_equal(result, df[df.A.isin(values)])
+
+            # the same expression against a table with other kinds
+            store.append('df2', df.astype(str), data_columns=['A'])
+            value = '3'
+            result = store.select('df2', 'A = value')
+            tm.assert_frame_equal(result, df.astype(str).iloc[[3]])
+
+    def test_select_coordinate_cache(self):
+
+        with ensure_clean_store(self.path) as store:
+            df = DataFrame({'A': np.arange(10), 'B': np.arange(10.)})
+            store.append('df', df, data_columns=['A'])
+
+            with pd.option_context('io.hdf.coordinate_cache_size', 2):
+                for _ in range(2):
+                    result = store.select_as_coordinates('df', 'A > 6')
+                    tm.assert_index_equal(result, Index([7, 8, 9]))
+                    result = store.select('df', 'A > 6', start=8)
+                    tm.assert_frame_equal(result, df.iloc[8:])
+                assert len(store._coordinate_cache) == 2
+
+                # appending invalidates the cached coordinates
+                store.append('df', df)
+                result = store.select('df', 'A > 6')
+                expected = pd.concat([df, df])
+                tm.assert_frame_equal(result, expected[expected.A > 6])
+
+                store.remove('df', 'A > 8')
+                result = store.select('df', 'A > 6')
+                expected = df.iloc[[7, 8]]
+                tm.assert_frame_equal(result, pd.concat([expected, expected]))
+
+            result = store.select('df', 'A > 7')
+            tm.assert_frame_equal(result, pd.concat([df.iloc[[8]]] * 2))
+
     def test_select_dtypes(self):
 
         with ensure_clean_store(self.path) as store:
@@ -3245,6 +3342,20 @@ class TestHDFStore(Base):
             tm.assert_frame_equal(expected, result)
             assert len(result) == 100
 
+    def test_select_iterator_groupby(self):
+
+        with ensure_clean_store(self.path) as store:
+
+            df = tm.makeTimeDataFrame(500)
+            df['key'] = np.arange(500) % 7
+            store.append('df', df)
+
+            result = store.select('df', chunksize=64).groupby('key').agg(
+                {'A': ['sum', 'var'], 'B': 'max'})
+            expected = df.groupby('key').agg({'A': ['sum', 'var'],
+                                              'B': 'max'})
+            tm.assert_frame_equal(result, expected[result.columns])
+
     def test_select_iterator(self):
 
         # single table
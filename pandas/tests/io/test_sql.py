@@ -561,6 +561,60 @@ class _TestSQLApi(PandasSQLTest):
 
         assert num_rows == num_entries
 
+    @pytest.mark.parametrize('chunksize', [None, 2])
+    def test_to_sql_method_multi(self, chunksize):
+        df = DataFrame({'a': np.arange(300, dtype='int64'), 'b': 1.5})
+        sql.to_sql(df, 'test_frame_multi', self.conn, index=False,
+                   chunksize=chunksize, method='multi')
+
+        result = sql.read_sql_query('SELECT * FROM test_frame_multi',
+                                    self.conn)
+        tm.assert_frame_equal(result, df)
+
+    def test_to_sql_method_callable(self):
+        calls = []
+
+        def sample(pd_table, conn, keys, data):
+            calls.append((keys, [len(col) for col in data]))
+            pd_table._execute_insert(conn, keys, zip(*data))
+
+        sql.to_sql(self.test_frame1, 'test_frame_callable', self.conn,
+                   index=False, chunksize=7, method=sample)
+
+        nrows = len(self.test_frame1)
+        assert self._count_rows('test_frame_callable') == nrows
+        assert sum(lengths[0] for _, lengths in calls) == nrows
+        keys = list(self.test_frame1.columns)
+        assert all(k == keys for k, _ in calls)
+
+    def test_to_sql_method_invalid(self):
+        with tm.assert_raises_regex(ValueError, 'not valid for method'):
+            sql.to_sql(self.test_frame1, 'test_frame_invalid', self.conn,
+                       method='copy')
+        assert not sql.has_table('test_frame_invalid', self.conn)
+
+    def test_read_sql_batches(self, monkeypatch):
+        # the result set is converted batch by batch, the batches of a column
+        # can be inferred with different dtypes
+        monkeypatch.setattr(sql, '_FETCH_BATCHSIZE', 2)
+        rows = [(1, 1.5, '1'), (2, 2.5, '2'), (3, 3.5, 'x'),
+                (4, None, 'y'), (None, 5.5, None)]
+        sql.execute('CREATE TABLE test_batches (a INTEGER, b REAL, c TEXT)',
+                    self.conn)
+        for row in rows:
+            sql.execute('INSERT INTO test_batches VALUES (?, ?, ?)',
+                        self.conn, params=row)
+
+        result = sql.read_sql_query('SELECT * FROM test_batches', self.conn)
+        expected = DataFrame.from_records(rows, columns=['a', 'b', 'c'])
+        tm.assert_frame_equal(result, expected)
+        assert result['a'].dtype == np.float64
+
+        result = sql.read_sql_query('SELECT * FROM test_batches WHERE a > 10',
+                                    self.conn)
+        assert len(result) == 0
+        assert list(result.columns) == ['a', 'b', 'c']
+
     def test_to_sql_type_mapping(self):
         sql.to_sql(self.test_frame3, 'test_frame5', self.conn, index=False)
         result = sql.read_sql("SELECT * FROM test_frame5", self.conn)
@@ -898,6 +952,57 @@ class TestSQLApi(SQLAlchemyMixIn, _TestSQLApi):
         assert result.index.names == ["A", "B"]
         assert result.columns.tolist() == ["C", "D"]
 
+    @pytest.mark.parametrize('partition_column', ['id', 'value', 'date'])
+    @pytest.mark.parametrize('chunksize', [None, 3])
+    def test_read_table_partitioned(self, partition_column, chunksize):
+        df = DataFrame({'id': np.arange(20, dtype='int64'),
+                        'value': np.linspace(0, 1, 20),
+                        'date': date_range('2000-01-01', periods=20)})
+        df.loc[5, 'value'] = np.nan
+
+        with tm.ensure_clean() as name:
+            # partitions are read concurrently from a database file
+            engine = sqlalchemy.create_engine('sqlite:///' + name)
+            try:
+                df.to_sql('test_partition', engine, index=False)
+                result = sql.read_sql_table(
+                    'test_partition', engine, chunksize=chunksize,
+                    partition_column=partition_column, num_partitions=4)
+                if chunksize is not None:
+                    result = concat(list(result), ignore_index=True)
+            finally:
+                engine.dispose()
+
+        result = result.sort_values('id').reset_index(drop=True)
+        tm.assert_frame_equal(result[df.columns], df)
+
+    def test_read_table_partitioned_memory(self):
+        # an in-memory database is read sequentially
+        sql.to_sql(self.test_frame1, 'test_frame', self.conn)
+
+        result = sql.read_sql_table('test_frame', self.conn,
+                                    partition_column='A', num_partitions=3,
+                                    index_col='index')
+        tm.assert_frame_equal(result.sort_index(),
+                              sql.read_sql_table('test_frame', self.conn,
+                                                 index_col='index'))
+
+    def test_read_table_partitioned_invalid(self):
+        sql.to_sql(self.test_frame1, 'test_frame', self.conn)
+
+        with tm.assert_raises_regex(ValueError, 'positive integer'):
+            sql.read_sql_table('test_frame', self.conn,
+                               partition_column='A', num_partitions=0)
+        with tm.assert_raises_regex(ValueError, 'is not a column'):
+            sql.read_sql_table('test_frame', self.conn,
+                               partition_column='E', num_partitions=2)
+
+        df = DataFrame({'A': ['a', 'b', 'c'], 'B': [1, 2, 3]})
+        df.to_sql('test_partition_text', self.conn, index=False)
+        with tm.assert_raises_regex(ValueError, "'A' must be a numeric"):
+            sql.read_sql_table('test_partition_text', self.conn,
+                               partition_column='A', num_partitions=2)
+
     def test_read_sql_delegate(self):
         iris_frame1 = sql.read_sql_query(
             "SELECT * FROM iris", self.conn)
@@ -1099,6 +1204,16 @@ class TestSQLiteFallbackApi(SQLiteMixIn, _TestSQLApi):
         with tm.assert_produces_warning():
             sql.to_sql(df, "test_frame3_legacy", self.conn, index=False)
 
+    def test_to_sql_method_multi_batches(self):
+        # more parameters than sqlite accepts in a single statement
+        df = DataFrame({'a': np.arange(1500, dtype='int64'), 'b': 1.5})
+        sql.to_sql(df, 'test_frame_multi', self.conn, index=False,
+                   method='multi')
+
+        result = sql.read_sql_query('SELECT * FROM test_frame_multi',
+                                    self.conn)
+        tm.assert_frame_equal(result, df)
+
     def test_get_schema2(self):
         # without providing a connection object (available for backwards comp)
         create_sql = sql.get_schema(self.test_frame1, 'test')
@@ -14,6 +14,7 @@ from pandas.util.testing import assert_frame_equal, assert_series_equal
 from pandas.core.sorting import (is_int64_overflow_possible,
                                  decons_group_index,
                                  get_group_index,
+                                 get_hashed_group_index,
                                  nargsort,
                                  lexsort_indexer,
                                  safe_sort)
@@ -344,6 +345,34 @@ def test_decons():
     testit(label_list, shape)
 
 
+def test_get_hashed_group_index():
+    keys = [np.array([1, 2, 1, 2, 1, 3], dtype=np.int64),
+            np.array([1., 1., 1., np.nan, 1., 2.]),
+            np.array([0, 0, 0, 0, 1, 1], dtype=np.int64)]
+    comp_ids, obs_rows = get_hashed_group_index(keys)
+    tm.assert_numpy_array_equal(comp_ids,
+                                np.array([0, 1, 0, -1, 2, 3], dtype=np.int64))
+    tm.assert_numpy_array_equal(obs_rows,
+                                np.array([0, 1, 4, 5], dtype=np.int64))
+
+
+def test_get_hashed_group_index_collision(monkeypatch):
+    import pandas.core.util.hashing as hashing
+
+    keys = [np.arange(5), np.arange(5)]
+    monkeypatch.setattr(hashing, 'hash_array',
+                        lambda vals: np.zeros(len(vals), dtype=np.uint64))
+    assert get_hashed_group_index(keys) is None
+
+    # groupby falls back to labelling the keys individually
+    df = DataFrame({'a': [1, 1, 2, 2], 'b': [1, 1, 1, 2], 'c': range(4)})
+    result = df.groupby(['a', 'b'], sort=False).c.sum()
+    expected = Series([1, 2, 3], name='c',
+                      index=MultiIndex.from_tuples([(1, 1), (2, 1), (2, 2)],
+                                                   names=['a', 'b']))
+    assert_series_equal(result, expected)
+
+
 class TestSafeSort(object):
 
     def test_basic_sort(self):
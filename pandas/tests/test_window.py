@@ -471,6 +471,252 @@ class TestRolling(Base):
         tm.assert_index_equal(result.columns, df.columns)
         assert result.index.names == [None, '1', '2']
 
+    @td.skip_if_no('numba')
+    @pytest.mark.parametrize('center', [True, False])
+    @pytest.mark.parametrize('min_periods', [None, 1, 3])
+    def test_apply_numba(self, center, min_periods):
+        s = Series(np.random.randn(50))
+        s[::7] = np.nan
+
+        def f(x, scale):
+            return np.nanmax(x) * scale
+
+        roll = s.rolling(5, min_periods=min_periods, center=center)
+        result = roll.apply(f, args=(2.,), engine='numba')
+        expected = roll.apply(f, args=(2.,))
+        tm.assert_series_equal(result, expected)
+
+    @td.skip_if_no('numba')
+    @pytest.mark.parametrize('closed', ['right', 'left', 'both', 'neither'])
+    def test_apply_numba_freq(self, closed):
+        df = DataFrame({'A': np.arange(20.), 'B': np.random.randn(20)},
+                       index=pd.date_range('2000', periods=20, freq='7H'))
+
+        def f(x):
+            return x.mean() + len(x)
+
+        roll = df.rolling('1D', closed=closed)
+        result = roll.apply(f, engine='numba')
+        expected = roll.apply(f)
+        tm.assert_frame_equal(result, expected)
+
+    @td.skip_if_no('numba')
+    @pytest.mark.parametrize('closed', ['right', 'left', 'both', 'neither'])
+    def test_apply_numba_duplicate_timestamps(self, closed):
+        # a window holds the earlier rows with its timestamp, not the later
+        s = Series(np.arange(6.), index=pd.to_datetime(
+            ['2000-01-01', '2000-01-02', '2000-01-02', '2000-01-02',
+             '2000-01-03', '2000-01-05']))
+
+        def f(x):
+            return x.sum() + len(x)
+
+        roll = s.rolling('2D', closed=closed)
+        result = roll.apply(f, engine='numba')
+        expected = roll.apply(f)
+        tm.assert_series_equal(result, expected)
+
+    @td.skip_if_no('numba')
+    def test_apply_numba_cache_size(self, monkeypatch):
+        from pandas.core.util import numba_
+
+        monkeypatch.setattr(numba_, '_numba_cache', numba_.OrderedDict())
+        monkeypatch.setattr(numba_, '_NUMBA_CACHE_SIZE', 2)
+        s = Series(np.arange(5.))
+        funcs = [lambda x: x.sum(), lambda x: x.max(), lambda x: x.min()]
+        for f in funcs:
+            s.rolling(2).apply(f, engine='numba')
+
+        assert list(numba_._numba_cache) == [(f, 'window')
+                                             for f in funcs[1:]]
+
+    def test_apply_invalid_engine(self):
+        s = Series(range(5))
+        with tm.assert_raises_regex(ValueError, "engine must be either"):
+            s.rolling(2).apply(np.sum, engine='foo')
+        with tm.assert_raises_regex(ValueError, "keyword arguments"):
+            s.rolling(2).apply(np.sum, kwargs={'axis': 0}, engine='numba')
+
+    @pytest.mark.parametrize('func', ['sum', 'mean', 'var', 'std'])
+    @pytest.mark.parametrize('kwargs', [
+        dict(window=5), dict(window=5, min_periods=0),
+        dict(window=4, center=True), dict(window='2D', closed='both'),
+        dict(window=3, axis=1)])
+    def test_moments_2d(self, func, kwargs):
+        # the 2-D kernel rolls all columns of a block at once
+        df = DataFrame(np.random.randn(20, 4), columns=list('ABCD'),
+                       index=pd.date_range('2000', periods=20, freq='11H'))
+        df.iloc[::3, 1] = np.nan
+        df['E'] = np.arange(20)
+        if kwargs.get('axis') == 1:
+            df = df[list('ABCD')]
+
+        # the 1-D path uses the same kernel, compare with numpy instead
+        references = {'sum': np.nansum,
+                      'mean': np.nanmean,
+                      'var': lambda x: np.nanvar(x, ddof=1),
+                      'std': lambda x: np.nanstd(x, ddof=1)}
+
+        r = df.rolling(**kwargs)
+        result = getattr(r, func)()
+        with warnings.catch_warnings(record=True):
+            with np.errstate(all='ignore'):
+                expected = r.apply(references[func])
+        tm.assert_frame_equal(result, expected)
+
+    def test_agg_moments(self):
+        df = DataFrame({'A': np.random.randn(20), 'B': np.arange(20),
+                        'C': np.random.randn(20)})
+        df.iloc[::4, 0] = np.nan
+        r = df.rolling(5, min_periods=2)
+
+        result = r.agg(['sum', np.mean, 'std', 'var'])
+        expected = concat([concat([r[col].sum(), r[col].mean(),
+                                   r[col].std(), r[col].var()],
+                                  keys=['sum', 'mean', 'std', 'var'], axis=1)
+                           for col in df], keys=df.columns, axis=1)
+        tm.assert_frame_equal(result, expected)
+
+        result = r['A'].agg(['mean', 'std'])
+        expected = concat([r['A'].mean(), r['A'].std()],
+                          keys=['mean', 'std'], axis=1)
+        tm.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('center', [True, False])
+    def test_quantile_list(self, center):
+        df = DataFrame({'A': np.random.randn(30), 'B': np.arange(30)})
+        df.iloc[::4, 0] = np.nan
+        r = df.rolling(5, min_periods=2, center=center)
+        quantiles = [0., 0.25, 0.5, 0.75, 1.]
+
+        result = r.quantile(quantiles)
+        expected = concat([concat([r[col].quantile(q) for q in quantiles],
+                                  keys=quantiles, axis=1)
+                           for col in df], keys=df.columns, axis=1)
+        tm.assert_frame_equal(result, expected)
+
+        result = r['A'].quantile(quantiles)
+        tm.assert_frame_equal(result, expected['A'])
+
+        with pytest.raises(ValueError):
+            r.quantile([0.5, 1.5])
+
+    def test_quantile_list_non_numeric(self):
+        df = DataFrame({'A': np.arange(10.), 'B': list('abcdefghij')})
+        r = df.rolling(3)
+        quantiles = [0.25, 0.5]
+
+        result = r.quantile(quantiles)
+        expected = concat([r.quantile(q) for q in quantiles],
+                          keys=quantiles, axis=1)
+        expected.columns = expected.columns.swaplevel(0, 1)
+        expected = expected[[('A', 0.25), ('A', 0.5),
+                             ('B', 0.25), ('B', 0.5)]]
+        tm.assert_frame_equal(result, expected)
+        tm.assert_series_equal(result[('B', 0.5)], df['B'],
+                               check_names=False)
+
+    def test_quantile_list_on(self):
+        df = DataFrame({'A': np.arange(10.),
+                        'C': pd.date_range('20130101', periods=10, freq='s'),
+                        'B': np.arange(10.)[::-1]})
+        r = df.rolling('2s', on='C')
+        quantiles = [0.25, 0.5]
+
+        result = r.quantile(quantiles)
+        assert list(result.columns) == [(col, q) for col in df
+                                        for q in quantiles]
+        for q in quantiles:
+            expected = r.quantile(q)
+            for col in df:
+                tm.assert_series_equal(result[(col, q)], expected[col],
+                                       check_names=False)
+
+    @pytest.mark.parametrize('method', ['average', 'min', 'max'])
+    @pytest.mark.parametrize('ascending', [True, False])
+    @pytest.mark.parametrize('pct', [True, False])
+    def test_rank(self, method, ascending, pct):
+        df = DataFrame({'A': np.random.randint(0, 5, 30),
+                        'B': np.random.randn(30)})
+        df.iloc[::7, 1] = np.nan
+        r = df.rolling(5, min_periods=2)
+
+        def f(x):
+            return Series(x).rank(method=method, ascending=ascending,
+                                  pct=pct).iloc[-1]
+
+        result = r.rank(method=method, ascending=ascending, pct=pct)
+        expected = r.apply(f)
+        tm.assert_frame_equal(result, expected)
+
+    def test_rank_invalid(self):
+        s = Series(np.arange(10.))
+        with pytest.raises(ValueError):
+            s.rolling(3).rank(method='first')
+        with pytest.raises(NotImplementedError):
+            s.rolling(3, center=True).rank()
+
+    @pytest.mark.parametrize('func, args', [
+        ('median', ()), ('quantile', (0.3, )), ('skew', ()), ('kurt', ()),
+        ('max', ()), ('min', ())])
+    @pytest.mark.parametrize('axis', [0, 1])
+    @pytest.mark.parametrize('center', [True, False])
+    def test_window_threads(self, func, args, axis, center):
+        df = DataFrame(np.random.randn(30, 6))
+        df.iloc[::4, 0] = np.nan
+        r = df.rolling(5, min_periods=2, axis=axis, center=center)
+
+        expected = getattr(r, func)(*args)
+        with pd.option_context('compute.window_threads', 4):
+            result = getattr(r, func)(*args)
+        tm.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('func', ['sum', 'mean', 'var', 'std', 'median'])
+    def test_online(self, func):
+        df = DataFrame({'A': np.random.randn(30), 'B': np.arange(30.)})
+        df.iloc[::4, 0] = np.nan
+        expected = getattr(df.rolling(5, min_periods=2), func)()
+
+        online = df[:7].rolling(5, min_periods=2).online(func)
+        for start, stop in [(7, 8), (8, 8), (8, 20), (20, 30)]:
+            result = online.update(df[start:stop])
+            tm.assert_frame_equal(result, expected[start:stop])
+
+        s = df['A']
+        online = s[:3].rolling(5).online(func)
+        result = online.update(s[3:])
+        tm.assert_series_equal(result, getattr(s.rolling(5), func)()[3:])
+
+    @pytest.mark.parametrize('func', ['var', 'median'])
+    def test_online_single_rows(self, func):
+        # the rows of the window wrap around the buffer many times
+        s = Series(np.random.randn(50))
+        s[::7] = np.nan
+        expected = getattr(s.rolling(4, min_periods=1), func)()
+
+        online = s[:0].rolling(4, min_periods=1).online(func)
+        for i in range(len(s)):
+            result = online.update(s[i:i + 1])
+            tm.assert_series_equal(result, expected[i:i + 1])
+        assert len(online._ring) == 4
+
+    def test_online_invalid(self):
+        df = DataFrame({'A': np.arange(10.)},
+                       index=pd.date_range('20130101', periods=10))
+
+        with pytest.raises(ValueError):
+            df.rolling(2).online('max')
+        with pytest.raises(NotImplementedError):
+            df.rolling(2, center=True).online('sum')
+        with pytest.raises(NotImplementedError):
+            df.rolling('2D').online('sum')
+
+        online = df.rolling(2).online('sum')
+        with pytest.raises(ValueError):
+            online.update(DataFrame({'B': [1.]}))
+        with pytest.raises(TypeError):
+            online.update(df['A'])
+
 
 class TestExpanding(Base):
 
@@ -546,6 +792,44 @@ class TestExpanding(Base):
         expected = pd.Series([np.nan])
         tm.assert_series_equal(result, expected)
 
+    @td.skip_if_no('numba')
+    def test_apply_numba(self):
+        s = Series(np.random.randn(30))
+        s[::4] = np.nan
+
+        def f(x):
+            return np.nansum(x) / len(x)
+
+        expanding = s.expanding(min_periods=2)
+        result = expanding.apply(f, engine='numba')
+        expected = expanding.apply(f)
+        tm.assert_series_equal(result, expected)
+
+    def test_rank(self):
+        s = Series(np.random.randint(0, 10, 30).astype(float))
+        s[::7] = np.nan
+        e = s.expanding(min_periods=3)
+
+        result = e.rank(pct=True)
+        expected = e.apply(lambda x: Series(x).rank(pct=True).iloc[-1])
+        tm.assert_series_equal(result, expected)
+
+        result = e.quantile([0.1, 0.5])
+        expected = concat([e.quantile(0.1), e.quantile(0.5)],
+                          keys=[0.1, 0.5], axis=1)
+        tm.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('func', ['sum', 'mean', 'var', 'std', 'median'])
+    def test_online(self, func):
+        df = DataFrame({'A': np.random.randn(30), 'B': np.arange(30.)})
+        df.iloc[::4, 0] = np.nan
+        expected = getattr(df.expanding(min_periods=3), func)()
+
+        online = df[:2].expanding(min_periods=3).online(func)
+        for start, stop in [(2, 10), (10, 11), (11, 30)]:
+            result = online.update(df[start:stop])
+            tm.assert_frame_equal(result, expected[start:stop])
+
 
 class TestEWM(Base):
 
@@ -608,6 +892,20 @@ class TestEWM(Base):
             tm.assert_raises_regex(UnsupportedFunctionCall, msg,
                                    getattr(e, func), dtype=np.float64)
 
+    @pytest.mark.parametrize('adjust', [True, False])
+    @pytest.mark.parametrize('ignore_na', [True, False])
+    def test_online(self, adjust, ignore_na):
+        df = DataFrame({'A': np.random.randn(30), 'B': np.arange(30.)})
+        df.iloc[::4, 0] = np.nan
+        kwargs = dict(com=2., adjust=adjust, ignore_na=ignore_na,
+                      min_periods=3)
+        expected = df.ewm(**kwargs).mean()
+
+        online = df[:0].ewm(**kwargs).online()
+        for start, stop in [(0, 1), (1, 12), (12, 30)]:
+            result = online.update(df[start:stop])
+            tm.assert_frame_equal(result, expected[start:stop])
+
 
 # gh-12373 : rolling functions error on float32 data
 # make sure rolling functions works for different dtypes
@@ -3113,6 +3411,59 @@ class TestGrouperGrouping(object):
         expected = g.apply(lambda x: x.expanding().apply(lambda y: y.sum()))
         tm.assert_frame_equal(result, expected)
 
+    @pytest.mark.parametrize('f', ['sum', 'mean', 'median', 'min', 'max',
+                                   'std', 'var', 'skew', 'kurt'])
+    @pytest.mark.parametrize('sort', [True, False])
+    def test_many_groups(self, f, sort):
+        # the groups are rolled at once over the rows sorted by group
+        df = DataFrame({'A': np.random.randint(0, 50, 500).astype(float),
+                        'B': np.random.randn(500),
+                        'C': np.random.randn(500)})
+        df.loc[::10, 'A'] = np.nan
+        df.loc[::7, 'B'] = np.nan
+        g = df.groupby('A', sort=sort)
+
+        r = g.rolling(4, min_periods=2)
+        result = getattr(r, f)()
+        expected = g.apply(
+            lambda x: getattr(x.rolling(4, min_periods=2), f)())
+        tm.assert_frame_equal(result, expected)
+
+        r = g.expanding(min_periods=2)
+        result = getattr(r, f)()
+        expected = g.apply(
+            lambda x: getattr(x.expanding(min_periods=2), f)())
+        tm.assert_frame_equal(result, expected)
+
+    def test_many_groups_offset(self):
+        df = DataFrame({'A': np.random.randint(0, 20, 200),
+                        'B': np.random.randint(0, 2, 200),
+                        'C': np.random.randn(200)},
+                       index=pd.date_range('20130101', periods=200,
+                                           freq='s'))
+        g = df.groupby(['A', 'B'])
+
+        result = g.rolling('10s').C.mean()
+        expected = g.C.apply(lambda x: x.rolling('10s').mean())
+        tm.assert_series_equal(result, expected)
+
+        result = g.rolling('10s', closed='left').C.max()
+        expected = g.C.apply(lambda x: x.rolling('10s', closed='left').max())
+        tm.assert_series_equal(result, expected)
+
+    @pytest.mark.parametrize('f', ['sum', 'max', 'median'])
+    def test_many_groups_offset_long_span(self, f):
+        # the bounds of the windows do not depend on the span of the index
+        df = DataFrame({'A': np.arange(1000) % 300,
+                        'C': np.random.randn(1000)},
+                       index=pd.date_range('1700-01-01', '2200-01-01',
+                                           periods=1000))
+        g = df.groupby('A')
+
+        result = getattr(g.rolling('1000d').C, f)()
+        expected = g.C.apply(lambda x: getattr(x.rolling('1000d'), f)())
+        tm.assert_series_equal(result, expected)
+
 
 class TestRollingTS(object):
 
@@ -3624,6 +3975,17 @@ class TestRollingTS(object):
         expected['B'] = [0.0, 1, 2, 3, 4]
         tm.assert_frame_equal(result, expected)
 
+    @pytest.mark.parametrize('func,expected', [
+        ('max', [np.nan, 1.0, 2.0, 3.0]),
+        ('min', [np.nan, 1.0, 1.0, 2.0])])
+    def test_ragged_min_max_missing_first(self, func, expected):
+        # a missing first value of a window is skipped, not compared with
+        s = Series([np.nan, 1.0, 2.0, 3.0],
+                   index=pd.date_range('20130101', periods=4, freq='s'))
+
+        result = getattr(s.rolling('2s'), func)()
+        tm.assert_series_equal(result, Series(expected, index=s.index))
+
     def test_ragged_apply(self):
 
         df = self.ragged
@@ -10,7 +10,8 @@ import pytest
 from pandas.compat import intern
 import pandas.core.common as com
 from pandas.util._move import move_into_mutable_buffer, BadMove, stolenbuf
-from pandas.util._decorators import deprecate_kwarg, make_signature
+from pandas.util._decorators import (deprecate_kwarg, make_signature,
+                                     keyword_only_args)
 from pandas.util._validators import (validate_args, validate_kwargs,
                                      validate_args_and_kwargs,
                                      validate_bool_kwarg)
@@ -72,6 +73,18 @@ class TestDecorators(object):
             def f4(new=None):
                 pass
 
+    def test_keyword_only_args(self):
+        @keyword_only_args
+        def f(a, b=1, *args, **kwargs):
+            return a, b, args, kwargs
+
+        assert f(0) == (0, 1, (), {})
+        assert f(0, 2, 3) == (0, 1, (2, 3), {})
+        assert f(0, 2, b=3, c=4) == (0, 3, (2,), {'c': 4})
+        assert f(a=0, b=3) == (0, 3, (), {})
+        with tm.assert_raises_regex(TypeError, "missing required argument"):
+            f(b=3)
+
 
 def test_rands():
     r = tm.rands(10)
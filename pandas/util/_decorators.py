@@ -165,6 +165,55 @@ def rewrite_axis_style_signature(name, extra_params):
         return wrapper
     return decorate
 
+
+def keyword_only_args(func):
+    """
+    Make the parameters of ``func`` with defaults keyword-only.
+
+    Python 2 has no syntax for keyword-only parameters after ``*args``, so
+    ``func`` declares them as regular parameters with defaults before
+    ``*args``. They are then only taken from the keyword arguments, and the
+    positional arguments after the required parameters all go to ``*args``.
+
+    Examples
+    --------
+    >>> @keyword_only_args
+    ... def f(a, b=1, *args, **kwargs):
+    ...     return a, b, args, kwargs
+    >>> f(0, 2, 3)
+    (0, 1, (2, 3), {})
+    >>> f(0, 2, b=3, c=4)
+    (0, 3, (2,), {'c': 4})
+    """
+    spec = signature(func)
+    defaults = list(spec.defaults or ())
+    nrequired = len(spec.args) - len(defaults)
+    required = spec.args[:nrequired]
+    options = list(zip(spec.args[nrequired:], defaults))
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        head = list(args[:nrequired])
+        for name in required[len(head):]:
+            if name not in kwargs:
+                raise TypeError("{func}() missing required argument "
+                                "'{name}'".format(func=func.__name__,
+                                                  name=name))
+            head.append(kwargs.pop(name))
+        head.extend(kwargs.pop(name, default) for name, default in options)
+        return func(*(head + list(args[nrequired:])), **kwargs)
+
+    if not PY2:
+        params = []
+        for param in inspect.signature(func).parameters.values():
+            if (param.kind == param.POSITIONAL_OR_KEYWORD and
+                    param.default is not param.empty):
+                param = param.replace(kind=param.KEYWORD_ONLY)
+            params.append(param)
+        params.sort(key=lambda param: param.kind)
+        wrapper.__signature__ = inspect.Signature(params)
+    return wrapper
+
 # Substitution and Appender are derived from matplotlib.docstring (1.1.0)
 # module http://matplotlib.org/users/license.html
 